@@ -330,12 +330,12 @@ class BaseCacheClient(CacheClient):
         elif isinstance(value, bytes):
             value_type = ValueType.BYTES
 
-        # Create cache entry
-        return CacheEntry(
-            key=key,
-            value_type=value_type,
-            value=value,
-        )
+        # Values come from our own cache, so skip model validation
+        return CacheEntry.from_trusted({
+            "key": key,
+            "value_type": value_type,
+            "value": value,
+        })
 
     async def increment(self, key: str, amount: int = 1) -> Optional[int]:
         """
@@ -549,12 +549,13 @@ class PostgresCacheClient(BaseCacheClient):
             elif isinstance(value, bytes):
                 value_type = ValueType.BYTES
 
-            return CacheEntry(
-                key=key,
-                value_type=value_type,
-                value=value,
-                expires_at=row["expires_at"],
-            )
+            # Rows were written by this client, so skip model validation
+            return CacheEntry.from_trusted({
+                "key": key,
+                "value_type": value_type,
+                "value": value,
+                "expires_at": row["expires_at"],
+            })
 
         except Exception as e:
             logger.error("PostgreSQL cache get_entry failed", key=key, error=str(e))
@@ -614,9 +615,9 @@ class PostgresCacheClient(BaseCacheClient):
             try:
                 return json.dumps(value).encode("utf-8")
             except (TypeError, ValueError):
-                return pickle.dumps(value)
+                return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
 
-        return pickle.dumps(value)
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
 
     async def _deserialize(self, data: bytes) -> Any:
         """
@@ -20,6 +20,7 @@ from pydantic import (
     AnyHttpUrl,
     BaseModel,
     Field,
+    PrivateAttr,
     SecretStr,
     field_validator,
     model_validator,
@@ -126,6 +127,11 @@ class EmbeddingConfig(BaseModel):
     # Image embedding dimensions (e.g., CLIP defaults to 512)
     image_embedding_dimensions: int = 512
     batch_size: int = 8
+    # Maximum tokens sent to the model per text; longer inputs are truncated.
+    # None disables truncation.
+    max_input_tokens: Optional[int] = 8191
+    # Optional embedding quantization ("int8"); None keeps float32
+    quantization: Optional[str] = None
     max_retries: int = 3
     timeout_seconds: int = 30
 
@@ -133,6 +139,14 @@ class EmbeddingConfig(BaseModel):
     local_model_path: Optional[Path] = None
     use_gpu: bool = False
 
+    @field_validator("quantization")
+    @classmethod
+    def validate_quantization(cls, v: Optional[str]) -> Optional[str]:
+        """Validate the quantization mode."""
+        if v is not None and v != "int8":
+            raise ValueError("quantization must be 'int8' or unset")
+        return v
+
     @model_validator(mode='after')
     def validate_model_config(self) -> 'EmbeddingConfig':
         """Validate that required credentials are provided for the chosen model type."""
@@ -189,6 +203,7 @@ class SchedulerConfig(BaseModel):
     timezone: str = "UTC"
     coalesce: bool = True
     misfire_grace_time: int = 60  # seconds
+    shutdown_grace_seconds: int = 30  # time allowed for in-flight jobs on shutdown
 
 
 class MetricsConfig(BaseModel):
@@ -300,10 +315,16 @@ class Settings(BaseSettings):
 
     # Runtime settings
     max_concurrent_tasks: int = 10
+    # Worker processes for HTML parsing; None uses os.cpu_count(), 0 disables
+    # the process pool and parses on the thread pool instead.
+    parse_processes: Optional[int] = None
     request_timeout_seconds: int = 30
     backoff_max_retries: int = 5
     backoff_max_time: int = 60  # seconds
 
+    # Name -> position in feeds backing get_feed_by_name; checked on every hit
+    _feed_positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -342,10 +363,23 @@ class Settings(BaseSettings):
 
     def get_feed_by_name(self, name: str) -> Optional[FeedConfig]:
         """Get a feed configuration by name."""
-        for feed in self.feeds:
-            if feed.name == name:
-                return feed
-        return None
+        # The feed list can be reassigned or edited in place, so the index is
+        # only a hint: a hit is checked against the list, and any mismatch or
+        # miss rebuilds the index before giving up.
+        position = self._feed_positions.get(name)
+        if position is None or position >= len(self.feeds) or self.feeds[position].name != name:
+            self._rebuild_indices()
+            position = self._feed_positions.get(name)
+            if position is None:
+                return None
+        return self.feeds[position]
+
+    def _rebuild_indices(self) -> None:
+        """Rebuild lookup indices derived from the feed list."""
+        self._feed_positions = {}
+        for position, feed in enumerate(self.feeds):
+            # The first feed with a name wins, as in a linear scan
+            self._feed_positions.setdefault(feed.name, position)
 
 
 def load_settings() -> Settings:
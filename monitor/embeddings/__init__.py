@@ -14,20 +14,47 @@ import asyncio
 import base64
 import hashlib
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Type, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple, Type, Union
 
+import httpx
 import numpy as np
 import structlog
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
 
 from monitor.config import EmbeddingConfig, EmbeddingModelType
 
 # Set up structured logger
 logger = structlog.get_logger()
 
+# HTTP status codes worth retrying: rate limiting and server-side failures
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether an embedding backend error is worth retrying.
+
+    Network failures, timeouts, rate limiting and 5xx responses are
+    transient; other errors (e.g. 400 Bad Request) are not.
+
+    Args:
+        exc: Exception raised by an embedding call
+
+    Returns:
+        bool: True if the call should be retried
+    """
+    if isinstance(exc, (httpx.TransportError, TimeoutError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in TRANSIENT_STATUS_CODES
+    # SDK errors (e.g. openai.APIStatusError) expose the status code directly
+    return getattr(exc, "status_code", None) in TRANSIENT_STATUS_CODES
+
 
 class EmbeddingClient(Protocol):
     """Protocol defining the interface for embedding clients."""
@@ -80,6 +107,10 @@ class EmbeddingClient(Protocol):
         """
         ...
 
+    async def load_tokenizer(self) -> None:
+        """Load the tokenizer used to bound input length ahead of time."""
+        ...
+
     async def close(self) -> None:
         """Close the embedding client and release resources."""
         ...
@@ -110,7 +141,13 @@ class BaseEmbeddingClient(ABC):
         """
         self.config = config
         self.batch_size = config.batch_size
+        self.max_input_tokens = config.max_input_tokens
+        # Backoff between retries of transient embedding failures
+        self.retry_wait = wait_exponential(multiplier=1, max=10)
         self._closed = False
+        self._tokenizer: Optional[Any] = None
+        self._tokenizer_resolved = False
+        self._tokenizer_lock = threading.Lock()
 
     async def __aenter__(self) -> "BaseEmbeddingClient":
         """Enter the async context manager."""
@@ -154,15 +191,123 @@ class BaseEmbeddingClient(ABC):
         if not texts:
             return []
 
+        # Bound each input by the model's token budget
+        texts = list(await asyncio.gather(*(self._truncate_text_async(text) for text in texts)))
+
         # Process in batches
         results = []
         for i in range(0, len(texts), self.batch_size):
             batch = texts[i:i + self.batch_size]
-            batch_results = await self._embed_text_batch(batch)
+            batch_results = await self._with_retry(self._embed_text_batch, batch)
             results.extend(batch_results)
 
         return results
 
+    async def _with_retry(
+        self,
+        embed_batch: Callable[[List[Any]], Awaitable[List[List[float]]]],
+        batch: List[Any],
+    ) -> List[List[float]]:
+        """
+        Call a batch embedding method, retrying transient failures.
+
+        Args:
+            embed_batch: Batch embedding coroutine function
+            batch: Batch of inputs to pass to it
+
+        Returns:
+            List[List[float]]: List of embedding vectors
+        """
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.config.max_retries + 1),
+            wait=self.retry_wait,
+            retry=retry_if_exception(is_transient_error),
+            reraise=True,
+        ):
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    logger.warning(
+                        "Retrying embedding batch",
+                        attempt=attempt.retry_state.attempt_number,
+                        count=len(batch),
+                    )
+                return await embed_batch(batch)
+        # With reraise=True the loop either returns or raises the last error
+        raise AssertionError("unreachable")
+
+    async def load_tokenizer(self) -> None:
+        """Load the tokenizer ahead of time, off the event loop."""
+        await asyncio.to_thread(self._get_tokenizer)
+
+    async def _truncate_text_async(self, text: str) -> str:
+        """Truncate text, tokenizing long inputs on a worker thread."""
+        if not self._may_exceed_token_budget(text):
+            return text
+        # tiktoken releases the GIL, so long texts tokenize in parallel
+        return await asyncio.to_thread(self.truncate_text, text)
+
+    def _may_exceed_token_budget(self, text: str) -> bool:
+        """Cheap check for whether text could exceed max_input_tokens."""
+        if not self.max_input_tokens:
+            return False
+        # A token is never shorter than one UTF-8 byte (at most 4 per char)
+        return len(text) * 4 > self.max_input_tokens
+
+    def truncate_text(self, text: str) -> str:
+        """
+        Truncate text to the configured maximum number of input tokens.
+
+        Uses the model's tiktoken encoding when tiktoken is installed, and
+        falls back to an approximation of four characters per token.
+
+        Args:
+            text: Text to truncate
+
+        Returns:
+            str: Text that fits within max_input_tokens
+        """
+        max_tokens = self.max_input_tokens
+        if not max_tokens or not self._may_exceed_token_budget(text):
+            return text
+
+        tokenizer = self._get_tokenizer()
+        if tokenizer is None:
+            return text[:max_tokens * 4]
+
+        token_ids = tokenizer.encode(text, disallowed_special=())
+        if len(token_ids) <= max_tokens:
+            return text
+        truncated: str = tokenizer.decode(token_ids[:max_tokens])
+        return truncated
+
+    def _get_tokenizer(self) -> Optional[Any]:
+        """
+        Get the tiktoken encoding for the text model, if available.
+
+        Returns:
+            Optional[Any]: tiktoken Encoding, or None if tiktoken is unavailable
+        """
+        if self._tokenizer_resolved:
+            return self._tokenizer
+
+        with self._tokenizer_lock:
+            if not self._tokenizer_resolved:
+                try:
+                    import tiktoken
+
+                    try:
+                        self._tokenizer = tiktoken.encoding_for_model(self.config.text_model_name)
+                    except KeyError:
+                        # Not an OpenAI model; cl100k_base is a close approximation
+                        self._tokenizer = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    logger.debug(
+                        "tiktoken unavailable, approximating token counts",
+                        error=str(e),
+                    )
+                self._tokenizer_resolved = True
+        return self._tokenizer
+
     @abstractmethod
     async def _embed_text_batch(self, texts: List[str]) -> List[List[float]]:
         """
@@ -213,7 +358,7 @@ class BaseEmbeddingClient(ABC):
         results = []
         for i in range(0, len(image_paths), self.batch_size):
             batch = image_paths[i:i + self.batch_size]
-            batch_results = await self._embed_image_batch(batch)
+            batch_results = await self._with_retry(self._embed_image_batch, batch)
             results.extend(batch_results)
 
         return results
@@ -546,4 +691,5 @@ __all__ = [
     "OpenAIEmbeddingClient",
     "HuggingFaceEmbeddingClient",
     "get_embedding_client",
+    "is_transient_error",
 ]
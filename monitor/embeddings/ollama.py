@@ -12,7 +12,6 @@ from typing import List, Optional
 
 import httpx
 import structlog
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from monitor.config import EmbeddingConfig
 from monitor.embeddings import BaseEmbeddingClient
@@ -111,16 +110,11 @@ class OllamaEmbeddingClient(BaseEmbeddingClient):
 
         return results
 
-    @retry(
-        wait=wait_exponential(min=0.5, max=10),
-        stop=stop_after_attempt(5),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-    )
     async def _embed_one(self, text: str) -> List[float]:
         """
         Generate embedding for a single text.
         
-        This method includes retry logic for transient failures.
+        Transient failures are retried per batch by BaseEmbeddingClient.
         
         Args:
             text: Text to embed
@@ -7,46 +7,43 @@ It uses readability-lxml for main content extraction and BeautifulSoup for
 additional parsing and cleaning.
 """
 import asyncio
-import datetime
+import codecs
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import httpx
+import soupsieve
 import structlog
-from bs4 import BeautifulSoup, Comment, NavigableString
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
 from dateutil import parser as date_parser
 from readability import Document
 
+from monitor.extractor.metadata import (
+    HTML_PARSER,
+    extract_author,
+    extract_open_graph,
+    extract_publish_date,
+    extract_tags,
+    extract_twitter_card,
+)
 from monitor.models.article import ArticleContent
 from monitor.models.content_type import ContentType
 
 # Set up structured logger
 logger = structlog.get_logger()
 
-# Common patterns for date extraction
-DATE_PATTERNS = [
-    r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',  # YYYY-MM-DD or YYYY/MM/DD
-    r'(\d{1,2}[-/]\d{1,2}[-/]\d{4})',  # DD-MM-YYYY or DD/MM/YYYY
-    r'(\w+ \d{1,2}, \d{4})',           # Month DD, YYYY
-    r'(\d{1,2} \w+ \d{4})',            # DD Month YYYY
-]
-
-# Common patterns for author extraction
-AUTHOR_PATTERNS = [
-    r'author[:\s]+([^<>\n]+)',
-    r'by[:\s]+([^<>\n]+)',
-    r'written by[:\s]+([^<>\n]+)',
-]
-
 # HTML elements to remove during cleaning
 NOISE_ELEMENTS = [
     'script', 'style', 'iframe', 'form', 'button', 'input', 'nav', 'footer',
     'header', 'aside', 'noscript', 'figcaption', 'figure', 'time', 'svg',
 ]
 
+# Line breaks emitted for block elements when flattening text
+_TEXT_BREAKS = {'br': '\n', 'p': '\n', 'h1': '\n\n', 'h2': '\n\n', 'h3': '\n\n'}
+
 # CSS selectors for common article containers
 ARTICLE_SELECTORS = [
     'article', 'main', '.post', '.article', '.entry', '.content', '.post-content',
@@ -54,14 +51,38 @@ ARTICLE_SELECTORS = [
     '#content', '#main', '#post', '#article',
 ]
 
+# Byte order marks checked before any declared charset, longest first
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# How far into a document to look for a <meta charset> declaration
+_CHARSET_SNIFF_BYTES = 1024
+
+# Patterns and selectors are compiled once at import rather than per page
+_CHARSET_RE = re.compile(rb'charset=["\']?([\w\-]+)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+_BACKGROUND_IMAGE_RE = re.compile(r'background-image')
+_BACKGROUND_URL_RE = re.compile(r'background-image:\s*url\([\'"]?([^\'"]+)[\'"]?\)')
+
+_ARTICLE_SELECTORS = [soupsieve.compile(selector) for selector in ARTICLE_SELECTORS]
+_SUMMARY_SELECTORS = [
+    soupsieve.compile(selector)
+    for selector in ['.summary', '.excerpt', '.description', '.intro', '.lead']
+]
+
 
 async def extract_article_content(
     url: str,
     cache_client: Any,
     thread_pool: ThreadPoolExecutor,
-    html_content: Optional[str] = None,
+    html_content: Optional[Union[str, bytes]] = None,
     use_cache: bool = True,
     cache_ttl: int = 86400,  # 1 day
+    process_pool: Optional[Executor] = None,
 ) -> ArticleContent:
     """
     Extract article content from a URL or HTML content.
@@ -74,9 +95,12 @@ async def extract_article_content(
         url: URL of the article
         cache_client: Cache client for storing/retrieving content
         thread_pool: Thread pool for CPU-bound operations
-        html_content: Optional HTML content (if already fetched)
+        html_content: Optional HTML content, as text or raw bytes (if already
+            fetched)
         use_cache: Whether to use cached content if available
         cache_ttl: Cache TTL in seconds
+        process_pool: Optional process pool used for HTML parsing instead
+            of the thread pool
         
     Returns:
         ArticleContent: Extracted article content
@@ -108,7 +132,10 @@ async def extract_article_content(
                     type=type(cached_content),
                 )
 
-    # Fetch HTML content if not provided
+    # Fetch HTML content if not provided. The raw bytes are handed to the
+    # parse worker and decoded there, so a process pool receives them as-is
+    # rather than paying for a decode here and a re-encode when pickling.
+    encoding = None
     if not html_content:
         try:
             async with httpx.AsyncClient() as client:
@@ -118,7 +145,8 @@ async def extract_article_content(
                     timeout=30.0,
                 )
                 response.raise_for_status()
-                html_content = response.text
+                html_content = response.content
+                encoding = response.charset_encoding
         except Exception as e:
             logger.error("Error fetching article content", url=url, error=str(e))
             raise ValueError(f"Failed to fetch article content: {str(e)}")
@@ -126,41 +154,21 @@ async def extract_article_content(
     if not html_content:
         raise ValueError("Empty HTML content")
 
-    # Extract content using readability (CPU-bound, run in thread pool)
+    # Parse the document off the event loop. HTML parsing is CPU-bound and
+    # holds the GIL, so prefer the process pool when one is available.
     loop = asyncio.get_running_loop()
     try:
-        document = await loop.run_in_executor(
-            thread_pool,
-            lambda: Document(html_content)
-        )
-
-        # Extract title and content
-        title = document.title()
-        content_html = document.summary()
-
-        # Extract metadata
-        metadata = await extract_article_metadata(
+        title, content_html, clean_text, image_urls, metadata = await loop.run_in_executor(
+            process_pool or thread_pool,
+            _parse_html,
             html_content,
             str(url),
-            title,
-            thread_pool
-        )
-
-        # Clean and normalize content
-        clean_text = await loop.run_in_executor(
-            thread_pool,
-            lambda: clean_article_text(content_html)
+            encoding,
         )
 
         # Calculate word count
         word_count = len(clean_text.split())
 
-        # Extract image URLs
-        image_urls = await loop.run_in_executor(
-            thread_pool,
-            lambda: extract_image_urls(content_html, url)
-        )
-
         # Create ArticleContent object
         article = ArticleContent(
             url=url,
@@ -197,6 +205,76 @@ async def extract_article_content(
         raise ValueError(f"Failed to extract article content: {str(e)}")
 
 
+def _decode_html(content: Union[str, bytes], encoding: Optional[str] = None) -> str:
+    """
+    Decode fetched page bytes to text.
+
+    A byte order mark wins over everything else, then the encoding from the
+    response headers, then a ``charset=`` declaration near the top of the
+    document, falling back to UTF-8.
+
+    Args:
+        content: Raw page bytes, or text that is returned unchanged
+        encoding: Optional encoding declared by the server
+
+    Returns:
+        str: Decoded HTML
+    """
+    if isinstance(content, str):
+        return content
+
+    for bom, codec in _BOMS:
+        if content.startswith(bom):
+            return content.decode(codec, errors='replace')
+
+    if encoding is None:
+        match = _CHARSET_RE.search(content, 0, _CHARSET_SNIFF_BYTES)
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+def _parse_html(
+    html_content: Union[str, bytes],
+    url: str,
+    encoding: Optional[str] = None,
+) -> Tuple[str, str, str, List[str], Dict[str, Any]]:
+    """
+    Parse article HTML into its title, main content, text, images and metadata.
+
+    This runs all CPU-bound parsing in a single call so it can be dispatched
+    to a thread or process pool; it is module-level so that it can be pickled.
+
+    Args:
+        html_content: HTML content, either text or the raw fetched bytes
+        url: URL of the article
+        encoding: Optional encoding declared for raw bytes
+
+    Returns:
+        Tuple[str, str, str, List[str], Dict[str, Any]]: Title, main content
+        HTML, clean text, image URLs and metadata
+    """
+    html_content = _decode_html(html_content, encoding)
+    document = Document(html_content)
+
+    # Extract title and content
+    title = document.title()
+    content_html = document.summary()
+
+    metadata = extract_metadata_sync(html_content, url, title)
+
+    # Parse the main content once; images are collected before cleaning
+    # strips noise elements such as figures from the tree
+    content_soup = BeautifulSoup(content_html, HTML_PARSER)
+    image_urls = _image_urls_from_soup(content_soup, url)
+    clean_text = _clean_soup_text(content_soup)
+
+    return title, content_html, clean_text, image_urls, metadata
+
+
 async def extract_main_content(
     html_content: str,
     thread_pool: ThreadPoolExecutor,
@@ -236,7 +314,7 @@ async def extract_main_content(
             )
 
             # Try to extract title with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
             title = soup.title.string if soup.title else "Unknown Title"
 
             return title, content
@@ -258,23 +336,19 @@ def extract_content_with_soup(html_content: str) -> str:
     Returns:
         str: Extracted content HTML
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    # Remove noise elements
-    for element in NOISE_ELEMENTS:
-        for node in soup.find_all(element):
-            node.decompose()
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    _remove_noise(soup)
 
     # Remove comments
-    for comment in soup.find_all(text=lambda text: isinstance(text, Comment)):
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
         comment.extract()
 
     # Try to find the main content container
     content = None
 
     # Try common article selectors
-    for selector in ARTICLE_SELECTORS:
-        content = soup.select_one(selector)
+    for selector in _ARTICLE_SELECTORS:
+        content = selector.select_one(soup)
         if content and len(content.get_text(strip=True)) > 200:
             break
 
@@ -289,6 +363,14 @@ def extract_content_with_soup(html_content: str) -> str:
     return str(content)
 
 
+def _remove_noise(soup: BeautifulSoup) -> None:
+    """Decompose all noise elements in a single walk of the tree."""
+    for node in soup.find_all(NOISE_ELEMENTS):
+        # Nested noise goes with its decomposed ancestor
+        if not node.decomposed:
+            node.decompose()
+
+
 def clean_article_text(html_content: str) -> str:
     """
     Clean and normalize article text from HTML content.
@@ -302,37 +384,32 @@ def clean_article_text(html_content: str) -> str:
     Returns:
         str: Clean, normalized text
     """
-    # Parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
+    return _clean_soup_text(BeautifulSoup(html_content, HTML_PARSER))
 
-    # Remove noise elements
-    for element in NOISE_ELEMENTS:
-        for node in soup.find_all(element):
-            node.decompose()
 
-    # Remove comments
-    for comment in soup.find_all(text=lambda text: isinstance(text, Comment)):
-        comment.extract()
+def _clean_soup_text(soup: BeautifulSoup) -> str:
+    """Strip noise from an already parsed document and return its clean text."""
+    _remove_noise(soup)
 
-    # Extract text with proper whitespace handling
+    # Extract text with proper whitespace handling, skipping comments in the
+    # same walk rather than removing them in a separate pass
     text_parts = []
 
     for element in soup.descendants:
-        if isinstance(element, NavigableString) and element.strip():
-            text_parts.append(element.strip())
-        elif element.name == 'br' or element.name == 'p':
-            text_parts.append('\n')
-        elif element.name == 'h1' or element.name == 'h2' or element.name == 'h3':
-            text_parts.append('\n\n')
+        if isinstance(element, NavigableString):
+            if not isinstance(element, Comment) and (text := element.strip()):
+                text_parts.append(text)
+        elif isinstance(element, Tag) and element.name in _TEXT_BREAKS:
+            text_parts.append(_TEXT_BREAKS[element.name])
 
     # Join text parts and normalize whitespace
     text = ' '.join(text_parts)
 
     # Replace multiple spaces with a single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
 
     # Replace multiple newlines with a maximum of two
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _MULTI_NEWLINE_RE.sub('\n\n', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -388,7 +465,7 @@ def extract_metadata_sync(html_content: str, url: str, title: str) -> Dict[str,
     }
 
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
 
         # Extract author
         author = extract_author(soup, html_content)
@@ -437,169 +514,6 @@ def extract_metadata_sync(html_content: str, url: str, title: str) -> Dict[str,
         return metadata
 
 
-def extract_author(soup: BeautifulSoup, html_content: str) -> Optional[str]:
-    """
-    Extract author information from HTML.
-    
-    Args:
-        soup: BeautifulSoup object
-        html_content: Raw HTML content
-        
-    Returns:
-        Optional[str]: Author name if found, None otherwise
-    """
-    # Try meta tags first
-    for meta in soup.find_all('meta'):
-        if meta.get('name') and meta.get('content'):
-            name = meta['name'].lower()
-            if name in ['author', 'dc.creator', 'article:author']:
-                return meta['content'].strip()
-
-    # Try Open Graph
-    og_author = soup.find('meta', property='og:author')
-    if og_author and og_author.get('content'):
-        return og_author['content'].strip()
-
-    # Try schema.org markup
-    author_elem = soup.find(['span', 'div', 'a'], itemprop='author')
-    if author_elem:
-        name_elem = author_elem.find(['span', 'div'], itemprop='name')
-        if name_elem:
-            return name_elem.get_text().strip()
-        return author_elem.get_text().strip()
-
-    # Try common author classes/IDs
-    for selector in ['.author', '.byline', '.meta-author', '#author', '[rel="author"]']:
-        author_elem = soup.select_one(selector)
-        if author_elem:
-            return author_elem.get_text().strip()
-
-    # Try regex patterns
-    for pattern in AUTHOR_PATTERNS:
-        match = re.search(pattern, html_content, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-
-    return None
-
-
-def extract_publish_date(soup: BeautifulSoup, html_content: str) -> Optional[datetime.datetime]:
-    """
-    Extract publication date from HTML.
-    
-    Args:
-        soup: BeautifulSoup object
-        html_content: Raw HTML content
-        
-    Returns:
-        Optional[datetime.datetime]: Publication date if found, None otherwise
-    """
-
-    # Try meta tags first
-    for meta in soup.find_all('meta'):
-        if meta.get('name') and meta.get('content'):
-            name = meta['name'].lower()
-            if name in ['date', 'pubdate', 'publishdate', 'dc.date', 'article:published_time']:
-                try:
-                    return date_parser.parse(meta['content'])
-                except Exception:
-                    pass
-
-    # Try Open Graph
-    og_date = soup.find('meta', property='og:published_time')
-    if og_date and og_date.get('content'):
-        try:
-            return date_parser.parse(og_date['content'])
-        except Exception:
-            pass
-
-    # Try schema.org markup
-    date_elem = soup.find(['span', 'div', 'time'], itemprop='datePublished')
-    if date_elem:
-        if date_elem.get('datetime'):
-            try:
-                return date_parser.parse(date_elem['datetime'])
-            except Exception:
-                pass
-        try:
-            return date_parser.parse(date_elem.get_text())
-        except Exception:
-            pass
-
-    # Try time elements
-    time_elem = soup.find('time')
-    if time_elem and time_elem.get('datetime'):
-        try:
-            return date_parser.parse(time_elem['datetime'])
-        except Exception:
-            pass
-
-    # Try common date classes
-    for selector in ['.date', '.published', '.post-date', '.entry-date', '.meta-date']:
-        date_elem = soup.select_one(selector)
-        if date_elem:
-            try:
-                return date_parser.parse(date_elem.get_text())
-            except Exception:
-                pass
-
-    # Try regex patterns
-    for pattern in DATE_PATTERNS:
-        match = re.search(pattern, html_content)
-        if match:
-            try:
-                return date_parser.parse(match.group(1))
-            except Exception:
-                pass
-
-    return None
-
-
-def extract_tags(soup: BeautifulSoup) -> List[str]:
-    """
-    Extract tags/keywords from HTML.
-    
-    Args:
-        soup: BeautifulSoup object
-        
-    Returns:
-        List[str]: List of tags
-    """
-    tags = []
-
-    # Try meta keywords
-    keywords = soup.find('meta', attrs={'name': 'keywords'})
-    if keywords and keywords.get('content'):
-        for keyword in keywords['content'].split(','):
-            if keyword.strip():
-                tags.append(keyword.strip())
-
-    # Try article:tag meta tags
-    for tag_meta in soup.find_all('meta', property='article:tag'):
-        if tag_meta.get('content'):
-            tags.append(tag_meta['content'].strip())
-
-    # Try common tag classes
-    for selector in ['.tags', '.categories', '.keywords', '.topics']:
-        tag_container = soup.select_one(selector)
-        if tag_container:
-            for tag_elem in tag_container.find_all(['a', 'span', 'li']):
-                tag_text = tag_elem.get_text().strip()
-                if tag_text and tag_text not in ['Tags:', 'Categories:', 'Keywords:']:
-                    tags.append(tag_text)
-
-    # Remove duplicates and normalize
-    normalized_tags = []
-    seen = set()
-    for tag in tags:
-        tag_lower = tag.lower()
-        if tag_lower not in seen and len(tag) > 1:
-            seen.add(tag_lower)
-            normalized_tags.append(tag)
-
-    return normalized_tags
-
-
 def extract_summary(soup: BeautifulSoup) -> Optional[str]:
     """
     Extract article summary/description from HTML.
@@ -631,58 +545,14 @@ def extract_summary(soup: BeautifulSoup) -> Optional[str]:
         return desc_elem.get_text().strip()
 
     # Try common summary classes
-    for selector in ['.summary', '.excerpt', '.description', '.intro', '.lead']:
-        summary_elem = soup.select_one(selector)
+    for selector in _SUMMARY_SELECTORS:
+        summary_elem = selector.select_one(soup)
         if summary_elem:
             return summary_elem.get_text().strip()
 
     return None
 
 
-def extract_open_graph(soup: BeautifulSoup) -> Dict[str, Any]:
-    """
-    Extract Open Graph metadata from HTML.
-    
-    Args:
-        soup: BeautifulSoup object
-        
-    Returns:
-        Dict[str, Any]: Open Graph metadata
-    """
-    og_metadata = {}
-
-    # Extract all Open Graph meta tags
-    for meta in soup.find_all('meta', property=re.compile(r'^og:')):
-        if meta.get('content'):
-            # Remove 'og:' prefix and use as key
-            key = meta['property'][3:]
-            og_metadata[f"og_{key}"] = meta['content'].strip()
-
-    return og_metadata
-
-
-def extract_twitter_card(soup: BeautifulSoup) -> Dict[str, Any]:
-    """
-    Extract Twitter Card metadata from HTML.
-    
-    Args:
-        soup: BeautifulSoup object
-        
-    Returns:
-        Dict[str, Any]: Twitter Card metadata
-    """
-    twitter_metadata = {}
-
-    # Extract all Twitter Card meta tags
-    for meta in soup.find_all('meta', attrs={'name': re.compile(r'^twitter:')}):
-        if meta.get('content'):
-            # Remove 'twitter:' prefix and use as key
-            key = meta['name'][8:]
-            twitter_metadata[f"twitter_{key}"] = meta['content'].strip()
-
-    return twitter_metadata
-
-
 def extract_jsonld(soup: BeautifulSoup) -> Dict[str, Any]:
     """
     Extract JSON-LD metadata from HTML.
@@ -769,7 +639,11 @@ def extract_image_urls(html_content: str, base_url: str) -> List[str]:
     Returns:
         List[str]: List of image URLs
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    return _image_urls_from_soup(BeautifulSoup(html_content, HTML_PARSER), base_url)
+
+
+def _image_urls_from_soup(soup: BeautifulSoup, base_url: str) -> List[str]:
+    """Collect image URLs from an already parsed document."""
     image_urls = []
 
     # Find all images
@@ -793,9 +667,9 @@ def extract_image_urls(html_content: str, base_url: str) -> List[str]:
             image_urls.append(src)
 
     # Find background images in style attributes
-    for element in soup.find_all(style=re.compile(r'background-image')):
-        style = element.get('style', '')
-        match = re.search(r'background-image:\s*url\([\'"]?([^\'"]+)[\'"]?\)', style)
+    for element in soup.find_all(style=_BACKGROUND_IMAGE_RE):
+        style = str(element.get('style', ''))
+        match = _BACKGROUND_URL_RE.search(style)
         if match:
             src = match.group(1)
             if not src.startswith(('http://', 'https://')):
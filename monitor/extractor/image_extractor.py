@@ -20,6 +20,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from monitor.extractor.metadata import HTML_PARSER
+
 # Set up structured logger
 logger = structlog.get_logger()
 
@@ -45,7 +47,7 @@ async def extract_images(
     logger.debug("Extracting images from HTML content")
 
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         images = []
 
         # Find all images
@@ -197,7 +199,7 @@ async def get_main_image(
     logger.debug("Finding main image")
 
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         main_image = None
 
         # Try Open Graph image first
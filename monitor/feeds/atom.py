@@ -172,6 +172,8 @@ class AtomFeedProcessor(FeedProcessor):
             # Try to extract additional data from the original entry
             if i < len(entries):
                 entry = entries[i]
+                # Posts are immutable; collect changes and apply them once
+                updates: Dict[str, Any] = {}
 
                 # Handle Atom-specific fields
 
@@ -179,7 +181,7 @@ class AtomFeedProcessor(FeedProcessor):
                 if 'published' in entry and not post.publish_date:
                     try:
                         published_date = date_parser.parse(entry['published'])
-                        post.publish_date = published_date
+                        updates['publish_date'] = published_date
                     except Exception as e:
                         logger.warning(
                             "Error parsing published date",
@@ -192,7 +194,7 @@ class AtomFeedProcessor(FeedProcessor):
                 if 'updated' in entry and not post.updated_date:
                     try:
                         updated_date = date_parser.parse(entry['updated'])
-                        post.updated_date = updated_date
+                        updates['updated_date'] = updated_date
                     except Exception as e:
                         logger.warning(
                             "Error parsing updated date",
@@ -205,9 +207,9 @@ class AtomFeedProcessor(FeedProcessor):
                 if 'author_detail' in entry and not post.author:
                     author_detail = entry['author_detail']
                     if 'name' in author_detail:
-                        post.author = author_detail['name']
+                        updates['author'] = author_detail['name']
                     elif 'email' in author_detail:
-                        post.author = author_detail['email']
+                        updates['author'] = author_detail['email']
 
                 # Extract content
                 if 'content' in entry:
@@ -221,7 +223,9 @@ class AtomFeedProcessor(FeedProcessor):
                                 text = clean_html(content_item['value'])
                                 if text:
                                     # Limit summary to 200 characters
-                                    post.summary = text[:197] + '...' if len(text) > 200 else text
+                                    updates['summary'] = (
+                                        text[:197] + '...' if len(text) > 200 else text
+                                    )
                             break
 
                 # Extract categories/tags
@@ -234,7 +238,10 @@ class AtomFeedProcessor(FeedProcessor):
                             tags.append(tag['label'].strip())
 
                     if tags:
-                        post.tags = list(set(post.tags + tags))
+                        updates['tags'] = post.tags + tags
+
+                if updates:
+                    posts[i] = post.with_updates(**updates)
 
         logger.debug(
             "Extracted blog posts from Atom feed",
@@ -9,17 +9,21 @@ The main entry point is the `process_feed_posts` function, which orchestrates
 the entire feed processing pipeline from discovery to post extraction.
 """
 import abc
+import asyncio
 import hashlib
+import html
 import re
 
 # New imports for full-content capture
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Protocol
 
-import bleach
 import httpx
+import nh3
 import structlog
+from dateutil import parser as date_parser
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -41,6 +45,41 @@ DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_CACHE_TTL = 3600  # 1 hour in seconds
 FEED_CACHE_PREFIX = "feed:"
 POST_CACHE_PREFIX = "post:"
+MAX_SUMMARY_LENGTH = 500
+# Raw summary markup kept for sanitizing; tags and entities shrink once stripped
+SUMMARY_RAW_HEADROOM = 4
+# Raw summaries beyond this are treated as hostile and flagged before any work
+MAX_RAW_SUMMARY_LENGTH = 1 << 20
+
+# Tag-stripping sanitizer for feed summaries, built once and shared by every entry
+SUMMARY_CLEANER = nh3.Cleaner(tags=set())
+# A start or end tag, capturing its name. Tags with quotes (a quoted attribute
+# value may contain '>') are left unmatched, as are comments, doctypes and a
+# bare '<', so a '<' surviving the split means the summary needs a parser.
+_SUMMARY_TAG_RE = re.compile(r"</?([A-Za-z][^\s/>]*)[^>\"']*>")
+# Openings of the blocks nh3 drops along with their content
+_SUMMARY_BLOCK_START_RE = re.compile(r"<!--|<(script|style)(?=[\s/>])", re.IGNORECASE)
+_SUMMARY_BLOCK_END_RES = {
+    name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in ("script", "style")
+}
+# Elements an HTML parser drops without touching the text around or inside
+# them. Others can hide, drop or reorder text (script, style, template,
+# textarea, tables, pre, ...), so summaries using them go through nh3.
+_SUMMARY_SIMPLE_TAGS = frozenset({
+    "a", "abbr", "article", "aside", "b", "bdi", "bdo", "big", "blockquote",
+    "br", "center", "cite", "code", "dd", "del", "dfn", "div", "dl", "dt", "em",
+    "figcaption", "figure", "font", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "i", "img", "ins", "kbd", "li", "main", "mark", "nav", "ol",
+    "p", "q", "s", "samp", "section", "small", "span", "strike", "strong", "sub",
+    "sup", "time", "tt", "u", "ul", "var", "wbr",
+})
+
+# Entry date fields in precedence order (later fields win)
+ENTRY_DATE_FIELDS = (
+    'published', 'pubDate', 'date', 'created', 'issued',
+    'updated', 'modified', 'lastModified',
+)
+ENTRY_UPDATED_FIELDS = frozenset({'updated', 'modified', 'lastModified'})
 
 
 class FeedProcessor(abc.ABC):
@@ -163,6 +202,10 @@ class BrowserPool(Protocol):
         """Render a page and take a screenshot."""
         ...
 
+    async def render(self, url: str) -> Any:
+        """Render a page once, returning its HTML and screenshot path."""
+        ...
+
 
 @retry(
     retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
@@ -350,20 +393,24 @@ async def discover_new_posts(
             # Limit number of posts to process
             posts = all_posts[:max_posts]
 
-            # Filter out posts that have already been processed
-            new_posts = []
+            # Filter out posts that have already been processed, checking the
+            # cache for all of them at once. Posts repeated within the feed
+            # only count once.
+            unique_posts: Dict[str, BlogPost] = {}
             for post in posts:
-                post_cache_key = f"{POST_CACHE_PREFIX}{post.id}"
-                exists = await cache_client.exists(post_cache_key)
-
-                if not exists:
-                    new_posts.append(post)
-                    # Cache post ID to avoid reprocessing
-                    await cache_client.set(
-                        post_cache_key,
-                        "1",
-                        ttl=DEFAULT_CACHE_TTL * 24 * 7,  # 1 week
-                    )
+                unique_posts.setdefault(post.id, post)
+            post_cache_keys = [f"{POST_CACHE_PREFIX}{post_id}" for post_id in unique_posts]
+            seen = await asyncio.gather(*map(cache_client.exists, post_cache_keys))
+            new_posts = [
+                post for post, exists in zip(unique_posts.values(), seen, strict=True) if not exists
+            ]
+
+            # Cache post IDs to avoid reprocessing
+            await asyncio.gather(*(
+                cache_client.set(key, "1", ttl=DEFAULT_CACHE_TTL * 24 * 7)  # 1 week
+                for key, exists in zip(post_cache_keys, seen, strict=True)
+                if not exists
+            ))
 
             # Update feed fingerprint in cache
             await cache_client.set(
@@ -407,6 +454,79 @@ async def discover_new_posts(
             return []
 
 
+def _strip_summary_blocks(summary: str) -> str:
+    """
+    Remove complete comments and script/style elements from a raw summary.
+
+    Runs on the whole summary before it is cut down for sanitizing, so a
+    large leading block cannot use up the headroom and hide the text after
+    it. Stops at the first block that is never closed; that one is left for
+    the sanitizer to drop. Each character is scanned at most twice.
+
+    Args:
+        summary: Raw summary HTML
+
+    Returns:
+        str: The summary without its complete comment/script/style blocks
+    """
+    pieces = []
+    pos = 0
+    while match := _SUMMARY_BLOCK_START_RE.search(summary, pos):
+        name = match.group(1)
+        if name:
+            end_match = _SUMMARY_BLOCK_END_RES[name.lower()].search(summary, match.end())
+            end = end_match.end() if end_match else -1
+        else:
+            # Start inside "<!--" so that "<!-->" and "<!--->" close at once
+            end = summary.find("-->", match.start() + 2)
+            end = end + 3 if end != -1 else -1
+        if end == -1:
+            break
+        pieces.append(summary[pos:match.start()])
+        pos = end
+    if not pieces:
+        return summary
+    pieces.append(summary[pos:])
+    return "".join(pieces)
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_summary(summary: str) -> str:
+    """
+    Strip all markup from a feed summary.
+
+    Summaries made of plain text and simple tags are stripped with a regex,
+    with the remaining text re-escaped the way nh3 serializes it. Anything a
+    regex cannot strip the way an HTML parser would (quoted attributes, a
+    bare '<', comments, or elements such as script/style whose content a
+    parser treats specially) goes through the nh3 cleaner instead. Results
+    are memoized since feeds are re-polled and repeat boilerplate summaries.
+
+    Args:
+        summary: Raw summary HTML
+
+    Returns:
+        str: Summary text with no tags left in it
+    """
+    # Parsers drop NULs; they are also used below to mark where tags were
+    if "\x00" in summary:
+        return SUMMARY_CLEANER.clean(summary)
+    # Parsers normalize newlines before tokenizing
+    text = summary.replace("\r\n", "\n").replace("\r", "\n")
+    # Text segments alternate with the captured tag names
+    parts = _SUMMARY_TAG_RE.split(text)
+    if not _SUMMARY_SIMPLE_TAGS.issuperset(map(str.lower, parts[1::2])):
+        return SUMMARY_CLEANER.clean(summary)
+    # Character references end where a tag starts, so keep a marker there
+    text = "\x00".join(parts[::2])
+    if "<" in text:
+        return SUMMARY_CLEANER.clean(summary)
+    if "&" in text:
+        text = html.unescape(text)
+    text = text.replace("\x00", "")
+    return html.escape(text, quote=False).replace("\xa0", "&nbsp;")
+
+
 async def parse_feed_entries(
     entries: List[Dict[str, Any]],
     feed_name: str,
@@ -416,7 +536,9 @@ async def parse_feed_entries(
     Parse feed entries into BlogPost objects.
     
     This is a helper function for feed processors to convert raw feed entries
-    into structured BlogPost objects.
+    into structured BlogPost objects. Parsing (date parsing and summary
+    sanitizing) is CPU-bound, so it runs in a worker thread to keep the event
+    loop free for the other feeds being processed.
     
     Args:
         entries: List of feed entries as dictionaries
@@ -426,117 +548,161 @@ async def parse_feed_entries(
     Returns:
         List[BlogPost]: List of blog posts
     """
-    posts = []
+    if not entries:
+        return []
+    return await asyncio.to_thread(
+        parse_feed_entries_sync, entries, feed_name, feed_url
+    )
 
-    for entry in entries:
-        try:
-            # Extract basic fields
-            title = entry.get('title', '').strip()
-            url = entry.get('link') or entry.get('url')
-
-            # Skip entries without title or URL
-            if not title or not url:
-                continue
-
-            # Generate a unique ID
-            entry_id = entry.get('id') or entry.get('guid') or url
-            post_id = hashlib.sha256(f"{feed_name}:{entry_id}".encode()).hexdigest()
-
-            # Parse dates
-            publish_date = None
-            updated_date = None
-
-            # Try different date fields
-            date_fields = [
-                'published', 'pubDate', 'date', 'created', 'issued',
-                'updated', 'modified', 'lastModified',
-            ]
 
-            for field in date_fields:
-                if field in entry:
-                    try:
-                        # Parse date string to datetime
-                        date_str = entry[field]
-                        if isinstance(date_str, (int, float)):
-                            # Unix timestamp
-                            dt = datetime.fromtimestamp(date_str, tz=timezone.utc)
-                        else:
-                            # Various date formats
-                            from dateutil import parser
-                            dt = parser.parse(date_str)
-                            if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-
-                        if field in ['updated', 'modified', 'lastModified']:
-                            updated_date = dt
-                        else:
-                            publish_date = dt
-                    except Exception:
-                        continue
-
-            # Extract author
-            author = entry.get('author') or entry.get('creator') or entry.get('dc:creator')
-            if isinstance(author, dict):
-                author = author.get('name')
-
-            # Extract summary/description
-            summary = entry.get('summary') or entry.get('description') or entry.get('content')
-            if isinstance(summary, dict):
-                summary = summary.get('value') or summary.get('text')
-
-            # Clean up HTML in summary
-            if summary and '<' in summary:
-                try:
-                    # Use bleach to sanitize and strip tags
-                    summary = bleach.clean(summary, tags=[], strip=True)
-                except Exception:
-                    # Fallback if bleach fails (unlikely)
-                    summary = re.sub(r'<[^>]+>', '', summary)
-
-            # Limit summary length
-            if summary and len(summary) > 500:
-                summary = summary[:497] + '...'
-
-            # Extract tags/categories
-            tags = []
-            categories = entry.get('categories') or entry.get('tags') or []
-            if isinstance(categories, list):
-                for category in categories:
-                    if isinstance(category, dict):
-                        tag = category.get('term') or category.get('label')
-                    else:
-                        tag = category
-                    if tag and isinstance(tag, str):
-                        tags.append(tag.strip())
+def parse_feed_entries_sync(
+    entries: List[Dict[str, Any]],
+    feed_name: str,
+    feed_url: str,
+) -> List[BlogPost]:
+    """
+    Synchronous core of `parse_feed_entries`.
 
-            # Create BlogPost object
-            post = BlogPost(
-                id=post_id,
-                url=url,
-                title=title,
-                source=feed_name,
-                author=author,
-                publish_date=publish_date,
-                updated_date=updated_date,
-                summary=summary,
-                tags=tags,
-                metadata={
-                    'feed_url': feed_url,
-                    'original_id': entry_id,
-                }
-            )
+    Args:
+        entries: List of feed entries as dictionaries
+        feed_name: Name of the feed
+        feed_url: URL of the feed
+
+    Returns:
+        List[BlogPost]: List of blog posts
+    """
+    parsed = (_parse_feed_entry(entry, feed_name, feed_url) for entry in entries)
+    return [post for post in parsed if post is not None]
 
-            posts.append(post)
 
-        except Exception as e:
+def _parse_feed_entry(
+    entry: Dict[str, Any],
+    feed_name: str,
+    feed_url: str,
+) -> Optional[BlogPost]:
+    """
+    Parse a single feed entry into a BlogPost.
+
+    Args:
+        entry: Feed entry as a dictionary
+        feed_name: Name of the feed
+        feed_url: URL of the feed
+
+    Returns:
+        Optional[BlogPost]: The blog post, or None if the entry is unusable
+    """
+    try:
+        # Extract basic fields
+        title = entry.get('title', '').strip()
+        url = entry.get('link') or entry.get('url')
+
+        # Skip entries without title or URL
+        if not title or not url:
+            return None
+
+        # Generate a unique ID
+        entry_id = entry.get('id') or entry.get('guid') or url
+        post_id = hashlib.sha256(f"{feed_name}:{entry_id}".encode()).hexdigest()
+
+        # Parse dates
+        publish_date = None
+        updated_date = None
+
+        # Try different date fields
+        for field in ENTRY_DATE_FIELDS:
+            if field in entry:
+                try:
+                    # Parse date string to datetime
+                    date_str = entry[field]
+                    if isinstance(date_str, (int, float)):
+                        # Unix timestamp
+                        dt = datetime.fromtimestamp(date_str, tz=timezone.utc)
+                    else:
+                        # Various date formats
+                        dt = date_parser.parse(date_str)
+                        if dt.tzinfo is None:
+                            dt = dt.replace(tzinfo=timezone.utc)
+
+                    if field in ENTRY_UPDATED_FIELDS:
+                        updated_date = dt
+                    else:
+                        publish_date = dt
+                except Exception:
+                    continue
+
+        # Extract author
+        author = entry.get('author') or entry.get('creator') or entry.get('dc:creator')
+        if isinstance(author, dict):
+            author = author.get('name')
+
+        # Extract summary/description
+        summary = entry.get('summary') or entry.get('description') or entry.get('content')
+        if isinstance(summary, dict):
+            summary = summary.get('value') or summary.get('text')
+        if summary and len(summary) > MAX_RAW_SUMMARY_LENGTH:
             logger.warning(
-                "Error parsing feed entry",
+                "Oversized feed entry summary truncated",
                 feed_name=feed_name,
-                error=str(e),
-                entry=entry,
+                url=url,
+                length=len(summary),
+            )
+            summary = summary[:MAX_SUMMARY_LENGTH * SUMMARY_RAW_HEADROOM]
+        if isinstance(summary, bytes):
+            # Undecoded payloads are decoded once, after the size cap
+            summary = summary.decode('utf-8', errors='replace')
+
+        # Clean up HTML in summary. Most summaries are plain text, and a
+        # string without '<' has no tags to strip, so only pay for the
+        # parse when there is markup.
+        if summary and '<' in summary:
+            # Strip every tag along with <script>/<style> bodies. Only the
+            # head survives truncation, so don't parse the rest, but drop
+            # whole blocks first so they don't crowd the text out of it.
+            summary = _sanitize_summary(
+                _strip_summary_blocks(summary)[:MAX_SUMMARY_LENGTH * SUMMARY_RAW_HEADROOM]
             )
 
-    return posts
+        # Limit summary length
+        if summary and len(summary) > MAX_SUMMARY_LENGTH:
+            summary = summary[:MAX_SUMMARY_LENGTH - 3] + '...'
+
+        # Extract tags/categories
+        tags = []
+        categories = entry.get('categories') or entry.get('tags') or []
+        if isinstance(categories, list):
+            for category in categories:
+                if isinstance(category, dict):
+                    tag = category.get('term') or category.get('label')
+                else:
+                    tag = category
+                if tag and isinstance(tag, str):
+                    tags.append(tag.strip())
+
+        # Create BlogPost object
+        return BlogPost(
+            id=post_id,
+            url=url,
+            title=title,
+            source=feed_name,
+            author=author,
+            publish_date=publish_date,
+            updated_date=updated_date,
+            summary=summary,
+            tags=tags,
+            metadata={
+                'feed_url': feed_url,
+                'original_id': entry_id,
+            }
+        )
+
+    except Exception as e:
+        logger.warning(
+            "Error parsing feed entry",
+            feed_name=feed_name,
+            error=str(e),
+            entry=entry,
+        )
+        return None
 
 
 async def process_feed_posts(
@@ -639,15 +805,17 @@ async def process_individual_article(
 
     screenshot_path: Optional[str] = None
     try:
-        # 1. Render & screenshot
-        screenshot_path = await browser_pool.render_and_screenshot(str(post.url))
+        # 1. Render once for both the HTML and the screenshot
+        rendered = await browser_pool.render(str(post.url))
+        screenshot_path = rendered.screenshot_path
 
-        # 2. Extract clean content (cpu-bound → thread pool)
+        # 2. Extract clean content from the rendered HTML (cpu-bound → thread pool)
         with ThreadPoolExecutor(max_workers=2, thread_name_prefix="extractor") as pool:
             article_content = await extract_article_content(
                 str(post.url),
                 cache_client,
                 pool,
+                html_content=rendered.html,
             )
 
         # 3. Attach to post metadata
@@ -657,7 +825,7 @@ async def process_individual_article(
         post.metadata["article_screenshot"] = screenshot_path
         post.metadata["article_processed_at"] = datetime.now(timezone.utc).isoformat()
 
-        logger.info("Full article captured", url=post.url, words=article_content.word_count)
+        logger.debug("Full article captured", url=post.url, words=article_content.word_count)
         return post
 
     except Exception as exc:
@@ -195,7 +195,7 @@ class RSSFeedProcessor(FeedProcessor):
 
                 # Update post tags
                 if tags:
-                    post.tags = list(set(post.tags + tags))
+                    post = posts[i] = post.with_updates(tags=post.tags + tags)
 
                 # Extract full content if available
                 if 'content' in entry and entry['content']:
@@ -11,12 +11,19 @@ The main components are:
 - Browser pool for headless browser automation via Playwright
 - Screenshot capture and page rendering
 """
-from monitor.fetcher.browser import BrowserContext, BrowserPool, render_page, take_screenshot
+from monitor.fetcher.browser import (
+    BrowserContext,
+    BrowserPool,
+    RenderResult,
+    render_page,
+    take_screenshot,
+)
 from monitor.fetcher.http_client import AsyncHTTPClient, fetch_url, fetch_with_retry
 
 __all__ = [
     "BrowserPool",
     "BrowserContext",
+    "RenderResult",
     "render_page",
     "take_screenshot",
     "AsyncHTTPClient",
@@ -9,6 +9,7 @@ manager interface for efficient browser usage.
 import asyncio
 import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
@@ -30,6 +31,15 @@ from monitor.config import BrowserConfig
 logger = structlog.get_logger()
 
 
+@dataclass
+class RenderResult:
+    """Outcome of rendering a page once: its HTML and a screenshot."""
+    html: str
+    screenshot_path: str
+    final_url: str
+    title: str
+
+
 class BrowserContext:
     """
     Represents a browser context for rendering pages.
@@ -476,7 +486,7 @@ class BrowserPool:
 
         return str(path)
 
-    async def render_and_screenshot(
+    async def render(
         self,
         url: str,
         screenshot_path: Optional[Union[str, Path]] = None,
@@ -484,12 +494,9 @@ class BrowserPool:
         timeout: Optional[float] = None,
         full_page: Optional[bool] = None,
         format: Optional[str] = None,
-    ) -> str:
+    ) -> "RenderResult":
         """
-        Render a page and take a screenshot.
-        
-        This is a convenience method that combines rendering a page and
-        taking a screenshot in a single operation.
+        Render a page once and capture both its HTML and a screenshot.
         
         Args:
             url: URL to render
@@ -500,7 +507,7 @@ class BrowserPool:
             format: Screenshot format
             
         Returns:
-            str: Path to the saved screenshot
+            RenderResult: Rendered HTML, screenshot path and page details
         """
         try:
             page, page_info = await self.render_page(url, wait_until, timeout)
@@ -512,8 +519,9 @@ class BrowserPool:
                     full_page,
                     format,
                 )
+                html = await page.content()
 
-                logger.info(
+                logger.debug(
                     "Rendered page and took screenshot",
                     url=url,
                     title=page_info["title"],
@@ -521,7 +529,12 @@ class BrowserPool:
                     screenshot_path=screenshot_path,
                 )
 
-                return screenshot_path
+                return RenderResult(
+                    html=html,
+                    screenshot_path=screenshot_path,
+                    final_url=page_info["url"],
+                    title=page_info["title"],
+                )
 
             finally:
                 # Find the context that owns this page
@@ -538,6 +551,37 @@ class BrowserPool:
             )
             raise
 
+    async def render_and_screenshot(
+        self,
+        url: str,
+        screenshot_path: Optional[Union[str, Path]] = None,
+        wait_until: Optional[str] = None,
+        timeout: Optional[float] = None,
+        full_page: Optional[bool] = None,
+        format: Optional[str] = None,
+    ) -> str:
+        """
+        Render a page and take a screenshot.
+
+        This is a convenience wrapper around render() for callers that only
+        need the screenshot.
+
+        Args:
+            url: URL to render
+            screenshot_path: Path to save the screenshot
+            wait_until: When to consider the page loaded
+            timeout: Page load timeout in seconds
+            full_page: Whether to take a full-page screenshot
+            format: Screenshot format
+
+        Returns:
+            str: Path to the saved screenshot
+        """
+        result = await self.render(
+            url, screenshot_path, wait_until, timeout, full_page, format
+        )
+        return result.screenshot_path
+
 
 async def render_page(
     url: str,
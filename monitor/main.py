@@ -9,19 +9,31 @@ the lifecycle of the application including graceful shutdown.
 import argparse
 import asyncio
 import logging
+import multiprocessing
+import os
 import signal
 import sys
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import AsyncExitStack, asynccontextmanager
-from typing import Optional, Set
-
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import orjson
 import structlog
+from apscheduler.jobstores.base import BaseJobStore
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from prometheus_client import start_http_server
 
 from monitor.config import LogLevel, Settings, load_settings
+from monitor.extractor.article_parser import extract_article_content
+from monitor.feeds.base import process_feed_posts, process_individual_article
 from monitor.i18n import _
+from monitor.models import EmbeddingRecord
+from monitor.models.article import hash_text
 
 # Set up structured logger
 logger = structlog.get_logger()
@@ -33,18 +45,36 @@ class AppContext:
     
     This class manages the lifecycle of all components and provides access
     to them throughout the application.
+
+    Args:
+        settings: Application settings
+        start_scheduler: Whether to start the job scheduler. One-time runs
+            process the feeds directly and leave persisted jobs alone.
+        persist_jobs: Whether to use the configured job store. When False
+            (e.g. the feed list was narrowed with --feed) jobs are kept in
+            memory so the persistent store is neither run nor pruned.
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        start_scheduler: bool = True,
+        persist_jobs: bool = True,
+    ):
         self.settings = settings
+        self.start_scheduler = start_scheduler
+        self.persist_jobs = persist_jobs
         self.exit_stack = AsyncExitStack()
         self.scheduler: Optional[AsyncIOScheduler] = None
         self.thread_pool: Optional[ThreadPoolExecutor] = None
-        self.browser_pool = None  # Will be initialized later
-        self.cache_client = None  # Will be initialized later
-        self.embedding_client = None  # Will be initialized later
-        self.vector_db_client = None  # Will be initialized later
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        self.browser_pool: Any = None  # Will be initialized later
+        self.cache_client: Any = None  # Will be initialized later
+        self.embedding_client: Any = None  # Will be initialized later
+        self.vector_db_client: Any = None  # Will be initialized later
         self.shutdown_event = asyncio.Event()
+        # Feed jobs currently running; awaited on shutdown
         self.active_tasks: Set[asyncio.Task] = set()
 
     async def initialize(self) -> None:
@@ -56,25 +86,73 @@ class AppContext:
             max_workers=self.settings.max_concurrent_tasks,
             thread_name_prefix="monitor-worker"
         )
+        # Route run_in_executor(None, ...) and asyncio.to_thread through the
+        # same pool instead of letting the loop create a second one.
+        asyncio.get_running_loop().set_default_executor(self.thread_pool)
+
+        # Set up process pool for GIL-bound HTML parsing. Worker processes
+        # are spawned rather than forked so they never inherit loop or
+        # thread state, and are only created from the main process.
+        parse_processes = self.settings.parse_processes
+        if parse_processes is None:
+            parse_processes = os.cpu_count() or 1
+        if parse_processes > 0 and multiprocessing.parent_process() is None:
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=parse_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
 
-        # Initialize components
-        await self._init_cache()
-        await self._init_browser_pool()
-        await self._init_embedding_client()
-        await self._init_vector_db()
+        await self._init_components()
 
         # Set up scheduler
-        await self._init_scheduler()
+        if self.start_scheduler:
+            await self._init_scheduler()
 
         logger.info("Application context initialized")
 
+    async def _init_components(self) -> None:
+        """
+        Initialize the independent components concurrently.
+
+        If one of them fails, the TaskGroup cancels the others; whatever was
+        already entered is unwound before the error propagates.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._init_cache())
+                tg.create_task(self._init_browser_pool())
+                tg.create_task(self._init_embedding_client())
+                tg.create_task(self._init_vector_db())
+        except BaseException:
+            await self.exit_stack.aclose()
+            raise
+
+    async def _enter_context(self, resource: Any) -> None:
+        """
+        Enter a component's async context and register its cleanup.
+
+        The cleanup is pushed onto the exit stack as soon as __aenter__
+        returns. If entering is interrupted part-way (e.g. cancelled because a
+        sibling failed to initialize), the component never reaches the stack,
+        so it is closed here instead.
+
+        Args:
+            resource: Component implementing the async context manager protocol
+        """
+        try:
+            await resource.__aenter__()
+        except BaseException:
+            await resource.__aexit__(*sys.exc_info())
+            raise
+        self.exit_stack.push_async_exit(resource)
+
     async def _init_cache(self) -> None:
         """Initialize the cache client."""
         from monitor.cache import get_cache_client
 
         logger.info("Initializing cache client")
         self.cache_client = await get_cache_client(self.settings.cache, self.settings.vector_db)
-        await self.exit_stack.enter_async_context(self.cache_client)
+        await self._enter_context(self.cache_client)
         logger.info("Cache client initialized", type=type(self.cache_client).__name__)
 
     async def _init_browser_pool(self) -> None:
@@ -83,7 +161,7 @@ class AppContext:
 
         logger.info("Initializing browser pool")
         self.browser_pool = BrowserPool(self.settings.browser)
-        await self.exit_stack.enter_async_context(self.browser_pool)
+        await self._enter_context(self.browser_pool)
         logger.info("Browser pool initialized",
                     max_browsers=self.settings.browser.max_concurrent_browsers)
 
@@ -93,7 +171,9 @@ class AppContext:
 
         logger.info("Initializing embedding client")
         self.embedding_client = await get_embedding_client(self.settings.embedding)
-        await self.exit_stack.enter_async_context(self.embedding_client)
+        await self._enter_context(self.embedding_client)
+        # Load the tokenizer once now rather than on the first post
+        await self.embedding_client.load_tokenizer()
         logger.info("Embedding client initialized",
                     text_model=self.settings.embedding.text_model_name,
                     image_model=self.settings.embedding.image_model_name)
@@ -104,7 +184,7 @@ class AppContext:
 
         logger.info("Initializing vector database client")
         self.vector_db_client = await get_vector_db_client(self.settings.vector_db)
-        await self.exit_stack.enter_async_context(self.vector_db_client)
+        await self._enter_context(self.vector_db_client)
         logger.info("Vector database client initialized",
                     type=self.settings.vector_db.db_type.value,
                     collection=self.settings.vector_db.collection_name)
@@ -114,7 +194,7 @@ class AppContext:
         logger.info("Initializing job scheduler")
 
         # Set up job stores
-        jobstores = {"default": MemoryJobStore()}
+        jobstores = {"default": self._create_job_store()}
 
         # Create scheduler (use default AsyncIO executor)
         self.scheduler = AsyncIOScheduler(
@@ -131,18 +211,44 @@ class AppContext:
         # (monitor.scheduler expects `scheduler.app_context` to be present).
         self.scheduler.app_context = self
 
+        # Start paused so that jobs persisted by a previous run are visible
+        # while (re)scheduling, then resume once the job list is in sync.
+        self.scheduler.start(paused=True)
+
         # Schedule jobs
         self._schedule_jobs()
 
-        # Start scheduler
-        self.scheduler.start()
+        self.scheduler.resume()
         logger.info("Job scheduler initialized and started")
 
+    def _create_job_store(self) -> BaseJobStore:
+        """Create the default job store according to the scheduler settings."""
+        scheduler_config = self.settings.scheduler
+
+        if self.persist_jobs and scheduler_config.job_store_type == "sqlalchemy":
+            # Import here to avoid the SQLAlchemy dependency if not used
+            try:
+                from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+            except ImportError as exc:
+                raise ImportError(
+                    "SQLAlchemy is required for the sqlalchemy job store. "
+                    "Install it with 'pip install sqlalchemy'."
+                ) from exc
+
+            url = scheduler_config.job_store_url or (
+                f"sqlite:///{self.settings.data_dir / 'jobs.sqlite'}"
+            )
+            logger.info("Using persistent job store", url=url.split("@")[-1])
+            return SQLAlchemyJobStore(url=url)
+
+        return MemoryJobStore()
+
     def _schedule_jobs(self) -> None:
         """Schedule all monitoring jobs."""
-        from monitor.scheduler import schedule_feed_jobs
+        from monitor.scheduler import prune_stale_feed_jobs, schedule_feed_jobs
 
         schedule_feed_jobs(self.scheduler, self.settings.feeds)
+        prune_stale_feed_jobs(self.scheduler, self.settings.feeds)
 
         logger.info("Scheduled feed monitoring jobs",
                     feed_count=len(self.settings.feeds))
@@ -154,38 +260,58 @@ class AppContext:
         # Signal shutdown to all tasks
         self.shutdown_event.set()
 
-        # Cancel all active tasks
-        if self.active_tasks:
-            logger.info("Cancelling active tasks", count=len(self.active_tasks))
+        # Shutdown scheduler so that no new feed jobs start
+        if self.scheduler and self.scheduler.running:
+            logger.info("Shutting down scheduler")
+            self.scheduler.shutdown(wait=False)
+
+        # Give in-flight feed jobs a chance to finish their writes before
+        # the clients they use are closed, then cancel the stragglers. A second
+        # signal cancels this wait; the cleanup below must still run then.
+        try:
+            if self.active_tasks:
+                grace = self.settings.scheduler.shutdown_grace_seconds
+                logger.info("Waiting for in-flight feed jobs",
+                            count=len(self.active_tasks),
+                            grace_seconds=grace)
+                _, pending = await asyncio.wait(self.active_tasks, timeout=grace)
+                if pending:
+                    logger.warning("Cancelling feed jobs after grace period", count=len(pending))
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
             for task in self.active_tasks:
                 if not task.done():
                     task.cancel()
 
-            # Wait for tasks to complete cancellation
-            await asyncio.gather(*self.active_tasks, return_exceptions=True)
-
-        # Shutdown scheduler
-        if self.scheduler and self.scheduler.running:
-            logger.info("Shutting down scheduler")
-            self.scheduler.shutdown(wait=False)
+            # Close all components using the exit stack
+            logger.info("Closing all components")
+            await self.exit_stack.aclose()
 
-        # Close all components using the exit stack
-        logger.info("Closing all components")
-        await self.exit_stack.aclose()
+            # Shutdown thread pool
+            if self.thread_pool:
+                logger.info("Shutting down thread pool")
+                self.thread_pool.shutdown(wait=True, cancel_futures=True)
 
-        # Shutdown thread pool
-        if self.thread_pool:
-            logger.info("Shutting down thread pool")
-            self.thread_pool.shutdown(wait=True, cancel_futures=True)
+            # Shutdown process pool
+            if self.process_pool:
+                logger.info("Shutting down process pool")
+                self.process_pool.shutdown(wait=True, cancel_futures=True)
 
         logger.info("Application shutdown complete")
 
-    def create_task(self, coro) -> asyncio.Task:
-        """Create a tracked asyncio task."""
-        task = asyncio.create_task(coro)
-        self.active_tasks.add(task)
-        task.add_done_callback(self.active_tasks.discard)
-        return task
+
+@dataclass
+class PostMetrics:
+    """Per-feed processing counters, logged once when the feed completes."""
+    successes: int = 0
+    failures: int = 0
+    skipped: int = 0
+    bytes_extracted: int = 0
+    extract_ms: float = 0.0
+    embed_ms: float = 0.0
+    upsert_ms: float = 0.0
 
 
 async def process_feed(app_context: AppContext, feed_name: str) -> None:
@@ -195,17 +321,29 @@ async def process_feed(app_context: AppContext, feed_name: str) -> None:
     This is the main job function that will be called by the scheduler.
     It handles the entire pipeline from fetching to embedding and storage.
     """
-    from monitor.feeds.base import process_feed_posts
+    log = logger.bind(feed_name=feed_name)
+    log.info("Processing feed")
 
-    logger.info("Processing feed", feed_name=feed_name)
+    # Track this job so that shutdown can wait for it to finish
+    task = asyncio.current_task()
+    if task is not None:
+        app_context.active_tasks.add(task)
+    try:
+        await _process_feed(app_context, feed_name, log)
+    finally:
+        app_context.active_tasks.discard(task)
+
+
+async def _process_feed(app_context: AppContext, feed_name: str, log: Any) -> None:
+    """Run the feed processing pipeline for process_feed."""
     feed_config = app_context.settings.get_feed_by_name(feed_name)
 
     if not feed_config:
-        logger.error("Feed configuration not found", feed_name=feed_name)
+        log.error("Feed configuration not found")
         return
 
     if not feed_config.enabled:
-        logger.info("Feed is disabled, skipping", feed_name=feed_name)
+        log.info("Feed is disabled, skipping")
         return
 
     try:
@@ -218,144 +356,301 @@ async def process_feed(app_context: AppContext, feed_name: str) -> None:
         )
 
         if not new_posts:
-            logger.info("No new posts found", feed_name=feed_name)
+            log.info("No new posts found")
             return
 
-        logger.info("Found new posts", feed_name=feed_name, count=len(new_posts))
-
-        # ------------------------------------------------------------------
-        # Optional full-article capture (text, screenshots, etc.)
-        # ------------------------------------------------------------------
-        if app_context.settings.article_processing.full_content_capture:
-            from monitor.feeds.base import process_individual_article
-
-            conc = app_context.settings.article_processing.concurrent_article_tasks
-            sem_capture = asyncio.Semaphore(conc)
-
-            async def _capture(post):
-                async with sem_capture:
-                    return await process_individual_article(
-                        post,
-                        app_context.cache_client,
-                        app_context.browser_pool,
-                    )
-
-            # Capture articles concurrently (bounded by semaphore)
-            new_posts = await asyncio.gather(*[_capture(p) for p in new_posts])
-            logger.info(
-                "Full article capture complete",
-                feed_name=feed_name,
-                processed=len(new_posts),
-            )
+        log.info("Found new posts", count=len(new_posts))
+
+        # Pipeline: (capture ->) extract -> embed -> upsert, connected by
+        # bounded queues so that a slow render does not hold up posts that
+        # are ready to embed.
+        conc = min(app_context.settings.max_concurrent_tasks, len(new_posts))
+
+        # Optional full-article capture (text, screenshots, etc.) runs per
+        # post inside the extract stage, so a post moves on as soon as its
+        # own capture finishes. The extract workers already bound it to
+        # `conc` at a time; a semaphore is only needed for a lower limit.
+        capture = app_context.settings.article_processing.full_content_capture
+        capture_limit = app_context.settings.article_processing.concurrent_article_tasks
+        capture_semaphore = (
+            asyncio.Semaphore(capture_limit) if capture and capture_limit < conc else None
+        )
+
+        async def _capture(post: Any) -> Any:
+            async with capture_semaphore or nullcontext():
+                return await process_individual_article(
+                    post,
+                    app_context.cache_client,
+                    app_context.browser_pool,
+                )
 
-        # Process each post in parallel with a semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(app_context.settings.max_concurrent_tasks)
-        tasks = []
+        batch_size = app_context.settings.embedding.batch_size
+        post_queue: asyncio.Queue = asyncio.Queue()
+        extracted_queue: asyncio.Queue = asyncio.Queue(maxsize=conc)
+        record_queue: asyncio.Queue = asyncio.Queue(maxsize=conc)
+
+        metrics = PostMetrics()
+        # Content hashes of extracted posts, recorded once they are stored
+        content_hashes: Dict[str, str] = {}
 
         for post in new_posts:
-            task = app_context.create_task(
-                process_post(app_context, post, semaphore)
-            )
-            tasks.append(task)
+            post_queue.put_nowait(post)
+
+        async def _extract_worker() -> None:
+            while not post_queue.empty():
+                post = post_queue.get_nowait()
+                # Contain failures so that one post cannot cancel the whole group
+                try:
+                    started = time.perf_counter()
+                    if capture:
+                        post = await _capture(post)
+                    item = await extract_post(app_context, post)
+                    metrics.extract_ms += (time.perf_counter() - started) * 1000
+                    metrics.bytes_extracted += len(item[1].text)
+                    # Feeds re-emit posts with cosmetic changes; skip the
+                    # embedding and upsert when the text itself is unchanged
+                    if app_context.cache_client is not None:
+                        text_hash = hash_text(item[1].text)
+                        cache_key = f"contenthash:{post.id}"
+                        if await app_context.cache_client.get(cache_key) == text_hash:
+                            metrics.skipped += 1
+                            log.debug("Post content unchanged, skipped", post_url=post.url)
+                            continue
+                        content_hashes[post.id] = text_hash
+                    await extracted_queue.put(item)
+                except Exception as e:
+                    metrics.failures += 1
+                    log.error("Error processing post", post_url=post.url, error=str(e))
+            # Signal that this extractor is done
+            await extracted_queue.put(None)
+
+        async def _embed_worker() -> None:
+            running_extractors = conc
+            while running_extractors:
+                # Block for the first item, then drain whatever else is ready
+                # to form a batch
+                batch = []
+                item = await extracted_queue.get()
+                while True:
+                    if item is None:
+                        running_extractors -= 1
+                    else:
+                        batch.append(item)
+                    if len(batch) >= batch_size or extracted_queue.empty():
+                        break
+                    item = extracted_queue.get_nowait()
+
+                if batch:
+                    try:
+                        started = time.perf_counter()
+                        records = await embed_posts(app_context, batch)
+                        metrics.embed_ms += (time.perf_counter() - started) * 1000
+                        await record_queue.put(records)
+                    except Exception as e:
+                        metrics.failures += len(batch)
+                        log.error("Error embedding posts", count=len(batch), error=str(e))
+            await record_queue.put(None)
+
+        async def _upsert_worker() -> None:
+            while (records := await record_queue.get()) is not None:
+                try:
+                    started = time.perf_counter()
+                    stored = await app_context.vector_db_client.upsert_batch(records)
+                    metrics.upsert_ms += (time.perf_counter() - started) * 1000
+                    if not stored:
+                        # Leave the content hashes unset so the posts are retried next run
+                        for record in records:
+                            content_hashes.pop(record.id, None)
+                        metrics.failures += len(records)
+                        log.error("Error storing posts", count=len(records))
+                        continue
+                    metrics.successes += len(records)
+                    log.debug("Posts stored", count=len(records))
+                    if app_context.cache_client is not None:
+                        for record in records:
+                            if record.id in content_hashes:
+                                await app_context.cache_client.set(
+                                    f"contenthash:{record.id}", content_hashes.pop(record.id)
+                                )
+                except Exception as e:
+                    for record in records:
+                        content_hashes.pop(record.id, None)
+                    metrics.failures += len(records)
+                    log.error("Error storing posts", count=len(records), error=str(e))
+
+        # Cancelling the feed job cascades to every stage in the group
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(conc):
+                tg.create_task(_extract_worker())
+            tg.create_task(_embed_worker())
+            tg.create_task(_upsert_worker())
+
+        log.info("Feed processing complete", **asdict(metrics))
+
+    except Exception as e:
+        log.exception("Error processing feed", error=str(e))
 
-        if tasks:
-            # Wait for all post processing tasks to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Check for exceptions
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error("Error processing post",
-                                feed_name=feed_name,
-                                post_url=new_posts[i].url,
-                                error=str(result))
+async def extract_post(app_context: AppContext, post) -> Tuple[Any, Any, Optional[Path]]:
+    """
+    Render a single post and extract its article content.
 
-        logger.info("Feed processing complete", feed_name=feed_name)
+    This is the per-post stage of the pipeline; embedding and storage are
+    deferred to later stages so they can be batched across the feed.
 
-    except Exception as e:
-        logger.exception("Error processing feed",
-                        feed_name=feed_name,
-                        error=str(e))
+    Args:
+        app_context: Application context
+        post: Blog post to process
+
+    Returns:
+        Tuple[Any, Any, Optional[Path]]: The post, its extracted content and
+        the screenshot path (if one was taken)
+    """
+    logger.debug("Processing post", url=post.url, title=post.title)
+
+    # Render page once with the browser for both HTML and screenshot
+    rendered = await app_context.browser_pool.render(post.url)
+
+    # Extract article content from the rendered HTML
+    content = await extract_article_content(
+        post.url,
+        app_context.cache_client,
+        app_context.thread_pool,
+        html_content=rendered.html,
+        process_pool=app_context.process_pool,
+    )
 
+    return post, content, Path(rendered.screenshot_path)
 
-async def process_post(app_context: AppContext, post, semaphore: asyncio.Semaphore) -> None:
+
+async def embed_posts(
+    app_context: AppContext,
+    items: List[Tuple[Any, Any, Optional[Path]]],
+) -> List[Any]:
     """
-    Process a single post through the entire pipeline.
+    Generate embedding records for a batch of extracted posts.
     
-    This function handles:
-    1. Rendering the page with a headless browser
-    2. Extracting text and images
-    3. Generating embeddings
-    4. Storing in the vector database
+    Text (and image) embeddings are generated with a single batched call per
+    modality, with the two modalities running concurrently.
+
+    Args:
+        app_context: Application context
+        items: (post, content, screenshot_path) tuples from extract_post
+
+    Returns:
+        List[EmbeddingRecord]: Records ready to be stored
     """
-    from monitor.extractor.article_parser import extract_article_content
-    from monitor.models import EmbeddingRecord
+    async def _embed_images() -> List[Optional[List[float]]]:
+        # Generate image embeddings in one batch if available
+        image_embeddings: List[Optional[List[float]]] = [None] * len(items)
+        if app_context.settings.embedding.image_model_name:
+            image_indices = [i for i, (_, _, path) in enumerate(items) if path]
+            if image_indices:
+                embedded = await app_context.embedding_client.embed_images(
+                    [str(items[i][2]) for i in image_indices]
+                )
+                for i, embedding in zip(image_indices, embedded, strict=True):
+                    image_embeddings[i] = embedding
+        return image_embeddings
+
+    # Text and image embeddings are independent, so generate both batches
+    # concurrently
+    text_embeddings, image_embeddings = await asyncio.gather(
+        app_context.embedding_client.embed_texts([content.text for _, content, _ in items]),
+        _embed_images(),
+    )
 
-    async with semaphore:
-        logger.info("Processing post", url=post.url, title=post.title)
+    # Posts and content are validated models, but the vectors come back from
+    # a remote backend. Check them once as whole matrices; if they pass, skip
+    # re-validating every field (and rescanning every vector) per record.
+    text_matrix = _embedding_matrix(text_embeddings)
+    image_indices = [i for i, embedding in enumerate(image_embeddings) if embedding is not None]
+    image_matrix = _embedding_matrix([image_embeddings[i] for i in image_indices])
+    trusted = False
+    if text_matrix is not None and len(text_matrix) == len(items) and image_matrix is not None:
+        trusted = True
+        text_embeddings = list(text_matrix)
+        for row, i in enumerate(image_indices):
+            image_embeddings[i] = image_matrix[row]
+
+    # Create embedding records
+    fields = [
+        {
+            "id": post.id,
+            "url": post.url,
+            "title": post.title,
+            "publish_date": post.publish_date,
+            "text_embedding": text_embedding,
+            "image_embedding": image_embedding,
+            "metadata": {
+                "source": post.source,
+                "author": content.author,
+                "summary": content.summary,
+                "screenshot_path": str(screenshot_path) if screenshot_path else None,
+                "word_count": content.word_count,
+                "tags": content.tags
+            }
+        }
+        for (post, content, screenshot_path), text_embedding, image_embedding
+        in zip(items, text_embeddings, image_embeddings, strict=True)
+    ]
+    if trusted:
+        records = [EmbeddingRecord.from_trusted(data) for data in fields]
+    else:
+        # The validating constructor reports which vector is bad
+        records = [EmbeddingRecord(**data) for data in fields]
 
-        try:
-            # Render page with browser
-            screenshot_path = await app_context.browser_pool.render_and_screenshot(post.url)
-
-            # Extract article content
-            content = await extract_article_content(
-                post.url,
-                app_context.cache_client,
-                app_context.thread_pool
-            )
+    # Quantize for storage and transport if configured
+    quantization = app_context.settings.embedding.quantization
+    if quantization:
+        records = [record.quantize(quantization) for record in records]
 
-            # Generate embeddings
-            text_embedding = await app_context.embedding_client.embed_text(content.text)
-
-            # Generate image embedding if available
-            image_embedding = None
-            if screenshot_path and app_context.settings.embedding.image_model_name:
-                image_embedding = await app_context.embedding_client.embed_image(screenshot_path)
-
-            # Create embedding record
-            record = EmbeddingRecord(
-                id=post.id,
-                url=post.url,
-                title=post.title,
-                publish_date=post.publish_date,
-                text_embedding=text_embedding,
-                image_embedding=image_embedding,
-                metadata={
-                    "source": post.source,
-                    "author": content.author,
-                    "summary": content.summary,
-                    "screenshot_path": str(screenshot_path) if screenshot_path else None,
-                    "word_count": content.word_count,
-                    "tags": content.tags
-                }
-            )
+    return records
 
-            # Store in vector database
-            await app_context.vector_db_client.upsert(record)
 
-            logger.info("Post processed successfully",
-                        url=post.url,
-                        title=post.title)
+def _embedding_matrix(vectors: List[Any]) -> Optional[np.ndarray]:
+    """
+    Stack a batch of embeddings, checking them all in one vectorized pass.
 
-            return record
+    Args:
+        vectors: Embedding vectors from the embedding client
 
-        except Exception as e:
-            logger.exception("Error processing post",
-                            url=post.url,
-                            error=str(e))
-            raise
+    Returns:
+        Optional[np.ndarray]: (N, d) float32 matrix, or None unless every vector
+        is non-empty, finite and of the same dimension
+    """
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    try:
+        matrix = np.asarray(vectors, dtype=np.float32)
+    except (TypeError, ValueError):
+        return None
+    if matrix.ndim != 2 or matrix.shape[1] == 0 or not np.isfinite(matrix).all():
+        return None
+    return matrix
 
 
 @asynccontextmanager
-async def app_lifecycle(settings: Settings):
+async def app_lifecycle(
+    settings: Settings,
+    *,
+    start_scheduler: bool = True,
+    persist_jobs: bool = True,
+) -> AsyncIterator[AppContext]:
     """
     Context manager for the application lifecycle.
     
     This handles initialization and graceful shutdown of all components.
+
+    Args:
+        settings: Application settings
+        start_scheduler: Whether to start the job scheduler
+        persist_jobs: Whether to use the configured job store
     """
     # Create app context
-    app_context = AppContext(settings)
+    app_context = AppContext(
+        settings, start_scheduler=start_scheduler, persist_jobs=persist_jobs
+    )
 
     try:
         # Initialize all components
@@ -378,40 +673,55 @@ async def app_lifecycle(settings: Settings):
 def setup_logging(settings: Settings) -> None:
     """Set up structured logging based on configuration."""
     log_level = settings.metrics.log_level.value
+    numeric_level = getattr(logging, log_level, logging.INFO)
 
-    # Configure structlog
+    # Configure structlog. The filtering bound logger drops calls below the
+    # configured level before any processor runs.
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if settings.metrics.structured_logging
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+            if settings.metrics.structured_logging
             else structlog.dev.ConsoleRenderer()
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         cache_logger_on_first_use=True,
     )
 
     # Set log level on the standard library root logger so that
     # libraries using logging propagate correctly.
-    numeric_level = getattr(logging, log_level, logging.INFO)
     logging.getLogger().setLevel(numeric_level)
 
     logger.info("Logging initialized", level=log_level)
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, returning str for stdlib logging."""
+    return orjson.dumps(obj, default=kwargs.get("default")).decode("utf-8")
+
+
 def setup_signal_handlers(loop: asyncio.AbstractEventLoop, app_context: AppContext) -> None:
-    """Set up signal handlers for graceful shutdown."""
+    """
+    Set up signal handlers for graceful shutdown.
+
+    The first signal requests a graceful shutdown; a second one cancels the
+    main task to force it.
+    """
+    main_task = asyncio.current_task()
+
     # Define signal handler
     def signal_handler():
-        logger.info("Received shutdown signal")
         if not app_context.shutdown_event.is_set():
-            # Stop the event loop
-            loop.stop()
+            logger.info("Received shutdown signal")
+            app_context.shutdown_event.set()
+        elif main_task is not None:
+            logger.warning("Received second shutdown signal, forcing shutdown")
+            main_task.cancel()
 
     # Register signal handlers
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -420,11 +730,17 @@ def setup_signal_handlers(loop: asyncio.AbstractEventLoop, app_context: AppConte
     logger.info("Signal handlers registered")
 
 
-async def run_daemon(settings: Settings) -> None:
-    """Run the application as a daemon that continues until stopped."""
+async def run_daemon(settings: Settings, persist_jobs: bool = True) -> None:
+    """
+    Run the application as a daemon that continues until stopped.
+
+    Args:
+        settings: Application settings
+        persist_jobs: Whether to use the configured (possibly persistent) job store
+    """
     logger.info("Starting technical blog monitor daemon")
 
-    async with app_lifecycle(settings) as app_context:
+    async with app_lifecycle(settings, persist_jobs=persist_jobs) as app_context:
         # Get the event loop
         loop = asyncio.get_running_loop()
 
@@ -450,18 +766,15 @@ async def run_once(settings: Settings) -> None:
     """Run a single iteration of the monitoring process and exit."""
     logger.info("Running technical blog monitor once")
 
-    async with app_lifecycle(settings) as app_context:
+    # The feeds are processed directly below; starting the scheduler would
+    # also resume jobs persisted by the daemon and run them a second time
+    async with app_lifecycle(settings, start_scheduler=False) as app_context:
         try:
             # Process each feed once
-            tasks = []
-            for feed in settings.feeds:
-                if feed.enabled:
-                    task = app_context.create_task(process_feed(app_context, feed.name))
-                    tasks.append(task)
-
-            if tasks:
-                # Wait for all feed processing tasks to complete
-                await asyncio.gather(*tasks)
+            async with asyncio.TaskGroup() as tg:
+                for feed in settings.feeds:
+                    if feed.enabled:
+                        tg.create_task(process_feed(app_context, feed.name))
 
             logger.info("One-time run completed successfully")
 
@@ -504,6 +817,22 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def get_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Get the event loop factory to run the application with.
+
+    Returns:
+        Optional[Callable[[], asyncio.AbstractEventLoop]]: uvloop's loop
+        factory if uvloop is installed, otherwise None to use the default
+        asyncio event loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> int:
     """Main entry point for the application."""
     try:
@@ -537,10 +866,13 @@ def main() -> int:
             settings.feeds = [feed]
 
         # Run the appropriate mode
-        if args.once:
-            asyncio.run(run_once(settings))
-        else:
-            asyncio.run(run_daemon(settings))
+        with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+            if args.once:
+                runner.run(run_once(settings))
+            else:
+                # A narrowed feed list must not touch the persisted jobs of
+                # the other feeds
+                runner.run(run_daemon(settings, persist_jobs=not args.feed))
 
         return 0
 
@@ -7,13 +7,53 @@ for working with extracted article content throughout the monitoring pipeline.
 import hashlib
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
-
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from functools import cached_property, lru_cache, partial
+from typing import Any, Dict, List, Mapping, Optional
+from urllib.parse import urljoin
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 from monitor.models.content_type import ContentType
 
+# Bound once so model defaults skip a Python-level lambda per instance
+_utcnow = partial(datetime.now, timezone.utc)
+
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
+_HTTP_SCHEMES = ("http://", "https://")
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None  # type: ignore[assignment]
+
+
+def hash_text(text: str) -> str:
+    """
+    Compute a fast, non-cryptographic fingerprint of article text.
+
+    Uses xxh3 when xxhash is installed and falls back to blake2b otherwise.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        str: Hex digest of the text
+    """
+    data = text.encode()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 
 class ArticleContent(BaseModel):
     """
@@ -42,14 +82,14 @@ class ArticleContent(BaseModel):
     # Additional fields for content analysis
     content_type: ContentType = ContentType.ARTICLE
     reading_time_minutes: Optional[float] = None
-    extracted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    extracted_at: datetime = Field(default_factory=_utcnow)
     language: Optional[str] = None
 
-    @field_validator("publish_date", mode="before")
+    @field_validator("publish_date")
     @classmethod
     def ensure_timezone(cls, v: Optional[datetime]) -> Optional[datetime]:
         """Ensure all datetime fields have timezone information."""
-        if v and v.tzinfo is None:
+        if v is not None and v.tzinfo is None:
             return v.replace(tzinfo=timezone.utc)
         return v
 
@@ -57,21 +97,25 @@ class ArticleContent(BaseModel):
     @classmethod
     def normalize_tags(cls, v: List[str]) -> List[str]:
         """Normalize tags by removing duplicates and empty tags."""
-        # Convert to set to remove duplicates, then back to list
-        return sorted(list(set(tag.strip().lower() for tag in v if tag.strip())))
+        if not v:
+            return v
+        # A set comprehension drops duplicates; sorted() takes it directly
+        return sorted({t for tag in v if (t := tag.strip().lower())})
 
     @field_validator("image_urls")
     @classmethod
     def normalize_image_urls(cls, v: List[str]) -> List[str]:
         """Normalize image URLs and remove duplicates."""
         # Remove empty URLs and duplicates
-        return list(set(url.strip() for url in v if url.strip()))
+        return list({u for url in v if (u := url.strip())})
 
     @field_validator("screenshot_paths")
     @classmethod
     def normalize_screenshot_paths(cls, v: List[str]) -> List[str]:
         """Normalize screenshot paths and remove duplicates / empties."""
-        return sorted({path.strip() for path in v if path.strip()})
+        if not v:
+            return v
+        return sorted({p for path in v if (p := path.strip())})
 
     @model_validator(mode='after')
     def calculate_reading_time(self) -> 'ArticleContent':
@@ -79,7 +123,8 @@ class ArticleContent(BaseModel):
         if self.reading_time_minutes is None and self.word_count > 0:
             # Average reading speed is about 200-250 words per minute
             # Using 225 as a middle ground
-            self.reading_time_minutes = round(self.word_count / 225, 1)
+            # The model is frozen, so set the computed field directly
+            self.__dict__["reading_time_minutes"] = round(self.word_count / 225, 1)
         return self
 
     @field_validator("text", mode="before")
@@ -89,16 +134,30 @@ class ArticleContent(BaseModel):
         if not v:
             return v
         # Replace multiple newlines with a maximum of two
-        v = re.sub(r"\n{3,}", "\n\n", v)
+        v = _MULTI_NEWLINE_RE.sub("\n\n", v)
         # Replace multiple spaces with a single space
-        v = re.sub(r" {2,}", " ", v)
+        v = _MULTI_SPACE_RE.sub(" ", v)
         # Trim leading/trailing whitespace
         return v.strip()
 
+    @cached_property
+    def _id(self) -> str:
+        """Unique ID based on URL and title, hashed once per instance."""
+        unique_string = f"{self.url}:{self.title}"
+        return hashlib.blake2b(unique_string.encode(), digest_size=16).hexdigest()
+
     def generate_id(self) -> str:
         """Generate a unique ID for the article content based on URL and title."""
-        unique_string = f"{self.url}:{self.title}"
-        return hashlib.sha256(unique_string.encode()).hexdigest()
+        return self._id
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> 'ArticleContent':
+        """Copy the model, dropping the memoized ID if any field is updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("_id", None)
+        return copied
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the article content to a dictionary with camelCase keys."""
@@ -106,8 +165,37 @@ class ArticleContent(BaseModel):
 
     def to_cache_key(self) -> str:
         """Generate a cache key for this article content."""
-        article_id = self.generate_id()
-        return f"article_content:{article_id}"
+        return f"article_content:{self._id}"
+
+    @classmethod
+    def validate_many(cls, items: List[Dict[str, Any]]) -> List['ArticleContent']:
+        """
+        Validate a list of raw dictionaries in a single pydantic-core call.
+
+        Args:
+            items: Raw field dictionaries, one per item
+
+        Returns:
+            List[ArticleContent]: The validated article contents
+        """
+        return _article_list_adapter().validate_python(items)
+
+    @classmethod
+    def from_cache(cls, data: Dict[str, Any]) -> 'ArticleContent':
+        """
+        Rebuild article content from its own model_dump() output without validation.
+
+        Skips text sanitization, tag normalization and the reading-time
+        calculation, which already ran when the content was first built.
+        Anything read from the network must still go through model_validate.
+
+        Args:
+            data: Dictionary produced by model_dump() on an ArticleContent
+
+        Returns:
+            ArticleContent: The reconstructed article content
+        """
+        return cls.model_construct(**data)
 
     def get_main_image_url(self) -> Optional[str]:
         """Get the main image URL if available."""
@@ -117,8 +205,7 @@ class ArticleContent(BaseModel):
 
     def get_domain(self) -> str:
         """Extract the domain name from the article URL."""
-        parsed_url = urlparse(str(self.url))
-        return parsed_url.netloc
+        return self.url.host or ""
 
     def get_text_snippet(self, max_length: int = 200) -> str:
         """Get a snippet of the article text with a maximum length."""
@@ -138,21 +225,30 @@ class ArticleContent(BaseModel):
 
     def resolve_relative_urls(self, base_url: str) -> 'ArticleContent':
         """Resolve relative URLs in image_urls to absolute URLs."""
-        resolved_urls = []
-        for url in self.image_urls:
-            if not url.startswith(('http://', 'https://')):
-                resolved_urls.append(urljoin(base_url, url))
-            else:
-                resolved_urls.append(url)
+        if all(url.startswith(_HTTP_SCHEMES) for url in self.image_urls):
+            return self
 
+        resolved_urls = [
+            url if url.startswith(_HTTP_SCHEMES) else urljoin(base_url, url)
+            for url in self.image_urls
+        ]
         return self.model_copy(update={"image_urls": resolved_urls})
 
-    class Config:
-        """Pydantic configuration for the ArticleContent model."""
-        json_encoders = {
+    # Core schemas are built on first use rather than at import time
+    model_config = ConfigDict(
+        defer_build=True,
+        json_encoders={
             datetime: lambda dt: dt.isoformat(),
             HttpUrl: str,
-        }
-        populate_by_name = True
-        str_strip_whitespace = True
-        validate_assignment = True
+        },
+        ignored_types=(cached_property,),
+        populate_by_name=True,
+        str_strip_whitespace=True,
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def _article_list_adapter() -> TypeAdapter[List[ArticleContent]]:
+    """Build the list adapter on first use, keeping the model's deferred schema build."""
+    return TypeAdapter(List[ArticleContent])
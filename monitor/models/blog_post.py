@@ -6,12 +6,23 @@ for working with blog posts throughout the monitoring pipeline.
 """
 import hashlib
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 from monitor.models.content_type import ContentType
 
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 class BlogPost(BaseModel):
     """
@@ -33,16 +44,16 @@ class BlogPost(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
     # Additional fields for internal tracking
-    discovered_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    discovered_at: datetime = Field(default_factory=_utcnow)
     last_checked: Optional[datetime] = None
     processing_status: str = "pending"
     fetch_attempts: int = 0
 
-    @field_validator("publish_date", "updated_date", mode="before")
+    @field_validator("publish_date", "updated_date")
     @classmethod
     def ensure_timezone(cls, v: Optional[datetime]) -> Optional[datetime]:
         """Ensure all datetime fields have timezone information."""
-        if v and v.tzinfo is None:
+        if v is not None and v.tzinfo is None:
             return v.replace(tzinfo=timezone.utc)
         return v
 
@@ -50,19 +61,21 @@ class BlogPost(BaseModel):
     @classmethod
     def normalize_tags(cls, v: List[str]) -> List[str]:
         """Normalize tags by removing duplicates and empty tags."""
-        # Convert to set to remove duplicates, then back to list
-        return sorted(list(set(tag.strip().lower() for tag in v if tag.strip())))
+        if not v:
+            return v
+        # A set comprehension drops duplicates; sorted() takes it directly
+        return sorted({t for tag in v if (t := tag.strip().lower())})
 
     def is_same_as(self, other: 'BlogPost') -> bool:
         """Check if this blog post is the same as another."""
         if not isinstance(other, BlogPost):
             return False
 
-        # Compare essential fields
+        # Compare essential fields, cheapest first; HttpUrl compares directly
         return (
-            str(self.url) == str(other.url) and
+            self.publish_date == other.publish_date and
             self.title == other.title and
-            self.publish_date == other.publish_date
+            self.url == other.url
         )
 
     def has_been_updated(self, other: 'BlogPost') -> bool:
@@ -84,6 +97,39 @@ class BlogPost(BaseModel):
         """Generate a cache key for this blog post."""
         return f"blog_post:{self.id}"
 
+    @classmethod
+    def validate_many(cls, items: List[Dict[str, Any]]) -> List['BlogPost']:
+        """
+        Validate a list of raw dictionaries in a single pydantic-core call.
+
+        Args:
+            items: Raw field dictionaries, one per item
+
+        Returns:
+            List[BlogPost]: The validated blog posts
+        """
+        return _blog_post_list_adapter().validate_python(items)
+
+    @classmethod
+    def from_cache(cls, data: Dict[str, Any]) -> 'BlogPost':
+        """
+        Rebuild a blog post from its own model_dump() output without validation.
+
+        Only use this for data we serialized ourselves; anything read from the
+        network must still go through model_validate.
+
+        Args:
+            data: Dictionary produced by model_dump() on a BlogPost
+
+        Returns:
+            BlogPost: The reconstructed blog post
+        """
+        return cls.model_construct(**data)
+
+    def with_updates(self, **changes: Any) -> 'BlogPost':
+        """Return a validated copy of this blog post with the given fields replaced."""
+        return type(self).model_validate({**self.__dict__, **changes})
+
     def with_status(self, status: str) -> 'BlogPost':
         """Return a copy of this blog post with an updated status."""
         return self.model_copy(update={"processing_status": status})
@@ -98,12 +144,19 @@ class BlogPost(BaseModel):
             update={"last_checked": datetime.now(timezone.utc)}
         )
 
-    class Config:
-        """Pydantic configuration for the BlogPost model."""
-        json_encoders = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_encoders={
             datetime: lambda dt: dt.isoformat(),
             HttpUrl: str,
-        }
-        populate_by_name = True
-        str_strip_whitespace = True
-        validate_assignment = True
+        },
+        populate_by_name=True,
+        str_strip_whitespace=True,
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def _blog_post_list_adapter() -> TypeAdapter[List[BlogPost]]:
+    """Build the list adapter on first use, keeping the model's deferred schema build."""
+    return TypeAdapter(List[BlogPost])
@@ -5,17 +5,23 @@ This module defines the CacheEntry model with validation and utility methods
 for working with cached content throughout the monitoring pipeline, including
 expiration handling, serialization, and metadata management.
 """
-import json
 import pickle
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import partial
 from typing import Any, Dict, Optional, TypeVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from pydantic.json import pydantic_encoder
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic_core import to_jsonable_python
 
 T = TypeVar('T')
 
+# Size of the little-endian header length prefix in serialized entries
+_HEADER_LENGTH_SIZE = 4
+
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 class ValueType(str, Enum):
     """Types of values that can be stored in the cache."""
@@ -41,9 +47,9 @@ class CacheEntry(BaseModel):
     value: Any
 
     # Timing fields
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
     expires_at: Optional[datetime] = None
-    last_accessed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_accessed_at: datetime = Field(default_factory=_utcnow)
     access_count: int = 0
 
     # Metadata
@@ -53,11 +59,11 @@ class CacheEntry(BaseModel):
     last_modified: Optional[str] = None
     content_hash: Optional[str] = None
 
-    @field_validator("created_at", "expires_at", "last_accessed_at", mode="before")
+    @field_validator("created_at", "expires_at", "last_accessed_at")
     @classmethod
     def ensure_timezone(cls, v: Optional[datetime]) -> Optional[datetime]:
         """Ensure all datetime fields have timezone information."""
-        if v and v.tzinfo is None:
+        if v is not None and v.tzinfo is None:
             return v.replace(tzinfo=timezone.utc)
         return v
 
@@ -98,7 +104,7 @@ class CacheEntry(BaseModel):
         This updates the last_accessed_at timestamp and increments the access_count.
         """
         return self.model_copy(update={
-            "last_accessed_at": datetime.now(timezone.utc),
+            "last_accessed_at": _utcnow(),
             "access_count": self.access_count + 1
         })
 
@@ -112,56 +118,36 @@ class CacheEntry(BaseModel):
         Returns:
             Updated CacheEntry with expiration set
         """
-        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        expires_at = _utcnow() + timedelta(seconds=ttl_seconds)
         return self.model_copy(update={"expires_at": expires_at})
 
     def serialize(self) -> bytes:
         """
         Serialize the cache entry for storage.
         
+        The layout is a little-endian uint32 header length, the JSON header
+        and then, for pickle and binary entries, the raw value bytes.
+
         Returns:
             bytes: Serialized representation of the cache entry
         """
-        # For pickle value type, we need special handling
+        # Pickle and binary values travel after the header instead of inside it
         if self.value_type == ValueType.PICKLE:
-            # Store the original value temporarily
-            original_value = self.value
-            # Replace with None for JSON serialization
-            self_dict = self.model_dump()
-            self_dict["value"] = None
-
-            # Serialize the entry without the value
-            entry_bytes = json.dumps(self_dict, default=pydantic_encoder).encode('utf-8')
-
-            # Pickle the value separately
-            value_bytes = pickle.dumps(original_value)
-
-            # Combine the two with a separator
-            separator = b"__PICKLE_SEPARATOR__"
-            return entry_bytes + separator + value_bytes
-
-        # For bytes and image types, we need to handle binary data
+            header_dict = self.model_dump(mode="json", exclude={"value"})
+            header_dict["value"] = None
+            value_bytes = pickle.dumps(self.value, protocol=pickle.HIGHEST_PROTOCOL)
         elif self.value_type in (ValueType.BYTES, ValueType.IMAGE):
-            # Store the original value temporarily
-            original_value = self.value
-            # Replace with None for JSON serialization
-            self_dict = self.model_dump()
-            self_dict["value"] = None
-
-            # Serialize the entry without the value
-            entry_bytes = json.dumps(self_dict, default=pydantic_encoder).encode('utf-8')
-
-            # Combine with the binary value
-            separator = b"__BINARY_SEPARATOR__"
-            if isinstance(original_value, bytes):
-                value_bytes = original_value
-            else:
-                value_bytes = str(original_value).encode('utf-8')
-
-            return entry_bytes + separator + value_bytes
-
-        # For other types, standard JSON serialization works
-        return json.dumps(self.model_dump(), default=pydantic_encoder).encode('utf-8')
+            header_dict = self.model_dump(mode="json", exclude={"value"})
+            header_dict["value"] = None
+            # Binary entries must hold a bytes-like value; bytes() rejects str
+            value_bytes = self.value if isinstance(self.value, bytes) else bytes(self.value)
+        else:
+            header_dict = self.model_dump(mode="json")
+            value_bytes = b""
+        header_dict["_trusted"] = True
+
+        header = orjson.dumps(header_dict, option=orjson.OPT_NON_STR_KEYS)
+        return len(header).to_bytes(_HEADER_LENGTH_SIZE, "little") + header + value_bytes
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'CacheEntry':
@@ -174,36 +160,54 @@ class CacheEntry(BaseModel):
         Returns:
             CacheEntry: Deserialized cache entry
         """
-        # Check if this is a pickle or binary entry
-        if b"__PICKLE_SEPARATOR__" in data:
-            # Split the data
-            entry_bytes, value_bytes = data.split(b"__PICKLE_SEPARATOR__", 1)
-
-            # Parse the entry
-            entry_dict = json.loads(entry_bytes.decode('utf-8'))
+        # Slice through a memoryview so the header and pickled value are not copied
+        view = memoryview(data)
+        header_end = _HEADER_LENGTH_SIZE + int.from_bytes(view[:_HEADER_LENGTH_SIZE], "little")
+        entry_dict = orjson.loads(view[_HEADER_LENGTH_SIZE:header_end])
 
-            # Unpickle the value
-            value = pickle.loads(value_bytes)  # nosec B301: trusted internal cache
+        value_type = entry_dict.get("value_type")
+        if value_type == ValueType.PICKLE:
+            # Trusted internal cache: entries are only written by this application
+            entry_dict["value"] = pickle.loads(view[header_end:])  # nosec B301
+        elif value_type in (ValueType.BYTES, ValueType.IMAGE):
+            entry_dict["value"] = bytes(view[header_end:])
 
-            # Restore the value
-            entry_dict["value"] = value
+        return cls._from_entry_dict(entry_dict)
 
-            return cls.model_validate(entry_dict)
-
-        elif b"__BINARY_SEPARATOR__" in data:
-            # Split the data
-            entry_bytes, value_bytes = data.split(b"__BINARY_SEPARATOR__", 1)
+    @classmethod
+    def _from_entry_dict(cls, entry_dict: Dict[str, Any]) -> 'CacheEntry':
+        """Build an entry from a decoded dict, trusting our own serialize() output."""
+        if entry_dict.pop("_trusted", False):
+            return cls.from_trusted(entry_dict)
+        return cls.model_validate(entry_dict)
 
-            # Parse the entry
-            entry_dict = json.loads(entry_bytes.decode('utf-8'))
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'CacheEntry':
+        """
+        Build a cache entry from data produced by serialize(), skipping validation.
 
-            # Restore the binary value
-            entry_dict["value"] = value_bytes
+        Untrusted data must still go through model_validate.
 
-            return cls.model_validate(entry_dict)
+        Args:
+            data: Decoded entry dictionary
 
-        # Standard JSON deserialization
-        return cls.model_validate(json.loads(data.decode('utf-8')))
+        Returns:
+            CacheEntry: The reconstructed cache entry
+        """
+        data["value_type"] = ValueType(data["value_type"])
+        for field in ("created_at", "expires_at", "last_accessed_at"):
+            if isinstance(data.get(field), str):
+                data[field] = datetime.fromisoformat(data[field])
+        return cls.model_construct(**data)
+
+    @staticmethod
+    def _ttl_fields(ttl_seconds: Optional[int], fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Add timestamps for an optional TTL so an entry is built in one step."""
+        if ttl_seconds is not None:
+            now = _utcnow()
+            fields.setdefault("created_at", now)
+            fields["expires_at"] = now + timedelta(seconds=ttl_seconds)
+        return fields
 
     @classmethod
     def create_string_entry(cls, key: str, value: str, ttl_seconds: Optional[int] = None, **kwargs) -> 'CacheEntry':
@@ -219,18 +223,13 @@ class CacheEntry(BaseModel):
         Returns:
             CacheEntry: A new cache entry
         """
-        entry = cls(
+        return cls(
             key=key,
             value_type=ValueType.STRING,
             value=value,
-            **kwargs
+            **cls._ttl_fields(ttl_seconds, kwargs)
         )
 
-        if ttl_seconds is not None:
-            entry = entry.with_ttl(ttl_seconds)
-
-        return entry
-
     @classmethod
     def create_json_entry(cls, key: str, value: Any, ttl_seconds: Optional[int] = None, **kwargs) -> 'CacheEntry':
         """
@@ -247,22 +246,17 @@ class CacheEntry(BaseModel):
         """
         # Validate that the value is JSON serializable
         try:
-            json.dumps(value, default=pydantic_encoder)
+            to_jsonable_python(value)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Value is not JSON serializable: {e}")
 
-        entry = cls(
+        return cls(
             key=key,
             value_type=ValueType.JSON,
             value=value,
-            **kwargs
+            **cls._ttl_fields(ttl_seconds, kwargs)
         )
 
-        if ttl_seconds is not None:
-            entry = entry.with_ttl(ttl_seconds)
-
-        return entry
-
     @classmethod
     def create_pickle_entry(cls, key: str, value: Any, ttl_seconds: Optional[int] = None, **kwargs) -> 'CacheEntry':
         """
@@ -282,18 +276,13 @@ class CacheEntry(BaseModel):
             untrusted data. Ensure that the cache is only populated with trusted
             data from within the application boundary.
         """
-        entry = cls(
+        return cls(
             key=key,
             value_type=ValueType.PICKLE,
             value=value,
-            **kwargs
+            **cls._ttl_fields(ttl_seconds, kwargs)
         )
 
-        if ttl_seconds is not None:
-            entry = entry.with_ttl(ttl_seconds)
-
-        return entry
-
     @classmethod
     def create_bytes_entry(cls, key: str, value: bytes, ttl_seconds: Optional[int] = None, **kwargs) -> 'CacheEntry':
         """
@@ -308,18 +297,13 @@ class CacheEntry(BaseModel):
         Returns:
             CacheEntry: A new cache entry
         """
-        entry = cls(
+        return cls(
             key=key,
             value_type=ValueType.BYTES,
             value=value,
-            **kwargs
+            **cls._ttl_fields(ttl_seconds, kwargs)
         )
 
-        if ttl_seconds is not None:
-            entry = entry.with_ttl(ttl_seconds)
-
-        return entry
-
     @classmethod
     def create_html_entry(cls, key: str, value: str, ttl_seconds: Optional[int] = None, **kwargs) -> 'CacheEntry':
         """
@@ -334,22 +318,19 @@ class CacheEntry(BaseModel):
         Returns:
             CacheEntry: A new cache entry
         """
-        entry = cls(
+        return cls(
             key=key,
             value_type=ValueType.HTML,
             value=value,
-            **kwargs
+            **cls._ttl_fields(ttl_seconds, kwargs)
         )
 
-        if ttl_seconds is not None:
-            entry = entry.with_ttl(ttl_seconds)
-
-        return entry
-
-    class Config:
-        """Pydantic configuration for the CacheEntry model."""
-        json_encoders = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_encoders={
             datetime: lambda dt: dt.isoformat(),
             bytes: lambda b: None,  # Bytes cannot be JSON serialized directly
-        }
-        arbitrary_types_allowed = True
+        },
+        arbitrary_types_allowed=True,
+        frozen=True,
+    )
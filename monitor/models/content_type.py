@@ -36,19 +36,25 @@ class ContentType(str, Enum):
         Returns:
             The matching ContentType enum value, or UNKNOWN if no match
         """
-        try:
-            return cls(content_type.lower())
-        except ValueError:
-            return cls.UNKNOWN
+        return _CONTENT_TYPE_LOOKUP.get(content_type.lower(), cls.UNKNOWN)
 
     def is_educational(self) -> bool:
         """Check if the content type is primarily educational."""
-        return self in (self.TUTORIAL, self.DOCUMENTATION)
+        return self in _EDUCATIONAL_TYPES
 
     def is_news(self) -> bool:
         """Check if the content type is primarily news-oriented."""
-        return self in (self.BLOG_POST, self.NEWS, self.RELEASE_NOTES)
+        return self in _NEWS_TYPES
 
     def is_detailed(self) -> bool:
         """Check if the content type is typically detailed/long-form."""
-        return self in (self.WHITEPAPER, self.CASE_STUDY, self.DOCUMENTATION)
+        return self in _DETAILED_TYPES
+
+
+# Defined outside the class body, where Enum would turn them into members
+_CONTENT_TYPE_LOOKUP = {member.value: member for member in ContentType}
+_EDUCATIONAL_TYPES = frozenset({ContentType.TUTORIAL, ContentType.DOCUMENTATION})
+_NEWS_TYPES = frozenset({ContentType.BLOG_POST, ContentType.NEWS, ContentType.RELEASE_NOTES})
+_DETAILED_TYPES = frozenset(
+    {ContentType.WHITEPAPER, ContentType.CASE_STUDY, ContentType.DOCUMENTATION}
+)
@@ -5,11 +5,100 @@ This module defines the EmbeddingRecord model with validation and utility method
 for working with embeddings throughout the monitoring pipeline and for storage
 in vector databases.
 """
+import hashlib
+import math
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import cached_property, partial
+from typing import Annotated, Any, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 import numpy as np
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+import orjson
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    HttpUrl,
+    PlainSerializer,
+    field_validator,
+    model_validator,
+)
+
+try:
+    import simsimd
+except ImportError:  # pragma: no cover - optional speedup
+    simsimd = None  # type: ignore[assignment]
+
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+def _as_embedding_vector(v: Any) -> Any:
+    """Coerce a sequence of numbers to a contiguous 1-D float32 array.
+
+    int8 arrays are kept as-is so that quantized embeddings survive validation.
+    """
+    if v is None:
+        return None
+    if isinstance(v, np.ndarray) and v.dtype == np.int8:
+        arr = np.ascontiguousarray(v)
+    else:
+        arr = np.ascontiguousarray(v, dtype=np.float32)
+    if arr.ndim != 1:
+        raise ValueError("Embedding vector must be one-dimensional")
+    return arr
+
+
+# Embedding vectors are held as float32 (or quantized int8) arrays, which are
+# far smaller than lists of Python floats and directly usable by numpy and
+# pgvector, but serialize as plain lists.
+EmbeddingVector = Annotated[
+    np.ndarray,
+    BeforeValidator(_as_embedding_vector),
+    PlainSerializer(lambda arr: arr.tolist(), return_type=List[float]),
+]
+
+
+def quantize_int8(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantize a vector to int8 with a symmetric per-vector scale.
+
+    Args:
+        vector: Float vector to quantize
+
+    Returns:
+        Tuple[np.ndarray, float]: int8 vector and the scale that maps it back
+    """
+    max_abs = float(np.abs(vector).max())
+    scale = max_abs / 127.0 if max_abs > 0 else 1.0
+    quantized = np.round(vector / scale).astype(np.int8)
+    return quantized, scale
+
+
+def _is_int8(vector: Any) -> bool:
+    """Whether vector is an int8 numpy array."""
+    return isinstance(vector, np.ndarray) and vector.dtype == np.int8
+
+
+def dequantize_int8(quantized: np.ndarray, scale: float) -> np.ndarray:
+    """
+    Restore an approximate float32 vector from its int8 quantization.
+
+    Args:
+        quantized: int8 vector
+        scale: Scale returned by quantize_int8
+
+    Returns:
+        np.ndarray: float32 vector
+    """
+    return quantized.astype(np.float32) * np.float32(scale)
+
+
+def _unit_vector(vector: Any) -> Tuple[np.ndarray, bool]:
+    """Scale a vector to unit length, reporting whether that was possible."""
+    arr = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(arr)
+    if norm == 0 or not np.isfinite(norm):
+        return arr, False
+    return arr / norm, True
 
 
 class EmbeddingRecord(BaseModel):
@@ -26,8 +115,15 @@ class EmbeddingRecord(BaseModel):
     title: str
 
     # Embedding vectors
-    text_embedding: List[float]
-    image_embedding: Optional[List[float]] = None
+    text_embedding: EmbeddingVector
+    image_embedding: Optional[EmbeddingVector] = None
+
+    # Per-vector scales, set when the corresponding embedding is int8-quantized
+    text_embedding_scale: Optional[float] = None
+    image_embedding_scale: Optional[float] = None
+
+    # Set when the text embedding was scaled to unit length on construction
+    text_embedding_normalized: bool = False
 
     # Source information
     source: Optional[str] = None
@@ -38,7 +134,7 @@ class EmbeddingRecord(BaseModel):
     # Embedding metadata
     text_model_id: Optional[str] = None
     image_model_id: Optional[str] = None
-    embedding_created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    embedding_created_at: datetime = Field(default_factory=_utcnow)
     embedding_version: str = "1.0"
 
     # Storage for additional metadata
@@ -48,29 +144,29 @@ class EmbeddingRecord(BaseModel):
     collection_name: Optional[str] = None
     vector_db_id: Optional[str] = None
 
-    @field_validator("publish_date", mode="before")
+    @field_validator("publish_date")
     @classmethod
     def ensure_timezone(cls, v: Optional[datetime]) -> Optional[datetime]:
         """Ensure all datetime fields have timezone information."""
-        if v and v.tzinfo is None:
+        if v is not None and v.tzinfo is None:
             return v.replace(tzinfo=timezone.utc)
         return v
 
     @field_validator("text_embedding", "image_embedding")
     @classmethod
-    def validate_embedding_dimensions(cls, v: Optional[List[float]]) -> Optional[List[float]]:
+    def validate_embedding_dimensions(cls, v: Optional[np.ndarray]) -> Optional[np.ndarray]:
         """Validate embedding dimensions and values."""
         if v is None:
             return None
 
         # Check that embeddings are not empty
-        if len(v) == 0:
+        if v.size == 0:
             raise ValueError("Embedding vector cannot be empty")
 
         # Check that embeddings contain valid float values
-        for val in v:
-            if not isinstance(val, (int, float)) or np.isnan(val) or np.isinf(val):
-                raise ValueError(f"Invalid embedding value: {val}")
+        if not np.isfinite(v).all():
+            invalid = v[~np.isfinite(v)][0]
+            raise ValueError(f"Invalid embedding value: {invalid}")
 
         return v
 
@@ -78,55 +174,230 @@ class EmbeddingRecord(BaseModel):
     def validate_model_consistency(self) -> 'EmbeddingRecord':
         """Validate that model fields are consistent."""
         # Ensure we have at least one embedding
-        if not self.text_embedding and not self.image_embedding:
+        if self.text_embedding is None and self.image_embedding is None:
             raise ValueError("At least one of text_embedding or image_embedding must be provided")
 
+        # Quantized embeddings round-trip through serialization as plain
+        # integer lists; restore their int8 dtype. Written via __dict__ to
+        # avoid re-running assignment validation.
+        for field, scale in (
+            ("text_embedding", self.text_embedding_scale),
+            ("image_embedding", self.image_embedding_scale),
+        ):
+            vector = getattr(self, field)
+            if scale is not None and vector is not None and vector.dtype != np.int8:
+                self.__dict__[field] = vector.astype(np.int8)
+
         return self
 
+    @property
+    def is_quantized(self) -> bool:
+        """Whether the embeddings are stored as int8."""
+        return self.text_embedding_scale is not None or self.image_embedding_scale is not None
+
+    @cached_property
+    def _text_i8(self) -> np.ndarray:
+        """int8 text embedding for approximate similarity, quantized once."""
+        if self.text_embedding_scale is not None:
+            return self.text_embedding
+        return quantize_int8(self.text_embedding)[0]
+
+    @cached_property
+    def _text_f32(self) -> np.ndarray:
+        """float32 text embedding, dequantized once if stored as int8."""
+        return self.get_text_vector()
+
+    @cached_property
+    def _text_norm(self) -> float:
+        """L2 norm of the text embedding, computed once."""
+        if self.text_embedding_normalized:
+            return 1.0
+        return float(np.linalg.norm(self._text_f32))
+
+    @cached_property
+    def _text_unit(self) -> np.ndarray:
+        """Unit-length text embedding, so cosine similarity is a plain dot product."""
+        if self.text_embedding_normalized:
+            return self._text_f32
+        if self._text_norm == 0:
+            return np.zeros_like(self._text_f32)
+        return self._text_f32 / np.float32(self._text_norm)
+
+    @cached_property
+    def _content_hash(self) -> str:
+        """SHA-256 of the raw float32 text embedding buffer, computed once."""
+        return hashlib.sha256(memoryview(self._text_f32)).hexdigest()
+
+    def _clear_vector_caches(self) -> None:
+        """Drop cached derivations of the embeddings after they change."""
+        for name in ("_text_i8", "_text_f32", "_text_norm", "_text_unit", "_content_hash"):
+            self.__dict__.pop(name, None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "text_embedding":
+            self.__dict__["text_embedding_normalized"] = False
+        self._clear_vector_caches()
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare field by field, with the embedding vectors compared element-wise."""
+        if not isinstance(other, EmbeddingRecord):
+            return NotImplemented
+        for name in type(self).model_fields:
+            mine, theirs = getattr(self, name), getattr(other, name)
+            if name in ("text_embedding", "image_embedding"):
+                if (mine is None) != (theirs is None):
+                    return False
+                if mine is not None and not np.array_equal(mine, theirs):
+                    return False
+            elif mine != theirs:
+                return False
+        return True
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> 'EmbeddingRecord':
+        """Copy the model, dropping cached vector derivations if any field is updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            if "text_embedding" in update and "text_embedding_normalized" not in update:
+                copied.__dict__["text_embedding_normalized"] = False
+            copied._clear_vector_caches()
+        return copied
+
+    def get_text_vector(self) -> np.ndarray:
+        """Get the text embedding as float32, dequantizing if necessary."""
+        if self.text_embedding_scale is None:
+            return self.text_embedding
+        return dequantize_int8(self.text_embedding, self.text_embedding_scale)
+
+    def get_image_vector(self) -> Optional[np.ndarray]:
+        """Get the image embedding as float32, dequantizing if necessary."""
+        if self.image_embedding is None or self.image_embedding_scale is None:
+            return self.image_embedding
+        return dequantize_int8(self.image_embedding, self.image_embedding_scale)
+
+    def quantize(self, dtype: str = "int8") -> 'EmbeddingRecord':
+        """
+        Return a copy with embeddings quantized to int8 with per-vector scales.
+
+        This cuts embedding memory and transport size by 4x compared with
+        float32 at a small loss of precision; cosine similarity is unaffected
+        by the scale.
+
+        Args:
+            dtype: Target dtype (only 'int8' is supported)
+
+        Returns:
+            EmbeddingRecord: Quantized copy of this record
+        """
+        if dtype != "int8":
+            raise ValueError(f"Unsupported quantization dtype: {dtype}")
+        if self.is_quantized:
+            return self
+
+        # Dequantized vectors are only approximately unit length
+        update: Dict[str, Any] = {"text_embedding_normalized": False}
+        if self.text_embedding is not None:
+            update["text_embedding"], update["text_embedding_scale"] = quantize_int8(
+                self.text_embedding
+            )
+        if self.image_embedding is not None:
+            update["image_embedding"], update["image_embedding_scale"] = quantize_int8(
+                self.image_embedding
+            )
+        return self.model_copy(update=update)
+
+    def dequantize(self) -> 'EmbeddingRecord':
+        """Return a copy with float32 embeddings restored from int8."""
+        if not self.is_quantized:
+            return self
+        return self.model_copy(update={
+            "text_embedding": self.get_text_vector(),
+            "image_embedding": self.get_image_vector(),
+            "text_embedding_scale": None,
+            "image_embedding_scale": None,
+        })
+
     def get_text_vector_dimension(self) -> int:
         """Get the dimension of the text embedding vector."""
-        if self.text_embedding:
+        if self.text_embedding is not None:
             return len(self.text_embedding)
         return 0
 
     def get_image_vector_dimension(self) -> int:
         """Get the dimension of the image embedding vector."""
-        if self.image_embedding:
+        if self.image_embedding is not None:
             return len(self.image_embedding)
         return 0
 
-    def to_vector_db_payload(self) -> Dict[str, Any]:
+    def _vector_db_document(
+        self, vectors: Dict[str, Any], publish_date: Any, embedding_created_at: Any
+    ) -> Dict[str, Any]:
         """
-        Convert the embedding record to a payload suitable for vector database storage.
-        
-        The exact format may vary depending on the vector database being used.
+        Lay out the vector database document shared by the payload builders.
+
+        Args:
+            vectors: Vectors keyed by name ("text", and "image" if present)
+            publish_date: Publish date in the caller's representation
+            embedding_created_at: Creation time in the caller's representation
+
+        Returns:
+            Dict[str, Any]: Document with "id", "vectors" and "payload" keys
         """
         payload = {
-            "id": self.id,
-            "vectors": {
-                "text": self.text_embedding
-            },
-            "payload": {
-                "url": str(self.url),
-                "title": self.title,
-                "source": self.source,
-                "author": self.author,
-                "publish_date": self.publish_date.isoformat() if self.publish_date else None,
-                "content_snippet": self.content_snippet,
-                "embedding_created_at": self.embedding_created_at.isoformat(),
-                "embedding_version": self.embedding_version,
-            }
+            "url": str(self.url),
+            "title": self.title,
+            "source": self.source,
+            "author": self.author,
+            "publish_date": publish_date,
+            "content_snippet": self.content_snippet,
+            "embedding_created_at": embedding_created_at,
+            "embedding_version": self.embedding_version,
         }
+        if self.metadata:
+            payload["metadata"] = self.metadata
 
-        # Add image embedding if available
-        if self.image_embedding:
-            payload["vectors"]["image"] = self.image_embedding
+        return {"id": self.id, "vectors": vectors, "payload": payload}
 
-        # Add all metadata
-        if self.metadata:
-            payload["payload"]["metadata"] = self.metadata
+    def to_vector_db_bytes(self) -> bytes:
+        """
+        Serialize the vector database payload straight to JSON bytes.
+
+        The float32 vectors are handed to orjson as arrays, so they are never
+        expanded into lists of Python floats.
 
-        return payload
+        Returns:
+            bytes: JSON-encoded payload
+        """
+        vectors: Dict[str, Any] = {"text": self.get_text_vector()}
+        image_vector = self.get_image_vector()
+        if image_vector is not None:
+            vectors["image"] = image_vector
+
+        return orjson.dumps(
+            self._vector_db_document(vectors, self.publish_date, self.embedding_created_at),
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
+
+    def to_vector_db_payload(self) -> Dict[str, Any]:
+        """
+        Convert the embedding record to a payload suitable for vector database storage.
+
+        The exact format may vary depending on the vector database being used.
+        Callers that send the payload over the wire should prefer
+        to_vector_db_bytes.
+        """
+        vectors: Dict[str, Any] = {"text": self.get_text_vector().tolist()}
+        image_vector = self.get_image_vector()
+        if image_vector is not None:
+            vectors["image"] = image_vector.tolist()
+
+        return self._vector_db_document(
+            vectors,
+            self.publish_date.isoformat() if self.publish_date else None,
+            self.embedding_created_at.isoformat(),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the embedding record to a dictionary with camelCase keys."""
@@ -136,41 +407,141 @@ class EmbeddingRecord(BaseModel):
         """Generate a cache key for this embedding record."""
         return f"embedding:{self.id}"
 
-    def get_similarity_score(self, other: 'EmbeddingRecord', mode: str = "text") -> float:
+    def content_hash(self) -> str:
+        """
+        Hash the text embedding to detect when a record's vector has changed.
+
+        Hashes the contiguous float32 buffer directly rather than a JSON dump
+        of the record.
+
+        Returns:
+            str: Hex SHA-256 digest of the text embedding
+        """
+        return self._content_hash
+
+    def get_similarity_score(
+        self,
+        other: 'EmbeddingRecord',
+        mode: str = "text",
+        precision: str = "exact",
+    ) -> float:
         """
         Calculate cosine similarity between this embedding and another.
         
         Args:
             other: Another EmbeddingRecord to compare with
             mode: Which embedding to use ('text', 'image', or 'combined')
+            precision: 'exact' for float32, or 'i8' to compare cached int8
+                quantizations of the text embeddings (4x less memory traffic)
             
         Returns:
             float: Cosine similarity score (-1 to 1, higher is more similar)
         """
-        if mode == "text" and self.text_embedding and other.text_embedding:
-            return self._cosine_similarity(self.text_embedding, other.text_embedding)
-        elif mode == "image" and self.image_embedding and other.image_embedding:
-            return self._cosine_similarity(self.image_embedding, other.image_embedding)
+        if precision not in ("exact", "i8"):
+            raise ValueError(f"Unsupported similarity precision: {precision}")
+        has_text = self.text_embedding is not None and other.text_embedding is not None
+        image, other_image = self.image_embedding, other.image_embedding
+        if mode == "text" and has_text:
+            if precision == "i8":
+                return self._cosine_similarity(self._text_i8, other._text_i8)
+            return self._cosine_similarity_cached(other)
+        elif mode == "image" and image is not None and other_image is not None:
+            return self._cosine_similarity(image, other_image)
         elif mode == "combined":
             # Average of text and image similarity if both are available
             scores = []
-            if self.text_embedding and other.text_embedding:
+            if has_text:
                 scores.append(self._cosine_similarity(self.text_embedding, other.text_embedding))
-            if self.image_embedding and other.image_embedding:
-                scores.append(self._cosine_similarity(self.image_embedding, other.image_embedding))
+            if image is not None and other_image is not None:
+                scores.append(self._cosine_similarity(image, other_image))
             if scores:
                 return sum(scores) / len(scores)
         return 0.0
 
+    @classmethod
+    def batch_similarity(
+        cls, query: 'EmbeddingRecord', records: List['EmbeddingRecord']
+    ) -> np.ndarray:
+        """
+        Text cosine similarity of one query against many records in one BLAS call.
+
+        Ranking N candidates with get_similarity_score costs N Python calls;
+        this stacks the records' unit vectors into an (N, d) matrix and does a
+        single matrix-vector product instead.
+
+        Args:
+            query: Record to compare against
+            records: Candidate records with text embeddings
+
+        Returns:
+            np.ndarray: float32 similarity scores, one per record, in order
+        """
+        if not records:
+            return np.empty(0, dtype=np.float32)
+        matrix = np.stack([record._text_unit for record in records])
+        scores: np.ndarray = matrix @ query._text_unit
+        return scores
+
+    @classmethod
+    def similarity_topk(
+        cls, query: 'EmbeddingRecord', records: List['EmbeddingRecord'], k: int
+    ) -> List[Tuple['EmbeddingRecord', float]]:
+        """
+        The k records most similar to the query by text embedding.
+
+        Scores stay in one float32 array from batch_similarity, and
+        np.argpartition selects the top k in linear time. Only those k are
+        sorted and converted to Python floats.
+
+        Args:
+            query: Record to compare against
+            records: Candidate records with text embeddings
+            k: Number of results to return
+
+        Returns:
+            List[Tuple[EmbeddingRecord, float]]: Records and scores, best first
+        """
+        if k <= 0 or not records:
+            return []
+        scores = cls.batch_similarity(query, records)
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(records[i], float(scores[i])) for i in top]
+
+    def _cosine_similarity_cached(self, other: 'EmbeddingRecord') -> float:
+        """Text cosine similarity as one dot product over the cached norms."""
+        if len(self._text_f32) != len(other._text_f32):
+            raise ValueError("Vector dimensions do not match")
+        if self.text_embedding_normalized and other.text_embedding_normalized:
+            return float(np.dot(self._text_f32, other._text_f32))
+        norms = self._text_norm * other._text_norm
+        if norms == 0:
+            return 0.0
+        return float(np.dot(self._text_f32, other._text_f32)) / norms
+
     @staticmethod
-    def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    def _cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors."""
         if len(vec1) != len(vec2):
             raise ValueError("Vector dimensions do not match")
 
-        # Convert to numpy arrays for efficient calculation
-        a = np.array(vec1)
-        b = np.array(vec2)
+        if simsimd is not None and _is_int8(vec1) and _is_int8(vec2):
+            # int8 kernels (VNNI / NEON dot product); the scales cancel out
+            similarity = 1.0 - cast(float, simsimd.cosine(vec1, vec2))
+            return 0.0 if math.isnan(similarity) else similarity
+
+        # Accept plain sequences as well as float32 arrays (no copy for arrays)
+        a = np.asarray(vec1, dtype=np.float32)
+        b = np.asarray(vec2, dtype=np.float32)
+
+        if simsimd is not None:
+            # Single SIMD pass; simsimd returns the cosine distance, a plain
+            # float for two 1-D vectors
+            similarity = 1.0 - cast(float, simsimd.cosine(a, b))
+            return 0.0 if math.isnan(similarity) else similarity
 
         # Calculate cosine similarity
         dot_product = np.dot(a, b)
@@ -180,7 +551,32 @@ class EmbeddingRecord(BaseModel):
         if norm_a == 0 or norm_b == 0:
             return 0.0
 
-        return dot_product / (norm_a * norm_b)
+        return float(dot_product / (norm_a * norm_b))
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'EmbeddingRecord':
+        """
+        Build a record from data we stored ourselves, skipping validation.
+
+        Rows read back from the vector database were validated on the way in,
+        so only the URL and embeddings are coerced to their field types;
+        validating the vectors again would re-scan every one. Anything from
+        outside must still go through the normal constructor.
+
+        Args:
+            data: Record fields, e.g. a vector database row
+
+        Returns:
+            EmbeddingRecord: The reconstructed record
+        """
+        data = dict(data)
+        if isinstance(data.get("url"), str):
+            # Cheap next to the vectors, and keeps serialization warning-free
+            data["url"] = HttpUrl(data["url"])
+        for field in ("text_embedding", "image_embedding"):
+            if data.get(field) is not None:
+                data[field] = _as_embedding_vector(data[field])
+        return cls.model_construct(**data)
 
     @classmethod
     def from_text_embedding(
@@ -188,8 +584,9 @@ class EmbeddingRecord(BaseModel):
         id: str,
         url: HttpUrl,
         title: str,
-        text_embedding: List[float],
+        text_embedding: Union[List[float], np.ndarray],
         metadata: Optional[Dict[str, Any]] = None,
+        normalize: bool = False,
         **kwargs
     ) -> 'EmbeddingRecord':
         """
@@ -201,19 +598,26 @@ class EmbeddingRecord(BaseModel):
             title: Title of the source content
             text_embedding: Text embedding vector
             metadata: Additional metadata
+            normalize: Store the text embedding scaled to unit length, so
+                similarity against other normalized records is a plain dot
+                product
             **kwargs: Additional fields to include
             
         Returns:
             EmbeddingRecord: A new embedding record
         """
-        return cls(
-            id=id,
-            url=url,
-            title=title,
-            text_embedding=text_embedding,
-            metadata=metadata or {},
-            **kwargs
-        )
+        if normalize:
+            text_embedding, kwargs["text_embedding_normalized"] = _unit_vector(text_embedding)
+
+        # Validate from a dict; the field validator turns the list into an array
+        return cls.model_validate({
+            "id": id,
+            "url": url,
+            "title": title,
+            "text_embedding": text_embedding,
+            "metadata": metadata or {},
+            **kwargs,
+        })
 
     @classmethod
     def from_dual_embeddings(
@@ -221,9 +625,10 @@ class EmbeddingRecord(BaseModel):
         id: str,
         url: HttpUrl,
         title: str,
-        text_embedding: List[float],
+        text_embedding: Union[List[float], np.ndarray],
         image_embedding: List[float],
         metadata: Optional[Dict[str, Any]] = None,
+        normalize: bool = False,
         **kwargs
     ) -> 'EmbeddingRecord':
         """
@@ -236,20 +641,26 @@ class EmbeddingRecord(BaseModel):
             text_embedding: Text embedding vector
             image_embedding: Image embedding vector
             metadata: Additional metadata
+            normalize: Store the text embedding scaled to unit length, so
+                similarity against other normalized records is a plain dot
+                product
             **kwargs: Additional fields to include
             
         Returns:
             EmbeddingRecord: A new embedding record with both embeddings
         """
-        return cls(
-            id=id,
-            url=url,
-            title=title,
-            text_embedding=text_embedding,
-            image_embedding=image_embedding,
-            metadata=metadata or {},
-            **kwargs
-        )
+        if normalize:
+            text_embedding, kwargs["text_embedding_normalized"] = _unit_vector(text_embedding)
+
+        return cls.model_validate({
+            "id": id,
+            "url": url,
+            "title": title,
+            "text_embedding": text_embedding,
+            "image_embedding": image_embedding,
+            "metadata": metadata or {},
+            **kwargs,
+        })
 
     class Config:
         """Pydantic configuration for the EmbeddingRecord model."""
@@ -258,5 +669,7 @@ class EmbeddingRecord(BaseModel):
             HttpUrl: str,
             np.ndarray: lambda arr: arr.tolist(),
         }
+        ignored_types = (cached_property,)
         populate_by_name = True
         validate_assignment = True
+        arbitrary_types_allowed = True
@@ -4,11 +4,15 @@ Scheduler module for the technical blog monitor.
 This module handles setting up APScheduler jobs for feed monitoring
 with configurable intervals and job management.
 """
+import itertools
+import uuid
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import structlog
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
@@ -17,6 +21,91 @@ from monitor.config import FeedConfig
 # Set up structured logger
 logger = structlog.get_logger()
 
+# Prefix shared by all feed monitoring job IDs
+FEED_JOB_PREFIX = "feed_monitor_"
+
+# Trigger fields for cron keywords and the most common crontab schedules,
+# built directly instead of going through the crontab parser. Keywords are not
+# understood by CronTrigger.from_crontab at all.
+_CRON_SHORTCUTS: Dict[str, Dict[str, Any]] = {
+    "@hourly": {"minute": 0},
+    "@daily": {"hour": 0, "minute": 0},
+    "@midnight": {"hour": 0, "minute": 0},
+    "@weekly": {"day_of_week": "sun", "hour": 0, "minute": 0},
+    "@monthly": {"day": 1, "hour": 0, "minute": 0},
+    "@yearly": {"month": 1, "day": 1, "hour": 0, "minute": 0},
+    "@annually": {"month": 1, "day": 1, "hour": 0, "minute": 0},
+    "* * * * *": {"minute": "*"},
+    "*/5 * * * *": {"minute": "*/5"},
+    "0 * * * *": {"minute": 0},
+    "0 0 * * *": {"hour": 0, "minute": 0},
+}
+
+# Application context used by persisted feed jobs (set by schedule_feed_jobs)
+_app_context: Optional[Any] = None
+
+# Generated job IDs are a per-process token plus a sequence number. The counter
+# alone restarts at 0 in every process, and with a persistent job store a
+# restarted process would then overwrite jobs persisted by an earlier one.
+_job_id_token = uuid.uuid4().hex[:8]
+_job_sequence = itertools.count()
+
+# monitor.main.process_feed, resolved on first use (see _get_process_feed)
+_process_feed: Optional[Callable[..., Awaitable[Any]]] = None
+
+
+@lru_cache(maxsize=256)
+def _build_cron_trigger(cron_expression: str, timezone: Optional[str]) -> CronTrigger:
+    """
+    Parse a crontab expression into a trigger, reusing earlier parses.
+
+    Triggers are immutable, so jobs sharing a schedule can share one instance.
+
+    Args:
+        cron_expression: Crontab expression with single-space separated fields,
+            or a keyword such as "@daily"
+        timezone: Timezone for the cron expression
+
+    Returns:
+        CronTrigger: The parsed trigger
+    """
+    fields = _CRON_SHORTCUTS.get(cron_expression.lower())
+    if fields is not None:
+        return CronTrigger(timezone=timezone, **fields)
+    return CronTrigger.from_crontab(cron_expression, timezone=timezone)
+
+
+def _make_job_id(prefix: str, func: Callable) -> str:
+    """Generate a unique job ID for a function."""
+    return f"{prefix}_{func.__name__}_{_job_id_token}_{next(_job_sequence)}"
+
+
+def _get_process_feed() -> Callable[..., Awaitable[Any]]:
+    """Resolve monitor.main.process_feed once, lazily to avoid a circular import."""
+    global _process_feed
+
+    if _process_feed is None:
+        from monitor.main import process_feed
+        _process_feed = process_feed
+    return _process_feed
+
+
+async def run_feed_job(feed_name: str) -> None:
+    """
+    Entry point for scheduled feed monitoring jobs.
+
+    Jobs only carry the feed name so that they can be stored in a persistent
+    job store; the application context is resolved when the job runs.
+
+    Args:
+        feed_name: Name of the feed to process
+    """
+    if _app_context is None:
+        logger.error("App context not available for feed job", feed_name=feed_name)
+        return
+
+    await _get_process_feed()(_app_context, feed_name)
+
 
 def schedule_feed_jobs(scheduler: AsyncIOScheduler, feeds: List[FeedConfig]) -> None:
     """
@@ -26,57 +115,106 @@ def schedule_feed_jobs(scheduler: AsyncIOScheduler, feeds: List[FeedConfig]) ->
         scheduler: The APScheduler instance to use
         feeds: List of feed configurations to schedule
     """
+    global _app_context
+
     if not feeds:
         logger.warning("No feeds configured, no jobs will be scheduled")
         return
 
-    for feed in feeds:
-        if not feed.enabled:
-            logger.info("Feed disabled, skipping job scheduling", feed_name=feed.name)
-            continue
+    enabled_feeds = [feed for feed in feeds if feed.enabled]
+    disabled_count = len(feeds) - len(enabled_feeds)
+    if disabled_count:
+        logger.info("Skipping disabled feeds", count=disabled_count)
+    if not enabled_feeds:
+        logger.warning("No enabled feeds, no jobs will be scheduled")
+        return
 
-        # Create a job ID based on the feed name
-        job_id = f"feed_monitor_{feed.name}"
+    # Feed jobs resolve the app context when they run
+    app_context = getattr(scheduler, "app_context", None)
+    if not app_context:
+        logger.error("App context not available in scheduler, no jobs will be scheduled")
+        return
+    _app_context = app_context
+
+    # One scan of the job stores instead of a get_job lookup per feed
+    existing_jobs = {job.id: job for job in scheduler.get_jobs()}
+
+    # New jobs start soon but not immediately
+    start_at = datetime.now() + timedelta(seconds=10)
+
+    # Pause a running scheduler while jobs are added so that it wakes up once
+    # on resume instead of once per feed
+    pause = scheduler.state == STATE_RUNNING
+    if pause:
+        scheduler.pause()
+    try:
+        for feed in enabled_feeds:
+            # Create a job ID based on the feed name
+            job_id = get_feed_job_id(feed.name)
+
+            # An existing job with the same ID is replaced by add_job below;
+            # keep its next run time so that a persisted schedule survives restarts
+            next_run_time = start_at
+            existing_job = existing_jobs.get(job_id)
+            if existing_job and getattr(existing_job, "next_run_time", None):
+                logger.debug("Replacing existing job", job_id=job_id)
+                next_run_time = existing_job.next_run_time
+
+            # Schedule the job with the appropriate interval
+            interval_minutes = max(1, feed.check_interval_minutes)  # Ensure at least 1 minute
+
+            # Schedule the job
+            scheduler.add_job(
+                run_feed_job,
+                trigger=IntervalTrigger(minutes=interval_minutes),
+                args=[feed.name],
+                id=job_id,
+                name=f"Monitor {feed.name}",
+                replace_existing=True,
+                next_run_time=next_run_time,
+                misfire_grace_time=300,  # Allow 5 minutes of misfire grace time
+                max_instances=1,  # Only one instance of each job can run at a time
+                coalesce=True,  # Coalesce missed runs
+            )
+
+            logger.info(
+                "Scheduled feed monitoring job",
+                feed_name=feed.name,
+                interval_minutes=interval_minutes,
+                job_id=job_id
+            )
+    finally:
+        if pause:
+            scheduler.resume()
+
+
+def prune_stale_feed_jobs(scheduler: AsyncIOScheduler, feeds: List[FeedConfig]) -> int:
+    """
+    Remove feed monitoring jobs for feeds that are no longer enabled.
 
-        # Remove any existing job with the same ID
-        existing_job = scheduler.get_job(job_id)
-        if existing_job:
-            logger.debug("Removing existing job", job_id=job_id)
-            scheduler.remove_job(job_id)
+    Persistent job stores keep jobs across restarts, so feeds that were removed
+    from (or disabled in) the configuration must be dropped explicitly to keep
+    the store bounded.
 
-        # Schedule the job with the appropriate interval
-        interval_minutes = max(1, feed.check_interval_minutes)  # Ensure at least 1 minute
+    Args:
+        scheduler: The APScheduler instance to use
+        feeds: List of feed configurations currently configured
 
-        # Import here to avoid circular imports
-        from monitor.main import process_feed
+    Returns:
+        int: Number of jobs removed
+    """
+    wanted = {get_feed_job_id(feed.name) for feed in feeds if feed.enabled}
 
-        # Get the app context from the scheduler's metadata
-        app_context = scheduler.app_context if hasattr(scheduler, "app_context") else None
-
-        if not app_context:
-            logger.error("App context not available in scheduler", feed_name=feed.name)
-            continue
-
-        # Schedule the job
-        scheduler.add_job(
-            process_feed,
-            trigger=IntervalTrigger(minutes=interval_minutes),
-            args=[app_context, feed.name],
-            id=job_id,
-            name=f"Monitor {feed.name}",
-            replace_existing=True,
-            next_run_time=datetime.now() + timedelta(seconds=10),  # Start soon but not immediately
-            misfire_grace_time=300,  # Allow 5 minutes of misfire grace time
-            max_instances=1,  # Only one instance of each job can run at a time
-            coalesce=True,  # Coalesce missed runs
-        )
-
-        logger.info(
-            "Scheduled feed monitoring job",
-            feed_name=feed.name,
-            interval_minutes=interval_minutes,
-            job_id=job_id
-        )
+    removed = 0
+    for job in scheduler.get_jobs():
+        if job.id.startswith(FEED_JOB_PREFIX) and job.id not in wanted:
+            scheduler.remove_job(job.id)
+            removed += 1
+
+    if removed:
+        logger.info("Removed stale feed monitoring jobs", count=removed)
+
+    return removed
 
 
 def schedule_one_time_job(
@@ -112,7 +250,7 @@ def schedule_one_time_job(
 
     # Generate a job ID if not provided
     if job_id is None:
-        job_id = f"one_time_{func.__name__}_{datetime.now().timestamp()}"
+        job_id = _make_job_id("one_time", func)
 
     # Schedule the job
     scheduler.add_job(
@@ -152,6 +290,7 @@ def schedule_cron_job(
         scheduler: The APScheduler instance to use
         func: The function to run
         cron_expression: Cron expression (e.g., "0 */6 * * *" for every 6 hours)
+            or a keyword such as "@hourly" or "@daily"
         args: Positional arguments to pass to the function
         kwargs: Keyword arguments to pass to the function
         job_id: Optional job ID, will be generated if not provided
@@ -162,10 +301,11 @@ def schedule_cron_job(
     """
     # Generate a job ID if not provided
     if job_id is None:
-        job_id = f"cron_{func.__name__}_{datetime.now().timestamp()}"
+        job_id = _make_job_id("cron", func)
 
-    # Parse the cron expression
-    trigger = CronTrigger.from_crontab(cron_expression, timezone=timezone)
+    # Parse the cron expression, normalizing whitespace so equivalent
+    # spellings share a cached trigger
+    trigger = _build_cron_trigger(" ".join(cron_expression.split()), timezone)
 
     # Schedule the job
     scheduler.add_job(
@@ -290,18 +430,16 @@ def get_all_jobs(scheduler: AsyncIOScheduler) -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of job information dictionaries
     """
-    jobs = []
-    for job in scheduler.get_jobs():
-        next_run = job.next_run_time.isoformat() if job.next_run_time else None
-        jobs.append({
+    return [
+        {
             "id": job.id,
             "name": job.name,
             "function": job.func.__name__,
-            "next_run_time": next_run,
+            "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
             "trigger": str(job.trigger),
-        })
-
-    return jobs
+        }
+        for job in scheduler.get_jobs()
+    ]
 
 
 def get_feed_job_id(feed_name: str) -> str:
@@ -314,4 +452,4 @@ def get_feed_job_id(feed_name: str) -> str:
     Returns:
         str: The job ID
     """
-    return f"feed_monitor_{feed_name}"
+    return f"{FEED_JOB_PREFIX}{feed_name}"
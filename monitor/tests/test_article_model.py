@@ -0,0 +1,45 @@
+from monitor.models import ArticleContent
+
+
+def _make_article(**overrides):
+    fields = dict(url="https://example.com/a", title="Title", text="Body", html="", word_count=1)
+    fields.update(overrides)
+    return ArticleContent(**fields)
+
+
+def test_cache_key_is_memoized_and_follows_updates():
+    article = _make_article()
+    key = article.to_cache_key()
+
+    assert key == f"article_content:{article.generate_id()}"
+    assert _make_article().to_cache_key() == key
+    assert article.model_copy(update={"title": "Other"}).to_cache_key() != key
+
+
+def test_resolve_relative_urls():
+    article = _make_article(image_urls=["/img/a.png"])
+
+    resolved = article.resolve_relative_urls("https://example.com/posts/1")
+
+    assert resolved.image_urls == ["https://example.com/img/a.png"]
+    assert resolved.resolve_relative_urls("https://example.com/") is resolved
+
+
+def test_validate_many():
+    from monitor.models import BlogPost
+
+    posts = BlogPost.validate_many(
+        [
+            {
+                "id": str(i),
+                "url": f"https://example.com/{i}",
+                "title": f"T{i}",
+                "source": "s",
+                "tags": ["B", "a"],
+            }
+            for i in range(3)
+        ]
+    )
+
+    assert [p.id for p in posts] == ["0", "1", "2"]
+    assert posts[0].tags == ["a", "b"]
@@ -36,7 +36,8 @@ async def test_extract_article_content():
         mock_client_cls.return_value.__aenter__.return_value = mock_client
 
         mock_response = MagicMock()
-        mock_response.text = SAMPLE_HTML
+        mock_response.content = SAMPLE_HTML.encode()
+        mock_response.charset_encoding = None
         mock_response.raise_for_status = MagicMock()
 
         mock_client.get.return_value = mock_response
@@ -55,3 +56,68 @@ async def test_extract_article_content():
         assert content.title == "Test Article"
         assert "This is a paragraph." in content.text
         assert str(content.url) == "http://example.com/article"
+
+
+@pytest.mark.asyncio
+async def test_extract_article_content_with_process_pool():
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    mock_cache = MagicMock()
+    mock_cache.get = AsyncMock(return_value=None)
+    mock_cache.set = AsyncMock(return_value=True)
+
+    thread_pool = ThreadPoolExecutor(max_workers=1)
+    process_pool = ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        content = await extract_article_content(
+            "http://example.com/article",
+            mock_cache,
+            thread_pool,
+            html_content=SAMPLE_HTML,
+            process_pool=process_pool,
+        )
+    finally:
+        process_pool.shutdown()
+        thread_pool.shutdown()
+
+    assert content.title == "Test Article"
+    assert "This is a paragraph." in content.text
+
+
+def test_parse_html_collects_images_before_cleaning():
+    from monitor.extractor.article_parser import _parse_html
+
+    title, _, text, image_urls, _ = _parse_html(SAMPLE_HTML, "http://example.com/a/b")
+
+    assert title == "Test Article"
+    assert text.startswith("Test Article Title This is a paragraph.")
+    assert image_urls == ["http://example.com/a/image.jpg"]
+
+
+@pytest.mark.parametrize(
+    "raw, encoding",
+    [
+        ('<meta charset="iso-8859-1"><p>caf\u00e9</p>'.encode("latin-1"), None),
+        ("<p>caf\u00e9</p>".encode("latin-1"), "latin-1"),
+        ("\ufeff<p>caf\u00e9</p>".encode("utf-8"), "latin-1"),
+        ("<p>caf\u00e9</p>".encode("utf-8"), None),
+    ],
+)
+def test_decode_html_sniffs_encoding(raw, encoding):
+    from monitor.extractor.article_parser import _decode_html
+
+    assert "caf\u00e9" in _decode_html(raw, encoding)
+
+
+def test_clean_article_text_drops_noise_and_comments():
+    from monitor.extractor.article_parser import clean_article_text
+
+    html = (
+        "<div><aside><figure><img src='x.png'></figure>sidebar</aside>"
+        "<p>Hello <!-- hidden --> world</p><script>var x;</script>tail</div>"
+    )
+
+    assert clean_article_text(html) == "Hello world tail"
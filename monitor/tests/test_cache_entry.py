@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from monitor.models import CacheEntry
+from monitor.models.cache_entry import ValueType
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        CacheEntry.create_string_entry("k", "v", ttl_seconds=60),
+        CacheEntry(key="k", value_type=ValueType.BYTES, value=b"\x00__BINARY_SEPARATOR__\x01"),
+        CacheEntry.create_json_entry("k", {"nested": [1, "two"]}),
+        CacheEntry(key="k", value_type=ValueType.PICKLE, value={"a": (1, 2)}),
+    ],
+)
+def test_serialize_round_trip(entry):
+    restored = CacheEntry.deserialize(entry.serialize())
+
+    assert restored.value_type is entry.value_type
+    assert restored.value == entry.value
+    assert isinstance(restored.created_at, datetime)
+    assert restored.created_at == entry.created_at
+    assert restored.expires_at == entry.expires_at
+    assert not restored.is_expired()
+
+
+def test_deserialize_validates_untrusted_data():
+    header = b'{"key": "k", "value_type": "string", "value": "v", "access_count": "3"}'
+
+    entry = CacheEntry.deserialize(len(header).to_bytes(4, "little") + header)
+
+    assert entry.value_type is ValueType.STRING
+    assert entry.access_count == 3
+
+
+def test_naive_timestamp_strings_are_parsed_as_utc():
+    entry = CacheEntry.model_validate(
+        {"key": "k", "value_type": "string", "value": "v", "created_at": "2024-01-02T00:00:00"}
+    )
+
+    assert entry.created_at == datetime(2024, 1, 2, tzinfo=timezone.utc)
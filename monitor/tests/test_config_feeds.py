@@ -0,0 +1,52 @@
+from monitor.config import EmbeddingConfig, FeedConfig, Settings
+
+
+def _settings(feeds):
+    return Settings(
+        _env_file=None,
+        embedding=EmbeddingConfig(text_model_type="custom"),
+        feeds=feeds,
+    )
+
+
+def test_get_feed_by_name():
+    settings = _settings([
+        FeedConfig(name="A", url="https://example.com/a"),
+        FeedConfig(name="B", url="https://example.com/b"),
+    ])
+    assert settings.get_feed_by_name("B").name == "B"
+    assert settings.get_feed_by_name("missing") is None
+
+
+def test_get_feed_by_name_after_feeds_reassigned():
+    feed_a = FeedConfig(name="A", url="https://example.com/a")
+    feed_b = FeedConfig(name="B", url="https://example.com/b")
+    settings = _settings([feed_a, feed_b])
+    assert settings.get_feed_by_name("A") is feed_a
+
+    settings.feeds = [feed_b]
+    assert settings.get_feed_by_name("A") is None
+    assert settings.get_feed_by_name("B") is feed_b
+
+
+def test_get_feed_by_name_after_feeds_edited_in_place():
+    feed_a = FeedConfig(name="A", url="https://example.com/a")
+    feed_b = FeedConfig(name="B", url="https://example.com/b")
+    feed_c = FeedConfig(name="C", url="https://example.com/c")
+    settings = _settings([feed_a, feed_b])
+    assert settings.get_feed_by_name("B") is feed_b
+
+    settings.feeds.append(feed_c)
+    assert settings.get_feed_by_name("C") is feed_c
+
+    settings.feeds.remove(feed_a)
+    assert settings.get_feed_by_name("A") is None
+    assert settings.get_feed_by_name("B") is feed_b
+
+    feed_b.name = "Renamed"
+    assert settings.get_feed_by_name("B") is None
+    assert settings.get_feed_by_name("Renamed") is feed_b
+
+    settings.feeds[:] = [feed_c, feed_a]
+    assert settings.get_feed_by_name("A") is feed_a
+    assert settings.get_feed_by_name("Renamed") is None
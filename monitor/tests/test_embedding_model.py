@@ -0,0 +1,201 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from monitor.models import EmbeddingRecord
+
+
+def _record(**kwargs):
+    fields = {
+        "id": "abc",
+        "url": "https://example.com/post",
+        "title": "Post",
+        "text_embedding": [0.1, 0.2, 0.3],
+    }
+    fields.update(kwargs)
+    return EmbeddingRecord(**fields)
+
+
+def test_embeddings_are_stored_as_float32_arrays():
+    record = _record(image_embedding=[1, 2])
+    assert isinstance(record.text_embedding, np.ndarray)
+    assert record.text_embedding.dtype == np.float32
+    assert record.image_embedding.dtype == np.float32
+    assert record.get_text_vector_dimension() == 3
+
+
+def test_embeddings_serialize_as_lists():
+    dumped = _record().model_dump(mode="json")
+    assert dumped["text_embedding"] == pytest.approx([0.1, 0.2, 0.3])
+    payload = _record().to_vector_db_payload()
+    assert isinstance(payload["vectors"]["text"], list)
+    assert payload["vectors"]["text"] == pytest.approx([0.1, 0.2, 0.3])
+    assert payload["payload"]["url"] == "https://example.com/post"
+    assert payload["payload"]["embedding_created_at"].endswith("+00:00")
+
+
+def test_vector_db_payload_matches_bytes_layout():
+    import orjson
+
+    record = _record(image_embedding=[1, 2], metadata={"tags": ["a"]}).quantize()
+
+    payload = record.to_vector_db_payload()
+    decoded = orjson.loads(record.to_vector_db_bytes())
+
+    assert payload["payload"] == decoded["payload"]
+    assert payload["vectors"].keys() == decoded["vectors"].keys()
+    for name, vector in decoded["vectors"].items():
+        assert payload["vectors"][name] == pytest.approx(vector, rel=1e-6)
+
+
+def test_vector_db_payload_keeps_non_json_metadata():
+    tags = {"a", "b"}
+
+    payload = _record(metadata={"tags": tags}).to_vector_db_payload()
+
+    assert payload["payload"]["metadata"]["tags"] is tags
+
+
+@pytest.mark.parametrize("bad", [[], [0.1, float("nan")], [float("inf")], [[0.1], [0.2]]])
+def test_invalid_embeddings_rejected(bad):
+    with pytest.raises(ValidationError):
+        _record(text_embedding=bad)
+
+
+def test_similarity_score():
+    a = _record(text_embedding=[1.0, 0.0])
+    b = _record(text_embedding=[1.0, 0.0])
+    c = _record(text_embedding=[0.0, 1.0])
+    assert a.get_similarity_score(b) == pytest.approx(1.0)
+    assert a.get_similarity_score(c) == pytest.approx(0.0)
+    assert a.get_similarity_score(b, mode="image") == 0.0
+
+
+def test_cosine_similarity_matches_numpy_fallback(monkeypatch):
+    import monitor.models.embedding as embedding_module
+
+    rng = np.random.default_rng(0)
+    a, b = rng.standard_normal((2, 384)).astype(np.float32)
+    fast = EmbeddingRecord._cosine_similarity(a, b)
+    monkeypatch.setattr(embedding_module, "simsimd", None)
+
+    assert fast == pytest.approx(EmbeddingRecord._cosine_similarity(a, b), abs=1e-5)
+    assert EmbeddingRecord._cosine_similarity(np.zeros(3), np.ones(3)) == 0.0
+
+
+def test_quantize_int8_round_trip():
+    vector = np.linspace(-1.0, 1.0, 64, dtype=np.float32)
+    record = _record(text_embedding=vector)
+    quantized = record.quantize()
+
+    assert quantized.is_quantized
+    assert quantized.text_embedding.dtype == np.int8
+    np.testing.assert_allclose(quantized.get_text_vector(), vector, atol=1 / 127)
+    assert quantized.get_similarity_score(record) == pytest.approx(1.0, abs=1e-3)
+
+    restored = EmbeddingRecord.model_validate(quantized.model_dump(mode="json"))
+    assert restored.text_embedding.dtype == np.int8
+    assert restored.dequantize().text_embedding.dtype == np.float32
+
+
+def test_int8_similarity_approximates_exact():
+    rng = np.random.default_rng(1)
+    a = _record(text_embedding=rng.standard_normal(384))
+    b = _record(text_embedding=rng.standard_normal(384) + a.text_embedding)
+
+    exact = a.get_similarity_score(b)
+    assert a.get_similarity_score(b, precision="i8") == pytest.approx(exact, abs=1e-2)
+
+    updated = a.model_copy(update={"text_embedding": b.text_embedding})
+    assert updated.get_similarity_score(b, precision="i8") == pytest.approx(1.0, abs=1e-3)
+    assert updated.get_similarity_score(b) == pytest.approx(1.0)
+
+
+def test_batch_similarity_matches_pairwise():
+    rng = np.random.default_rng(2)
+    query = _record(text_embedding=rng.standard_normal(64))
+    records = [_record(text_embedding=rng.standard_normal(64)) for _ in range(5)]
+
+    scores = EmbeddingRecord.batch_similarity(query, records)
+
+    np.testing.assert_allclose(
+        scores, [query.get_similarity_score(r) for r in records], atol=1e-5
+    )
+    assert EmbeddingRecord.batch_similarity(query, []).shape == (0,)
+
+
+def test_from_trusted_coerces_vectors_without_validation():
+    import warnings
+
+    row = {
+        "id": "abc",
+        "url": "https://EXAMPLE.com/post",
+        "title": "Post",
+        "text_embedding": [0.1, 0.2, 0.3],
+        "image_embedding": None,
+    }
+    record = EmbeddingRecord.from_trusted(row)
+
+    assert record.text_embedding.dtype == np.float32
+    assert record.get_similarity_score(_record()) == pytest.approx(1.0)
+    assert record.metadata == {}
+    assert str(record.url) == "https://example.com/post"
+    assert row["text_embedding"] == [0.1, 0.2, 0.3]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert record.to_dict()["url"] == "https://example.com/post"
+
+
+def test_content_hash_tracks_text_embedding():
+    record = _record()
+    assert record.content_hash() == _record(title="Other").content_hash()
+
+    new_vector = np.array([0.3, 0.2, 0.1], dtype=np.float32)
+    updated = record.model_copy(update={"text_embedding": new_vector})
+    assert updated.content_hash() != record.content_hash()
+
+    record.text_embedding = [0.3, 0.2, 0.1]
+    assert record.content_hash() == updated.content_hash()
+
+
+def test_normalized_records_compare_by_dot_product():
+    a = EmbeddingRecord.from_text_embedding(
+        "a", "https://example.com/a", "A", [3.0, 4.0], normalize=True
+    )
+    b = EmbeddingRecord.from_text_embedding(
+        "b", "https://example.com/b", "B", [4.0, 3.0], normalize=True
+    )
+
+    assert a.text_embedding_normalized
+    np.testing.assert_allclose(a.text_embedding, [0.6, 0.8], rtol=1e-6)
+    assert a.get_similarity_score(b) == pytest.approx(0.96)
+    assert a.get_similarity_score(_record(text_embedding=[4.0, 3.0])) == pytest.approx(0.96)
+
+    a.text_embedding = [6.0, 8.0]
+    assert not a.text_embedding_normalized
+    assert a.get_similarity_score(b) == pytest.approx(0.96)
+    assert not a.quantize().text_embedding_normalized
+
+
+@pytest.mark.parametrize("k", [0, 2, 5, 10])
+def test_similarity_topk_matches_full_sort(k):
+    rng = np.random.default_rng(3)
+    query = _record(text_embedding=rng.standard_normal(32))
+    records = [_record(id=str(i), text_embedding=rng.standard_normal(32)) for i in range(5)]
+
+    top = EmbeddingRecord.similarity_topk(query, records, k)
+
+    expected = sorted(records, key=query.get_similarity_score, reverse=True)[:k]
+    assert [r.id for r, _ in top] == [r.id for r in expected]
+    assert all(isinstance(score, float) for _, score in top)
+
+
+def test_records_compare_by_value():
+    created = {"embedding_created_at": "2024-01-01T00:00:00+00:00"}
+    record = _record(image_embedding=[1, 2], **created)
+
+    assert record == _record(image_embedding=[1, 2], **created)
+    assert record != _record(image_embedding=[1, 3], **created)
+    assert record != _record(**created)
+    assert record != _record(image_embedding=[1, 2], title="Other", **created)
+    assert record != "abc"
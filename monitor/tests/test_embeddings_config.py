@@ -1,3 +1,5 @@
+import pytest
+
 from monitor.config import EmbeddingConfig
 from monitor.embeddings import DummyEmbeddingClient
 
@@ -14,3 +16,68 @@ def test_dummy_embedding_uses_configured_dimensions():
     assert client.text_dim == 1536
     assert client.image_dim == 256
 
+
+
+def test_truncate_text_bounds_input_tokens():
+    cfg = EmbeddingConfig(text_model_type='custom', max_input_tokens=16)
+    client = DummyEmbeddingClient(cfg)
+    assert client.truncate_text("short") == "short"
+
+    truncated = client.truncate_text("word " * 1000)
+    assert len(truncated) < len("word " * 1000)
+    assert len(truncated) <= 16 * 4
+
+
+def test_truncate_text_disabled():
+    cfg = EmbeddingConfig(text_model_type='custom', max_input_tokens=None)
+    client = DummyEmbeddingClient(cfg)
+    text = "word " * 1000
+    assert client.truncate_text(text) == text
+
+
+def _status_error(status_code):
+    import httpx
+
+    request = httpx.Request("POST", "http://localhost/embed")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_retries_transient_errors():
+    from tenacity import wait_none
+
+    client = DummyEmbeddingClient(EmbeddingConfig(text_model_type='custom', embedding_dimensions=4))
+    client.retry_wait = wait_none()
+    original = client._embed_text_batch
+    calls = []
+
+    async def _flaky(texts):
+        calls.append(texts)
+        if len(calls) == 1:
+            raise _status_error(503)
+        return await original(texts)
+
+    client._embed_text_batch = _flaky
+    assert len(await client.embed_texts(["a", "b"])) == 2
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_does_not_retry_client_errors():
+    import httpx
+    from tenacity import wait_none
+
+    client = DummyEmbeddingClient(EmbeddingConfig(text_model_type='custom', embedding_dimensions=4))
+    client.retry_wait = wait_none()
+    calls = []
+
+    async def _bad_request(texts):
+        calls.append(texts)
+        raise _status_error(400)
+
+    client._embed_text_batch = _bad_request
+    with pytest.raises(httpx.HTTPStatusError, match="error") as excinfo:
+        await client.embed_texts(["a"])
+    assert excinfo.value.response.status_code == 400
+    assert len(calls) == 1
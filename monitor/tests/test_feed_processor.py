@@ -46,3 +46,31 @@ async def test_feed_processor_fingerprint():
     fingerprint = await processor.get_feed_fingerprint(b"test content")
     assert isinstance(fingerprint, str)
     assert len(fingerprint) > 0
+
+
+@pytest.mark.asyncio
+async def test_discover_new_posts_filters_seen_and_repeated_posts():
+    from monitor.cache.memory import MemoryCacheClient
+    from monitor.config import CacheConfig
+    from monitor.feeds.base import POST_CACHE_PREFIX, discover_new_posts
+
+    class RepeatingFeedProcessor(MockFeedProcessor):
+        async def extract_posts(self, entries):
+            return [
+                BlogPost(
+                    id=post_id,
+                    url=f"http://example.com/{post_id}",
+                    title=post_id,
+                    source="Test Feed",
+                )
+                for post_id in ["a", "b", "a", "c"]
+            ]
+
+    cache = MemoryCacheClient(CacheConfig(backend="memory"))
+    await cache.set(f"{POST_CACHE_PREFIX}b", "1")
+    processor = RepeatingFeedProcessor(FeedConfig(name="Test Feed", url="http://example.com/rss"))
+
+    new_posts = await discover_new_posts(processor, cache)
+
+    assert [post.id for post in new_posts] == ["a", "c"]
+    assert await cache.exists(f"{POST_CACHE_PREFIX}c")
@@ -0,0 +1,397 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from monitor.config import EmbeddingConfig, EmbeddingModelType, VectorDBConfig
+from monitor.embeddings import DummyEmbeddingClient
+from monitor.main import embed_posts
+from monitor.vectordb import InMemoryVectorDBClient
+
+
+def _make_app_context():
+    embedding_config = EmbeddingConfig(
+        text_model_type=EmbeddingModelType.CUSTOM,
+        embedding_dimensions=8,
+    )
+    return SimpleNamespace(
+        settings=SimpleNamespace(embedding=embedding_config),
+        cache_client=None,
+        browser_pool=None,
+        active_tasks=set(),
+        embedding_client=DummyEmbeddingClient(embedding_config),
+        vector_db_client=InMemoryVectorDBClient(VectorDBConfig(text_vector_dimension=8)),
+    )
+
+
+def _make_item(i):
+    post = SimpleNamespace(
+        id=f"post-{i}",
+        url=f"https://example.com/{i}",
+        title=f"Post {i}",
+        publish_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        source="Example",
+    )
+    content = SimpleNamespace(
+        text=f"body {i}", author=None, summary=None, word_count=2, tags=[]
+    )
+    return post, content, None
+
+
+@pytest.mark.asyncio
+async def test_embed_posts_embeds_in_one_batch():
+    app_context = _make_app_context()
+    calls = []
+    original = app_context.embedding_client.embed_texts
+
+    async def _tracking_embed_texts(texts):
+        calls.append(list(texts))
+        return await original(texts)
+
+    app_context.embedding_client.embed_texts = _tracking_embed_texts
+
+    items = [_make_item(i) for i in range(3)]
+    records = await embed_posts(app_context, items)
+
+    assert calls == [["body 0", "body 1", "body 2"]]
+    assert [r.id for r in records] == ["post-0", "post-1", "post-2"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("full_content_capture", [False, True])
+async def test_process_feed_pipelines_posts_into_vector_db(full_content_capture):
+    from unittest.mock import AsyncMock, patch
+
+    from monitor.config import ArticleProcessingConfig, FeedConfig
+    from monitor.main import process_feed
+
+    app_context = _make_app_context()
+    feed = FeedConfig(name="Example", url="https://example.com/rss")
+    app_context.settings.get_feed_by_name = lambda name: feed if name == "Example" else None
+    app_context.settings.max_concurrent_tasks = 2
+    app_context.settings.article_processing = ArticleProcessingConfig(
+        full_content_capture=full_content_capture,
+        archive_html=False,
+        archive_screenshots=False,
+    )
+    captured = []
+
+    async def _fake_capture(post, cache_client, browser_pool):
+        captured.append(post.id)
+        return post
+
+    items = {f"post-{i}": _make_item(i) for i in range(5)}
+    posts = [item[0] for item in items.values()]
+
+    async def _fake_extract(app_context, post):
+        if post.id == "post-3":
+            raise RuntimeError("render failed")
+        return items[post.id]
+
+    with patch("monitor.main.process_feed_posts", AsyncMock(return_value=posts)), \
+            patch("monitor.main.extract_post", _fake_extract), \
+            patch("monitor.main.process_individual_article", _fake_capture):
+        await process_feed(app_context, "Example")
+
+    stored = app_context.vector_db_client.records
+    assert sorted(stored) == ["post-0", "post-1", "post-2", "post-4"]
+    assert len(captured) == (5 if full_content_capture else 0)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_in_flight_jobs_then_cancels():
+    import asyncio
+
+    from monitor.main import AppContext
+
+    settings = SimpleNamespace(scheduler=SimpleNamespace(shutdown_grace_seconds=0.2))
+    app_context = AppContext(settings)
+
+    finished = asyncio.create_task(asyncio.sleep(0.01))
+    stuck = asyncio.create_task(asyncio.sleep(60))
+    app_context.active_tasks.update({finished, stuck})
+
+    await app_context.shutdown()
+
+    assert app_context.shutdown_event.is_set()
+    assert finished.done() and not finished.cancelled()
+    assert stuck.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_forced_shutdown_still_releases_resources():
+    import asyncio
+    from unittest.mock import MagicMock
+
+    from monitor.main import AppContext
+
+    settings = SimpleNamespace(scheduler=SimpleNamespace(shutdown_grace_seconds=60))
+    app_context = AppContext(settings)
+    closed = []
+    app_context.exit_stack.callback(closed.append, "components")
+    app_context.thread_pool = MagicMock()
+    app_context.process_pool = MagicMock()
+
+    stuck = asyncio.create_task(asyncio.sleep(60))
+    app_context.active_tasks.add(stuck)
+
+    shutdown = asyncio.create_task(app_context.shutdown())
+    await asyncio.sleep(0.01)
+    shutdown.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await shutdown
+    await asyncio.sleep(0)
+
+    assert closed == ["components"]
+    assert stuck.cancelled()
+    app_context.thread_pool.shutdown.assert_called_once()
+    app_context.process_pool.shutdown.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_init_unwinds_entered_components():
+    import asyncio
+
+    from monitor.main import AppContext
+
+    app_context = AppContext(SimpleNamespace())
+    events = []
+
+    class _Component:
+        def __init__(self, name, enter_delay=0.0):
+            self.name = name
+            self.enter_delay = enter_delay
+
+        async def __aenter__(self):
+            await asyncio.sleep(self.enter_delay)
+            events.append(("enter", self.name))
+            return self
+
+        async def __aexit__(self, *exc_info):
+            events.append(("exit", self.name))
+
+    async def _fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("embedding backend unavailable")
+
+    async def _noop():
+        pass
+
+    app_context._init_cache = lambda: app_context._enter_context(_Component("cache"))
+    app_context._init_browser_pool = lambda: app_context._enter_context(
+        _Component("browser", enter_delay=60)
+    )
+    app_context._init_embedding_client = _fail
+    app_context._init_vector_db = _noop
+
+    with pytest.raises(ExceptionGroup):
+        await app_context._init_components()
+
+    assert sorted(events) == [("enter", "cache"), ("exit", "browser"), ("exit", "cache")]
+
+
+@pytest.mark.asyncio
+async def test_process_feed_skips_posts_with_unchanged_content():
+    from unittest.mock import AsyncMock, patch
+
+    from monitor.cache.memory import MemoryCacheClient
+    from monitor.config import ArticleProcessingConfig, CacheConfig, FeedConfig
+    from monitor.main import process_feed
+    from monitor.models.article import hash_text
+
+    app_context = _make_app_context()
+    app_context.cache_client = MemoryCacheClient(CacheConfig(backend="memory"))
+    feed = FeedConfig(name="Example", url="https://example.com/rss")
+    app_context.settings.get_feed_by_name = lambda name: feed
+    app_context.settings.max_concurrent_tasks = 2
+    app_context.settings.article_processing = ArticleProcessingConfig(
+        full_content_capture=False,
+        archive_html=False,
+        archive_screenshots=False,
+    )
+
+    items = {f"post-{i}": _make_item(i) for i in range(3)}
+    posts = [item[0] for item in items.values()]
+    await app_context.cache_client.set("contenthash:post-1", hash_text("body 1"))
+
+    async def _fake_extract(app_context, post):
+        return items[post.id]
+
+    with patch("monitor.main.process_feed_posts", AsyncMock(return_value=posts)), \
+            patch("monitor.main.extract_post", _fake_extract):
+        await process_feed(app_context, "Example")
+
+    assert sorted(app_context.vector_db_client.records) == ["post-0", "post-2"]
+    assert await app_context.cache_client.get("contenthash:post-0") == hash_text("body 0")
+
+
+@pytest.mark.asyncio
+async def test_process_feed_does_not_record_hashes_for_failed_upserts():
+    from unittest.mock import AsyncMock, patch
+
+    from monitor.cache.memory import MemoryCacheClient
+    from monitor.config import ArticleProcessingConfig, CacheConfig, FeedConfig
+    from monitor.main import process_feed
+
+    app_context = _make_app_context()
+    app_context.cache_client = MemoryCacheClient(CacheConfig(backend="memory"))
+    app_context.vector_db_client.upsert_batch = AsyncMock(return_value=False)
+    feed = FeedConfig(name="Example", url="https://example.com/rss")
+    app_context.settings.get_feed_by_name = lambda name: feed
+    app_context.settings.max_concurrent_tasks = 2
+    app_context.settings.article_processing = ArticleProcessingConfig(
+        full_content_capture=False,
+        archive_html=False,
+        archive_screenshots=False,
+    )
+
+    items = {f"post-{i}": _make_item(i) for i in range(2)}
+    posts = [item[0] for item in items.values()]
+
+    async def _fake_extract(app_context, post):
+        return items[post.id]
+
+    with patch("monitor.main.process_feed_posts", AsyncMock(return_value=posts)), \
+            patch("monitor.main.extract_post", _fake_extract):
+        await process_feed(app_context, "Example")
+
+    assert app_context.vector_db_client.upsert_batch.await_count == 1
+    assert await app_context.cache_client.get("contenthash:post-0") is None
+    assert await app_context.cache_client.get("contenthash:post-1") is None
+
+
+@pytest.mark.asyncio
+async def test_embed_posts_overlaps_text_and_image_batches():
+    import asyncio
+
+    app_context = _make_app_context()
+    app_context.settings.embedding = app_context.settings.embedding.model_copy(
+        update={"image_model_name": "clip"}
+    )
+    client = app_context.embedding_client
+    both_started = asyncio.Event()
+    started = set()
+
+    async def _embed(kind, inputs):
+        started.add(kind)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return [[1.0] * 8 for _ in inputs]
+
+    client.embed_texts = lambda texts: _embed("text", texts)
+    client.embed_images = lambda paths: _embed("image", paths)
+
+    post, content, _ = _make_item(0)
+    records = await embed_posts(app_context, [(post, content, "shot.png")])
+
+    assert records[0].image_embedding is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bad", [[float("nan")] * 8, [float("inf")] * 8, []])
+async def test_embed_posts_validates_backend_vectors(bad):
+    from pydantic import ValidationError
+
+    app_context = _make_app_context()
+
+    async def _embed_texts(texts):
+        return [[1.0] * 8, bad]
+
+    app_context.embedding_client.embed_texts = _embed_texts
+
+    with pytest.raises(ValidationError):
+        await embed_posts(app_context, [_make_item(0), _make_item(1)])
+
+
+def _persisted_feed_jobs(url, feeds=None):
+    """Optionally schedule feed jobs into a SQLite job store, then list its job IDs."""
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    from monitor.scheduler import schedule_feed_jobs
+
+    scheduler = BackgroundScheduler(jobstores={"default": SQLAlchemyJobStore(url=url)})
+    scheduler.app_context = SimpleNamespace()
+    scheduler.start(paused=True)
+    try:
+        if feeds:
+            schedule_feed_jobs(scheduler, feeds)
+            # Leave the jobs overdue, as if the daemon had been down for a while
+            for job in scheduler.get_jobs():
+                job.modify(next_run_time=datetime.now(timezone.utc))
+        return sorted(job.id for job in scheduler.get_jobs())
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def _sqlite_settings(tmp_path, feeds):
+    from monitor.config import SchedulerConfig, Settings
+
+    return Settings(
+        _env_file=None,
+        data_dir=tmp_path,
+        embedding=EmbeddingConfig(text_model_type="custom"),
+        scheduler=SchedulerConfig(job_store_type="sqlalchemy"),
+        parse_processes=0,
+        feeds=feeds,
+    )
+
+
+def test_once_with_feed_leaves_persisted_jobs_alone(tmp_path, monkeypatch):
+    import argparse
+
+    from monitor import main as main_module
+    from monitor.config import FeedConfig
+
+    feeds = [
+        FeedConfig(name="A", url="http://example.com/a/rss"),
+        FeedConfig(name="B", url="http://example.com/b/rss"),
+    ]
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite'}"
+    persisted = _persisted_feed_jobs(url, feeds)
+    processed = []
+
+    async def _noop(self):
+        pass
+
+    async def _record_process_feed(app_context, feed_name):
+        processed.append(feed_name)
+
+    monkeypatch.setattr(
+        main_module, "parse_args",
+        lambda: argparse.Namespace(config=None, once=True, feed="A", log_level=None),
+    )
+    monkeypatch.setattr(main_module, "load_settings", lambda: _sqlite_settings(tmp_path, feeds))
+    monkeypatch.setattr(main_module, "setup_logging", lambda settings: None)
+    monkeypatch.setattr(main_module.AppContext, "_init_components", _noop)
+    monkeypatch.setattr(main_module, "process_feed", _record_process_feed)
+
+    assert main_module.main() == 0
+
+    assert processed == ["A"]
+    assert len(persisted) == 2
+    assert _persisted_feed_jobs(url) == persisted
+
+
+@pytest.mark.asyncio
+async def test_narrowed_daemon_keeps_other_feeds_persisted_jobs(tmp_path):
+    from monitor.config import FeedConfig
+    from monitor.main import AppContext
+    from monitor.scheduler import get_feed_job_id
+
+    feeds = [
+        FeedConfig(name="A", url="http://example.com/a/rss"),
+        FeedConfig(name="B", url="http://example.com/b/rss"),
+    ]
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite'}"
+    persisted = _persisted_feed_jobs(url, feeds)
+
+    app_context = AppContext(_sqlite_settings(tmp_path, feeds[:1]), persist_jobs=False)
+    await app_context._init_scheduler()
+    try:
+        assert [job.id for job in app_context.scheduler.get_jobs()] == [get_feed_job_id("A")]
+    finally:
+        app_context.scheduler.shutdown(wait=False)
+
+    assert _persisted_feed_jobs(url) == persisted
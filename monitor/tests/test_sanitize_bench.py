@@ -0,0 +1,44 @@
+import pytest
+
+from monitor.feeds.base import _sanitize_summary, parse_feed_entries_sync
+
+pytest.importorskip("pytest_benchmark")
+
+# Timing runs are deselected by default; `make bench` runs them and compares
+# the results with the previous run saved under .benchmarks/
+pytestmark = pytest.mark.benchmark
+
+SMALL_HTML = (
+    "<p>We are <b>excited</b> to announce a new <a href='https://example.com'>release</a>."
+    "<script>track()</script></p>"
+)
+LARGE_HTML = "<div>" + "<p>Lorem ipsum <i>dolor</i> sit amet.</p>" * 2700 + "</div>"
+
+
+def _entries(summary, count=100):
+    return [
+        {"title": f"Post {i}", "link": f"https://example.com/{i}", "summary": f"{i} {summary}"}
+        for i in range(count)
+    ]
+
+
+def _run(benchmark, entries):
+    # Summaries differ per entry and the sanitizer cache is cleared each round,
+    # so every entry is actually parsed
+    posts = benchmark.pedantic(
+        parse_feed_entries_sync,
+        args=(entries, "Bench Feed", "https://example.com/feed"),
+        setup=_sanitize_summary.cache_clear,
+        rounds=20,
+        warmup_rounds=3,
+    )
+    assert len(posts) == len(entries)
+
+
+def test_bench_small(benchmark):
+    _run(benchmark, _entries(SMALL_HTML))
+
+
+def test_bench_large(benchmark):
+    assert len(LARGE_HTML) > 100_000
+    _run(benchmark, _entries(LARGE_HTML))
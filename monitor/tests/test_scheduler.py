@@ -0,0 +1,212 @@
+from types import SimpleNamespace
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from monitor.config import FeedConfig
+from monitor.scheduler import (
+    get_feed_job_id,
+    prune_stale_feed_jobs,
+    run_feed_job,
+    schedule_cron_job,
+    schedule_feed_jobs,
+)
+
+
+@pytest.mark.asyncio
+async def test_schedule_feed_jobs_uses_picklable_args():
+    scheduler = AsyncIOScheduler()
+    scheduler.app_context = SimpleNamespace()
+    scheduler.start(paused=True)
+    try:
+        feeds = [
+            FeedConfig(name="A", url="http://example.com/a/rss"),
+            FeedConfig(name="B", url="http://example.com/b/rss", enabled=False),
+        ]
+        schedule_feed_jobs(scheduler, feeds)
+
+        jobs = scheduler.get_jobs()
+        assert [job.id for job in jobs] == [get_feed_job_id("A")]
+        assert jobs[0].func is run_feed_job
+        assert jobs[0].args == ("A",)
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_schedule_feed_jobs_keeps_existing_next_run_time():
+    scheduler = AsyncIOScheduler()
+    scheduler.app_context = SimpleNamespace()
+    scheduler.start(paused=True)
+    try:
+        feeds = [FeedConfig(name="A", url="http://example.com/a/rss")]
+        schedule_feed_jobs(scheduler, feeds)
+        first = scheduler.get_job(get_feed_job_id("A")).next_run_time
+
+        schedule_feed_jobs(scheduler, feeds)
+        assert scheduler.get_job(get_feed_job_id("A")).next_run_time == first
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_prune_stale_feed_jobs():
+    scheduler = AsyncIOScheduler()
+    scheduler.app_context = SimpleNamespace()
+    scheduler.start(paused=True)
+    try:
+        schedule_feed_jobs(scheduler, [
+            FeedConfig(name="A", url="http://example.com/a/rss"),
+            FeedConfig(name="B", url="http://example.com/b/rss"),
+        ])
+
+        removed = prune_stale_feed_jobs(scheduler, [
+            FeedConfig(name="A", url="http://example.com/a/rss"),
+        ])
+
+        assert removed == 1
+        assert [job.id for job in scheduler.get_jobs()] == [get_feed_job_id("A")]
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_schedule_cron_job_reuses_parsed_triggers():
+    scheduler = AsyncIOScheduler()
+    scheduler.start(paused=True)
+    try:
+        schedule_cron_job(
+            scheduler, run_feed_job, "0 */6 * * *", ["A"], job_id="a", timezone="UTC"
+        )
+        schedule_cron_job(
+            scheduler, run_feed_job, " 0  */6 * * * ", ["B"], job_id="b", timezone="UTC"
+        )
+
+        assert scheduler.get_job("a").trigger is scheduler.get_job("b").trigger
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+@pytest.mark.parametrize(
+    "shortcut, crontab",
+    [
+        ("@hourly", "0 * * * *"),
+        ("@daily", "0 0 * * *"),
+        ("@weekly", "0 0 * * sun"),
+        ("@monthly", "0 0 1 * *"),
+        ("@yearly", "0 0 1 1 *"),
+        ("*/5 * * * *", "*/5 * * * *"),
+    ],
+)
+def test_cron_shortcuts_match_crontab(shortcut, crontab):
+    from datetime import datetime, timezone
+
+    from apscheduler.triggers.cron import CronTrigger
+
+    from monitor.scheduler import _build_cron_trigger
+
+    now = datetime(2024, 3, 14, 15, 9, 26, tzinfo=timezone.utc)
+    fast = _build_cron_trigger(shortcut, "UTC")
+    parsed = CronTrigger.from_crontab(crontab, timezone="UTC")
+
+    assert fast.get_next_fire_time(None, now) == parsed.get_next_fire_time(None, now)
+
+
+@pytest.mark.asyncio
+async def test_schedule_feed_jobs_pauses_running_scheduler_once():
+    from unittest.mock import patch
+
+    from apscheduler.schedulers.base import STATE_RUNNING
+
+    scheduler = AsyncIOScheduler()
+    scheduler.app_context = SimpleNamespace()
+    scheduler.start()
+    try:
+        feeds = [FeedConfig(name=name, url=f"http://example.com/{name}/rss") for name in "ABC"]
+        with patch.object(scheduler, "wakeup", wraps=scheduler.wakeup) as wakeup:
+            schedule_feed_jobs(scheduler, feeds)
+
+        assert wakeup.call_count == 1
+        assert scheduler.state == STATE_RUNNING
+        assert len(scheduler.get_jobs()) == 3
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_schedule_feed_jobs_requires_app_context():
+    scheduler = AsyncIOScheduler()
+
+    schedule_feed_jobs(scheduler, [FeedConfig(name="A", url="http://example.com/a/rss")])
+
+    assert scheduler.get_jobs() == []
+
+
+@pytest.mark.asyncio
+async def test_run_feed_job_dispatches_to_process_feed(monkeypatch):
+    import monitor.scheduler as scheduler_module
+
+    calls = []
+
+    async def _fake_process_feed(app_context, feed_name):
+        calls.append((app_context, feed_name))
+
+    app_context = SimpleNamespace()
+    monkeypatch.setattr(scheduler_module, "_app_context", app_context)
+    monkeypatch.setattr(scheduler_module, "_process_feed", _fake_process_feed)
+
+    await run_feed_job("A")
+
+    assert calls == [(app_context, "A")]
+
+
+@pytest.mark.asyncio
+async def test_generated_job_ids_are_unique():
+    from monitor.scheduler import schedule_one_time_job
+
+    scheduler = AsyncIOScheduler()
+    scheduler.start(paused=True)
+    try:
+        ids = {
+            schedule_one_time_job(scheduler, run_feed_job, args=["A"], delay_seconds=60)
+            for _ in range(3)
+        }
+        assert len(ids) == 3
+        assert len(scheduler.get_jobs()) == 3
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def test_generated_job_ids_differ_across_processes(monkeypatch):
+    import itertools
+
+    from monitor import scheduler as scheduler_module
+
+    first = scheduler_module._make_job_id("cron", run_feed_job)
+    # A restarted process starts its counter from scratch with a new token
+    monkeypatch.setattr(scheduler_module, "_job_id_token", "restart0")
+    monkeypatch.setattr(scheduler_module, "_job_sequence", itertools.count())
+    second = scheduler_module._make_job_id("cron", run_feed_job)
+
+    assert second == "cron_run_feed_job_restart0_0"
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_get_all_jobs_tracks_rescheduled_triggers():
+    from monitor.scheduler import get_all_jobs, reschedule_job
+
+    scheduler = AsyncIOScheduler()
+    scheduler.app_context = SimpleNamespace()
+    scheduler.start(paused=True)
+    try:
+        schedule_feed_jobs(scheduler, [FeedConfig(name="A", url="http://example.com/a/rss")])
+        job_id = get_feed_job_id("A")
+
+        [job] = get_all_jobs(scheduler)
+        assert job["function"] == "run_feed_job"
+        assert get_all_jobs(scheduler) == [job]
+
+        reschedule_job(scheduler, job_id, "interval", minutes=5)
+        assert get_all_jobs(scheduler)[0]["trigger"] == "interval[0:05:00]"
+    finally:
+        scheduler.shutdown(wait=False)
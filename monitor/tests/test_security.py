@@ -1,7 +1,31 @@
-import bleach
+import threading
+
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from monitor.feeds import base
+from monitor.feeds.base import (
+    MAX_SUMMARY_LENGTH,
+    SUMMARY_CLEANER,
+    _sanitize_summary,
+    parse_feed_entries,
+    parse_feed_entries_sync,
+)
+
 
-from monitor.feeds.base import parse_feed_entries
+@pytest.fixture
+def sanitize_calls(monkeypatch):
+    """Record ``(html, thread_id)`` for every call to ``_sanitize_summary``."""
+    calls = []
+    sanitize = base._sanitize_summary
+
+    def _recording_sanitize(html):
+        calls.append((html, threading.get_ident()))
+        return sanitize(html)
+
+    monkeypatch.setattr(base, "_sanitize_summary", _recording_sanitize)
+    return calls
 
 
 @pytest.mark.asyncio
@@ -16,13 +40,13 @@ async def test_xss_sanitization():
     posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
 
     assert len(posts) == 1
-    # Script tag should be removed
+    # Script tag and its body should be removed
     assert "<script>" not in posts[0].summary
-    assert "alert('XSS')" in posts[0].summary or "alert" in posts[0].summary # bleach might keep content but strip tags
+    assert "alert" not in posts[0].summary
 
-    # Verify bleach behavior explicitly
-    cleaned = bleach.clean("This is a <script>alert('XSS')</script> test.", tags=[], strip=True)
-    assert cleaned == "This is a alert('XSS') test."
+    # Verify nh3 behavior explicitly
+    cleaned = SUMMARY_CLEANER.clean("This is a <script>alert('XSS')</script> test.")
+    assert cleaned == "This is a  test."
 
 @pytest.mark.asyncio
 async def test_large_payload_handling():
@@ -39,3 +63,206 @@ async def test_large_payload_handling():
     assert len(posts) == 1
     # Summary should be truncated (default limit is 500 chars in parse_feed_entries)
     assert len(posts[0].summary) <= 500
+
+
+@pytest.mark.asyncio
+async def test_large_markup_payload_is_truncated_before_sanitizing(sanitize_calls):
+    entries = [{
+        "title": "Large Post",
+        "link": "http://example.com/large",
+        "summary": "<p>" + "word " * 20000 + "</p>",
+    }]
+
+    posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    sizes = [len(html) for html, _ in sanitize_calls]
+    assert sizes == [base.MAX_SUMMARY_LENGTH * base.SUMMARY_RAW_HEADROOM]
+    assert len(posts[0].summary) == base.MAX_SUMMARY_LENGTH
+    assert posts[0].summary.endswith("...")
+
+
+@pytest.mark.asyncio
+async def test_plain_text_summary_skips_sanitizer(sanitize_calls):
+    entries = [
+        {"title": "Plain", "link": "http://example.com/plain", "summary": "AT&amp;T ships 5G"},
+        {"title": "Markup", "link": "http://example.com/markup", "summary": "<b>bold</b> claim"},
+    ]
+
+    posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert [p.summary for p in posts] == ["AT&amp;T ships 5G", "bold claim"]
+    assert [html for html, _ in sanitize_calls] == ["<b>bold</b> claim"]
+
+
+@pytest.mark.asyncio
+async def test_hard_limit_rejection():
+    from structlog.testing import capture_logs
+
+    entries = [{
+        "title": "Huge Post",
+        "link": "http://example.com/huge",
+        "summary": "A" * (2 << 20),
+    }]
+
+    with capture_logs() as logs:
+        posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert len(posts[0].summary) <= 500
+    warnings = [log for log in logs if log["log_level"] == "warning"]
+    assert warnings and warnings[0]["length"] == 2 << 20
+
+
+@pytest.mark.asyncio
+async def test_entries_are_sanitized_off_the_event_loop(sanitize_calls):
+    entries = [
+        {"title": f"Post {i}", "link": f"http://example.com/{i}", "summary": f"<i>{i}</i>"}
+        for i in range(3)
+    ]
+
+    posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert [p.summary for p in posts] == ["0", "1", "2"]
+    threads = {thread for _, thread in sanitize_calls}
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        ("a <script type='x'>alert(1)</script><STYLE>p{}</STYLE>b", "a b"),
+        ("<p>one <!-- <b>hidden</b> --> two</p>", "one  two"),
+        ("<scr<script>ipt>alert(1)</script>", "ipt&gt;alert(1)"),
+        ("cut off <a href='x", "cut off "),
+        ("1 < 2", "1 &lt; 2"),
+        ("a & b <b>x</b> &gt; &quot;y&quot;&nbsp;z", 'a &amp; b x &gt; "y"&nbsp;z'),
+        ("<p>Intro</p><style>.a{color:red}", "Intro"),
+        ("<p>Intro</p><script>alert(1)", "Intro"),
+        ("<p>Intro</p><!-- hidden", "Intro"),
+        ('<a title="1 > 0">Read</a> more', "Read more"),
+        ("a < b and c > d", "a &lt; b and c &gt; d"),
+        ("It's <b>\"quoted\"</b>", "It's \"quoted\""),
+        ("<template>hidden</template>shown", "shown"),
+        ("<table><tr><td>a</td></tr>b</table>", "ba"),
+        ("&copy</b>;", "\u00a9;"),
+        ("one\r<br>\ntwo", "one\n\ntwo"),
+    ],
+)
+def test_sanitize_summary_regex_path_and_fallback(html, expected):
+    result = _sanitize_summary(html)
+
+    assert result == expected == SUMMARY_CLEANER.clean(html)
+    assert "<" not in result
+
+
+@pytest.mark.parametrize(
+    "summary, expected",
+    [
+        ('<a title="1 > 0">Read</a> more', "Read more"),
+        ("a < b and c > d", "a &lt; b and c &gt; d"),
+    ],
+)
+def test_summary_text_matches_html_parser(summary, expected):
+    entries = [{"title": "Post", "link": "http://example.com/post", "summary": summary}]
+
+    posts = parse_feed_entries_sync(entries, "Test Feed", "http://example.com/feed")
+
+    assert posts[0].summary == expected
+
+
+@pytest.mark.asyncio
+async def test_block_cut_by_truncation_is_dropped():
+    entries = [{
+        "title": "Styled Post",
+        "link": "http://example.com/styled",
+        # Never closed, so truncation cuts the block open
+        "summary": "<p>Intro text</p><style>" + ".a{color:red}" * 300 + "<p>Body</p>",
+    }]
+
+    posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert posts[0].summary == "Intro text"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "block",
+    [
+        "<style>" + "p{color:red}" * 200 + "</style>",
+        "<SCRIPT type='module'>" + "f();" * 600 + "</script >",
+        "<!--" + " padding " * 300 + "-->",
+    ],
+    ids=["style", "script", "comment"],
+)
+async def test_large_leading_block_does_not_hide_summary(block):
+    entries = [{
+        "title": "Styled Post",
+        "link": "http://example.com/styled",
+        "summary": block + "<p>Actual summary text</p>",
+    }]
+
+    posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert posts[0].summary == "Actual summary text"
+
+
+@pytest.mark.asyncio
+async def test_bytes_summary_is_decoded_and_sanitized():
+    entries = [{
+        "title": "Bytes Post",
+        "link": "http://example.com/bytes",
+        "summary": b"caf\xc3\xa9 <script>alert(1)</script>\xff",
+    }]
+
+    posts = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert posts[0].summary == "caf\u00e9 \ufffd"
+
+
+def _has_script(data: bytes) -> bool:
+    # bytes.find is a memchr/memmem scan, cheap enough to run on every example
+    return data.lower().find(b"<script") != -1
+
+
+_MARKUP_FRAGMENTS = st.sampled_from(
+    ["<script>", "</script>", "<style>", "<!--", "-->", "<", ">", "<b>", "&amp;", "<scr"]
+)
+_PARITY_FRAGMENTS = st.sampled_from([
+    "<script>", "</script>", "<style>", "<!--", "-->", "<", ">", "</", "<!", "<b>", "</b>",
+    "<p>", "<br/>", "<a href=x>", "<a title=", "</a>", "<template>", "<textarea>", "<pre>",
+    "<table>", "<td>", '"', "'", "&", "&amp;", "&copy", ";", "&nbsp;", "\r", "\n", "\x00",
+])
+
+
+@settings(max_examples=200, deadline=None)
+@given(st.lists(st.one_of(st.text(), _MARKUP_FRAGMENTS), max_size=30).map("".join))
+def test_sanitized_summary_invariants(summary):
+    entries = [{"title": "Fuzz", "link": "http://example.com/fuzz", "summary": summary}]
+
+    posts = parse_feed_entries_sync(entries, "Test Feed", "http://example.com/feed")
+
+    result = posts[0].summary or ""
+    assert len(result) <= MAX_SUMMARY_LENGTH
+    assert not _has_script(result.encode())
+    assert "<" not in result
+
+
+@settings(max_examples=500, deadline=None)
+@given(st.lists(st.one_of(st.text(max_size=5), _PARITY_FRAGMENTS), max_size=20).map("".join))
+def test_sanitize_summary_matches_nh3(summary):
+    assert _sanitize_summary.__wrapped__(summary) == SUMMARY_CLEANER.clean(summary)
+
+
+@pytest.mark.asyncio
+async def test_sanitizer_cache_hit():
+    _sanitize_summary.cache_clear()
+    entries = [{
+        "title": "Cached Post",
+        "link": "http://example.com/cached",
+        "summary": "<p>Read more on our blog.</p>",
+    }]
+
+    first = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+    second = await parse_feed_entries(entries, "Test Feed", "http://example.com/feed")
+
+    assert first[0].summary == second[0].summary == "Read more on our blog."
+    assert _sanitize_summary.cache_info().hits >= 1
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from monitor.config import VectorDBConfig
+from monitor.models import EmbeddingRecord
+from monitor.vectordb import BaseVectorDBClient, InMemoryVectorDBClient
+
+
+def _record(i, text, image=None):
+    return EmbeddingRecord(
+        id=f"post-{i}",
+        url=f"https://example.com/{i}",
+        title=f"Post {i}",
+        text_embedding=text,
+        image_embedding=image,
+    )
+
+
+def _expected(metric, query, vector):
+    if metric == "cosine":
+        return BaseVectorDBClient.cosine_similarity(query, vector)
+    if metric == "euclidean":
+        return 1.0 / (1.0 + BaseVectorDBClient.euclidean_distance(query, vector))
+    return BaseVectorDBClient.dot_product(query, vector)
+
+
+@pytest.fixture
+def records():
+    rng = np.random.default_rng(7)
+    return [
+        _record(
+            i,
+            rng.standard_normal(8).tolist(),
+            rng.standard_normal(4).tolist() if i % 2 else None,
+        )
+        for i in range(20)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot"])
+async def test_search_by_text_matches_pairwise_scores(metric, records):
+    client = InMemoryVectorDBClient(VectorDBConfig(distance_metric=metric))
+    await client.upsert_batch(records)
+    query = records[3].text_embedding.tolist()
+
+    results = await client.search_by_text(query, limit=5, min_score=-1e9)
+
+    expected = sorted(
+        ((r.id, _expected(metric, query, r.get_text_vector())) for r in records),
+        key=lambda x: x[1],
+        reverse=True,
+    )[:5]
+    assert [r.id for r, _ in results] == [rid for rid, _ in expected]
+    assert [s for _, s in results] == pytest.approx([s for _, s in expected], rel=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_search_hybrid_scores_missing_images_as_zero(records):
+    client = InMemoryVectorDBClient(VectorDBConfig(distance_metric="cosine"))
+    await client.upsert_batch(records)
+    text_query = records[0].text_embedding.tolist()
+    image_query = records[1].image_embedding.tolist()
+
+    results = await client.search_hybrid(
+        text_query,
+        image_query,
+        text_weight=0.7,
+        image_weight=0.3,
+        limit=len(records),
+        min_score=-1e9,
+    )
+
+    scores = {r.id: s for r, s in results}
+    for record in records:
+        image_score = (
+            _expected("cosine", image_query, record.get_image_vector())
+            if record.image_embedding is not None
+            else 0.0
+        )
+        text_score = _expected("cosine", text_query, record.get_text_vector())
+        assert scores[record.id] == pytest.approx(0.7 * text_score + 0.3 * image_score, rel=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_search_reflects_writes(records):
+    client = InMemoryVectorDBClient(VectorDBConfig(distance_metric="cosine"))
+    await client.upsert_batch(records[:2])
+    query = records[5].text_embedding.tolist()
+    assert records[5].id not in [r.id for r, _ in await client.search_by_text(query)]
+
+    await client.upsert(records[5])
+    assert (await client.search_by_text(query, limit=1))[0][0].id == records[5].id
+
+    await client.delete(records[5].id)
+    assert records[5].id not in [r.id for r, _ in await client.search_by_text(query)]
+
+    await client.clear()
+    assert await client.search_by_text(query) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, 1, 3, 50])
+async def test_search_limit_and_min_score(limit, records):
+    client = InMemoryVectorDBClient(VectorDBConfig(distance_metric="cosine"))
+    await client.upsert_batch(records)
+    query = records[0].text_embedding.tolist()
+
+    everything = await client.search_by_text(query, limit=len(records), min_score=-1.0)
+    results = await client.search_by_text(query, limit=limit, min_score=0.0)
+
+    positive = [(r.id, s) for r, s in everything if s >= 0.0]
+    assert [(r.id, s) for r, s in results] == positive[:limit]
+    assert [s for _, s in everything] == sorted((s for _, s in everything), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_cosine_index_stores_unit_rows(records):
+    client = InMemoryVectorDBClient(VectorDBConfig(distance_metric="cosine"))
+    await client.upsert_batch(records + [_record(99, [0.0] * 8)])
+
+    query = records[0].text_embedding.tolist()
+    results = await client.search_by_text(query, limit=30, min_score=-1.0)
+
+    _, matrix = client._vector_index("text")
+    assert np.linalg.norm(matrix[:-1], axis=1) == pytest.approx(np.ones(len(records)), rel=1e-6)
+    assert {r.id: s for r, s in results}["post-99"] == 0.0
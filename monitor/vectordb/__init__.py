@@ -357,6 +357,8 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
         super().__init__(config)
         self.records: Dict[str, EmbeddingRecord] = {}
         self.distance_metric = config.distance_metric
+        # Stacked embedding matrices for search, rebuilt lazily after writes
+        self._indexes: Dict[str, Tuple[Any, ...]] = {}
 
     async def initialize(self) -> None:
         """Initialize the in-memory vector database."""
@@ -377,6 +379,7 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
         """
         try:
             self.records[record.id] = record
+            self._indexes.clear()
             return True
         except Exception as e:
             logger.error(
@@ -399,6 +402,7 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
         try:
             for record in records:
                 self.records[record.id] = record
+            self._indexes.clear()
             return True
         except Exception as e:
             logger.error(
@@ -432,9 +436,132 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
         """
         if id in self.records:
             del self.records[id]
+            self._indexes.clear()
             return True
         return False
 
+    def _vector_index(self, kind: str) -> Tuple[List[EmbeddingRecord], np.ndarray]:
+        """
+        Records with a text or image embedding, stacked into one float32 matrix.
+
+        Args:
+            kind: "text" or "image"
+
+        Returns:
+            Tuple[List[EmbeddingRecord], np.ndarray]: Records and their (N, d)
+            embedding matrix
+        """
+        if kind not in self._indexes:
+            if kind == "text":
+                records = [r for r in self.records.values() if r.text_embedding is not None]
+                vectors: List[Any] = [r.get_text_vector() for r in records]
+            else:
+                records = [r for r in self.records.values() if r.image_embedding is not None]
+                vectors = [r.get_image_vector() for r in records]
+            self._indexes[kind] = (records, self._index_matrix(vectors))
+        return self._indexes[kind]
+
+    def _hybrid_image_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Image embeddings of the text-indexed records that also have one.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Positions of those records in the
+            text index and their image matrix
+        """
+        if "hybrid_image" not in self._indexes:
+            records = self._vector_index("text")[0]
+            positions = np.array(
+                [i for i, r in enumerate(records) if r.image_embedding is not None],
+                dtype=np.intp,
+            )
+            matrix = self._index_matrix([records[i].get_image_vector() for i in positions])
+            self._indexes["hybrid_image"] = (positions, matrix)
+        return self._indexes["hybrid_image"]
+
+    def _index_matrix(self, vectors: List[Any]) -> np.ndarray:
+        """
+        Stack embedding vectors into a contiguous (N, d) float32 matrix.
+
+        For cosine, rows are scaled to unit length once here, so each query
+        costs one matrix-vector product and no per-record norms.
+
+        Args:
+            vectors: Embedding vectors of equal dimension
+
+        Returns:
+            np.ndarray: The stacked matrix
+        """
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        if len({len(v) for v in vectors}) > 1:
+            raise ValueError("Vector dimensions do not match")
+        matrix = np.array(np.stack(vectors), dtype=np.float32, order="C")
+        if self.distance_metric == "cosine":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            # Zero vectors stay zero and score 0.0
+            np.divide(matrix, norms, out=matrix, where=norms != 0)
+        return matrix
+
+    def _scores(self, matrix: np.ndarray, query: List[float]) -> np.ndarray:
+        """
+        Similarity of every matrix row to the query in one vectorized pass.
+
+        Args:
+            matrix: (N, d) embedding matrix from _index_matrix
+            query: Query embedding
+
+        Returns:
+            np.ndarray: One score per row, higher is more similar
+        """
+        if len(matrix) == 0:
+            return np.empty(0, dtype=np.float32)
+        q = np.asarray(query, dtype=np.float32)
+        if matrix.shape[1] != len(q):
+            raise ValueError("Vector dimensions do not match")
+        if self.distance_metric == "cosine":
+            q_norm = np.linalg.norm(q)
+            if q_norm == 0:
+                return np.zeros(len(matrix), dtype=np.float32)
+            scores: np.ndarray = matrix @ (q / q_norm)
+            return scores
+        elif self.distance_metric == "euclidean":
+            # Convert distance to similarity score (1.0 / (1.0 + distance))
+            return 1.0 / (1.0 + np.linalg.norm(matrix - q, axis=1))
+        elif self.distance_metric == "dot":
+            return matrix @ q
+        return np.zeros(len(matrix), dtype=np.float32)
+
+    @staticmethod
+    def _rank(
+        records: List[EmbeddingRecord],
+        scores: np.ndarray,
+        limit: int,
+        min_score: float,
+    ) -> List[Tuple[EmbeddingRecord, float]]:
+        """
+        The best-scoring records at or above min_score, best first.
+
+        np.argpartition picks the top `limit` candidates in linear time, so only
+        those few are sorted and converted to Python floats.
+
+        Args:
+            records: Records, one per score
+            scores: Similarity scores
+            limit: Maximum number of results
+            min_score: Minimum similarity score
+
+        Returns:
+            List[Tuple[EmbeddingRecord, float]]: List of records and scores
+        """
+        if limit <= 0:
+            return []
+        candidates = np.nonzero(scores >= min_score)[0]
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        top = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(records[i], float(scores[i])) for i in top]
+
     async def search_by_text(
         self,
         text_embedding: List[float],
@@ -452,30 +579,8 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
         Returns:
             List[Tuple[EmbeddingRecord, float]]: List of records and scores
         """
-        results = []
-
-        for record in self.records.values():
-            if not record.text_embedding:
-                continue
-
-            # Calculate similarity score
-            score = 0.0
-            if self.distance_metric == "cosine":
-                score = self.cosine_similarity(text_embedding, record.text_embedding)
-            elif self.distance_metric == "euclidean":
-                # Convert distance to similarity score (1.0 / (1.0 + distance))
-                distance = self.euclidean_distance(text_embedding, record.text_embedding)
-                score = 1.0 / (1.0 + distance)
-            elif self.distance_metric == "dot":
-                score = self.dot_product(text_embedding, record.text_embedding)
-
-            # Add to results if score is above threshold
-            if score >= min_score:
-                results.append((record, score))
-
-        # Sort by score (descending) and limit results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        records, matrix = self._vector_index("text")
+        return self._rank(records, self._scores(matrix, text_embedding), limit, min_score)
 
     async def search_by_image(
         self,
@@ -494,30 +599,8 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
         Returns:
             List[Tuple[EmbeddingRecord, float]]: List of records and scores
         """
-        results = []
-
-        for record in self.records.values():
-            if not record.image_embedding:
-                continue
-
-            # Calculate similarity score
-            score = 0.0
-            if self.distance_metric == "cosine":
-                score = self.cosine_similarity(image_embedding, record.image_embedding)
-            elif self.distance_metric == "euclidean":
-                # Convert distance to similarity score (1.0 / (1.0 + distance))
-                distance = self.euclidean_distance(image_embedding, record.image_embedding)
-                score = 1.0 / (1.0 + distance)
-            elif self.distance_metric == "dot":
-                score = self.dot_product(image_embedding, record.image_embedding)
-
-            # Add to results if score is above threshold
-            if score >= min_score:
-                results.append((record, score))
-
-        # Sort by score (descending) and limit results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        records, matrix = self._vector_index("image")
+        return self._rank(records, self._scores(matrix, image_embedding), limit, min_score)
 
     async def search_hybrid(
         self,
@@ -543,46 +626,20 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
             List[Tuple[EmbeddingRecord, float]]: List of records and scores
         """
         # If no image embedding, just do text search
-        if not image_embedding:
+        if image_embedding is None or len(image_embedding) == 0:
             return await self.search_by_text(text_embedding, limit, min_score)
 
-        results = []
-
-        for record in self.records.values():
-            if not record.text_embedding:
-                continue
-
-            # Calculate text similarity score
-            text_score = 0.0
-            if self.distance_metric == "cosine":
-                text_score = self.cosine_similarity(text_embedding, record.text_embedding)
-            elif self.distance_metric == "euclidean":
-                distance = self.euclidean_distance(text_embedding, record.text_embedding)
-                text_score = 1.0 / (1.0 + distance)
-            elif self.distance_metric == "dot":
-                text_score = self.dot_product(text_embedding, record.text_embedding)
-
-            # Calculate image similarity score if available
-            image_score = 0.0
-            if record.image_embedding and image_embedding:
-                if self.distance_metric == "cosine":
-                    image_score = self.cosine_similarity(image_embedding, record.image_embedding)
-                elif self.distance_metric == "euclidean":
-                    distance = self.euclidean_distance(image_embedding, record.image_embedding)
-                    image_score = 1.0 / (1.0 + distance)
-                elif self.distance_metric == "dot":
-                    image_score = self.dot_product(image_embedding, record.image_embedding)
-
-            # Calculate combined score
-            combined_score = (text_score * text_weight) + (image_score * image_weight)
-
-            # Add to results if score is above threshold
-            if combined_score >= min_score:
-                results.append((record, combined_score))
-
-        # Sort by score (descending) and limit results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:limit]
+        records, text_matrix = self._vector_index("text")
+        image_positions, image_matrix = self._hybrid_image_index()
+
+        text_scores = self._scores(text_matrix, text_embedding)
+        # Records without an image embedding score 0.0 for the image part
+        image_scores = np.zeros_like(text_scores)
+        image_scores[image_positions] = self._scores(image_matrix, image_embedding)
+
+        # Calculate combined score
+        combined = (text_scores * text_weight) + (image_scores * image_weight)
+        return self._rank(records, combined, limit, min_score)
 
     async def count(self) -> int:
         """
@@ -601,6 +658,7 @@ class InMemoryVectorDBClient(BaseVectorDBClient):
             bool: True if successful, False otherwise
         """
         self.records.clear()
+        self._indexes.clear()
         return True
 
 
@@ -9,7 +9,7 @@ unified PostgreSQL storage with the cache client.
 """
 import json
 import re
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 import asyncpg
 import structlog
@@ -23,6 +23,19 @@ from monitor.vectordb import BaseVectorDBClient
 logger = structlog.get_logger()
 
 
+def _row_to_record(row: Any) -> EmbeddingRecord:
+    """Rebuild an embedding record from one of our own table rows."""
+    return EmbeddingRecord.from_trusted({
+        "id": row["id"],
+        "url": row["url"],
+        "title": row["title"],
+        "publish_date": row["publish_date"],
+        "text_embedding": row["text_embedding"],
+        "image_embedding": row["image_embedding"],
+        "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+    })
+
+
 class PgVectorDBClient(BaseVectorDBClient):
     """
     PostgreSQL with pgvector extension database client.
@@ -158,9 +171,10 @@ class PgVectorDBClient(BaseVectorDBClient):
                     "word_count": metadata.get("word_count", 0),
                 })
 
-                # Convert embeddings to PostgreSQL vector format
-                text_vec = record.text_embedding if record.text_embedding else None
-                image_vec = record.image_embedding if record.image_embedding else None
+                # float32 arrays are encoded directly by the pgvector codec;
+                # pgvector has no int8 vector type, so dequantize if needed
+                text_vec = record.get_text_vector()
+                image_vec = record.get_image_vector()
 
                 # Upsert the record
                 await conn.execute(f"""
@@ -234,8 +248,8 @@ class PgVectorDBClient(BaseVectorDBClient):
                         metadata.get("source", "Unknown"),
                         metadata.get("author"),
                         record.publish_date,
-                        record.text_embedding,
-                        record.image_embedding,
+                        record.get_text_vector(),
+                        record.get_image_vector(),
                         json.dumps(metadata)
                     ))
 
@@ -291,18 +305,7 @@ class PgVectorDBClient(BaseVectorDBClient):
                 """, id)
 
                 if row:
-                    metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                    text_emb = row["text_embedding"]
-                    image_emb = row["image_embedding"]
-                    return EmbeddingRecord(
-                        id=row["id"],
-                        url=row["url"],
-                        title=row["title"],
-                        publish_date=row["publish_date"],
-                        text_embedding=text_emb.tolist() if text_emb is not None else None,
-                        image_embedding=image_emb.tolist() if image_emb is not None else None,
-                        metadata=metadata
-                    )
+                    return _row_to_record(row)
                 return None
 
         except Exception as e:
@@ -377,18 +380,7 @@ class PgVectorDBClient(BaseVectorDBClient):
 
                 results = []
                 for row in rows:
-                    metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                    text_emb = row["text_embedding"]
-                    image_emb = row["image_embedding"]
-                    record = EmbeddingRecord(
-                        id=row["id"],
-                        url=row["url"],
-                        title=row["title"],
-                        publish_date=row["publish_date"],
-                        text_embedding=text_emb.tolist() if text_emb is not None else None,
-                        image_embedding=image_emb.tolist() if image_emb is not None else None,
-                        metadata=metadata
-                    )
+                    record = _row_to_record(row)
                     results.append((record, row["score"]))
 
                 return results
@@ -432,18 +424,7 @@ class PgVectorDBClient(BaseVectorDBClient):
 
                 results = []
                 for row in rows:
-                    metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                    text_emb = row["text_embedding"]
-                    image_emb = row["image_embedding"]
-                    record = EmbeddingRecord(
-                        id=row["id"],
-                        url=row["url"],
-                        title=row["title"],
-                        publish_date=row["publish_date"],
-                        text_embedding=text_emb.tolist() if text_emb is not None else None,
-                        image_embedding=image_emb.tolist() if image_emb is not None else None,
-                        metadata=metadata
-                    )
+                    record = _row_to_record(row)
                     results.append((record, row["score"]))
 
                 return results
@@ -478,7 +459,7 @@ class PgVectorDBClient(BaseVectorDBClient):
         Returns:
             List[Tuple[EmbeddingRecord, float]]: List of records and scores
         """
-        if not image_embedding:
+        if image_embedding is None or len(image_embedding) == 0:
             return await self.search_by_text(text_embedding, limit, min_score)
 
         try:
@@ -500,18 +481,7 @@ class PgVectorDBClient(BaseVectorDBClient):
                 results = []
                 for row in rows:
                     if row["score"] >= min_score:
-                        metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                        text_emb = row["text_embedding"]
-                        image_emb = row["image_embedding"]
-                        record = EmbeddingRecord(
-                            id=row["id"],
-                            url=row["url"],
-                            title=row["title"],
-                            publish_date=row["publish_date"],
-                            text_embedding=text_emb.tolist() if text_emb is not None else None,
-                            image_embedding=image_emb.tolist() if image_emb is not None else None,
-                            metadata=metadata
-                        )
+                        record = _row_to_record(row)
                         results.append((record, row["score"]))
 
                 return results
@@ -564,21 +534,9 @@ class PgVectorDBClient(BaseVectorDBClient):
 
                 records = []
                 for row in rows:
-                    metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                    metadata["source"] = row["source"]
-                    metadata["author"] = row["author"]
-                    text_emb = row["text_embedding"]
-                    image_emb = row["image_embedding"]
-
-                    record = EmbeddingRecord(
-                        id=row["id"],
-                        url=row["url"],
-                        title=row["title"],
-                        publish_date=row["publish_date"],
-                        text_embedding=text_emb.tolist() if text_emb is not None else None,
-                        image_embedding=image_emb.tolist() if image_emb is not None else None,
-                        metadata=metadata
-                    )
+                    record = _row_to_record(row)
+                    record.metadata["source"] = row["source"]
+                    record.metadata["author"] = row["author"]
                     records.append(record)
 
                 return records